@@ -345,7 +345,10 @@ class BotRunner:
 
         # ── Position manager ──────────────────────────────────────────
         storage_path = Path.home() / ".polymarket_bot" / "positions.json"
-        self.position_manager = PositionManager(storage_path=str(storage_path))
+        self.position_manager = PositionManager(
+            storage_path=str(storage_path),
+            save_interval_seconds=settings.positions_save_interval_seconds,
+        )
 
         if settings.trading_mode == "paper" and settings.paper_reset_on_start:
             log.info("🧹 Paper-mode clean start: resetting positions & wallet …")
@@ -375,6 +378,7 @@ class BotRunner:
             position_manager=self.position_manager,
             scanner=self.scanner,
             check_interval=60.0,
+            stagger=settings.resolution_check_stagger,
         )
         log.info("✅ Resolution monitor initialized")
 
@@ -409,6 +413,7 @@ class BotRunner:
         )
         self.orch_config = orch_config
         self.orchestrator = StrategyOrchestrator(settings, orch_config)
+        self.orchestrator.on_market_event = self.resolution_monitor.notify_market_event
         self.executor = UnifiedExecutor(self.client, settings, position_manager=self.position_manager)
 
         # ── Paper/live wallet ─────────────────────────────────────────
@@ -425,6 +430,7 @@ class BotRunner:
                 default_starting_balance=settings.paper_start_balance,
                 default_tier_spec=settings.paper_sizing_tiers,
                 refresh_seconds=settings.paper_wallet_refresh_seconds,
+                expected_tick_seconds=settings.scan_interval,
             )
             if settings.trading_mode == "paper" and settings.paper_reset_on_start:
                 wallet_path.parent.mkdir(parents=True, exist_ok=True)
@@ -539,7 +545,9 @@ class BotRunner:
         return self.settings
 
     def _check_resolutions(self, loop_start: float) -> None:
-        if loop_start - self._last_resolution_check < 60:
+        # A staggered monitor schedules each market itself, so call it every tick.
+        periodic = self.resolution_monitor.stagger or loop_start - self._last_resolution_check >= 60
+        if not periodic and not self.resolution_monitor.has_pending_hints:
             return
         resolution_events = self.resolution_monitor.check_resolutions()
         if resolution_events:
@@ -548,7 +556,8 @@ class BotRunner:
                 for _pid in ev.affected_positions:
                     if ev.condition_id:
                         self.orchestrator.mark_position_closed(ev.condition_id)
-        self._last_resolution_check = loop_start
+        if periodic:
+            self._last_resolution_check = loop_start
 
     def _check_and_close_positions(self, loop_start: float) -> None:
         if loop_start - self._last_position_close_check < self.settings.exit_check_interval_seconds:
@@ -576,6 +585,8 @@ class BotRunner:
         }
 
         close_results = self.position_closer.check_and_close_positions(price_data)
+        # Revalue whatever is still open for the dashboard / portfolio stats.
+        self.position_manager.update_unrealized_pnl(price_data)
         if close_results:
             successful_closes = [r for r in close_results if r.success]
             if successful_closes:
@@ -602,8 +613,7 @@ class BotRunner:
         available_collateral_value: _Decimal | None = None
 
         if self.settings.trading_mode == "paper":
-            self.paper_wallet.refresh()
-            snap = self.paper_wallet.snapshot(portfolio_stats=portfolio)
+            snap = self.paper_wallet.snapshot(portfolio_stats=portfolio, auto_refresh=True)
             self.paper_wallet.maybe_log_tier_change(snap)
             sizing_equity = snap.equity
             realized_pnl = _Decimal(str(portfolio.get("total_realized_pnl", 0)))
@@ -734,7 +744,8 @@ class BotRunner:
             self._last_stats_time = now
 
     def shutdown(self) -> None:
-        """Print final stats."""
+        """Persist positions and print final stats."""
+        self.position_manager.close()
         uptime = time.time() - self.start_time
         print_stats(
             self.orchestrator,
@@ -744,6 +755,10 @@ class BotRunner:
             uptime,
             paper_wallet_snapshot=self.last_wallet_snapshot,
         )
+        self.scanner.close()
+        self.orchestrator.scanner.close()
+        if self.paper_wallet is not None:
+            self.paper_wallet.close()
         log.info("Bot stopped. Stay profitable! 🚀")
 
 
@@ -105,6 +105,10 @@ class Settings:
     stop_loss_pct: Decimal = Decimal("3")             # Close at 3% loss
     max_position_age_hours: float = 24.0              # Close after 24 hours
     exit_check_interval_seconds: float = 15.0         # How often to check exits
+    close_fill_poll_delays: tuple[float, ...] = (0.05, 0.15, 0.4)  # Live close fill-check backoff
+    close_fill_poll_jitter_seconds: float = 0.05      # Random extra delay per fill check
+    positions_save_interval_seconds: float = 1.0      # Coalesce position writes (0 = every change)
+    resolution_check_stagger: bool = False            # Spread resolution checks across the interval
 
     # Order book depth
     min_book_depth_usdc: Decimal = Decimal("10")     # Min liquidity to trade
@@ -175,6 +179,11 @@ def load_settings(env_file: str | None = None) -> Settings:
             return default
         return val.strip().lower() in {"1", "true", "yes"}
 
+    def parse_float_list(val: str | None, default: tuple[float, ...]) -> tuple[float, ...]:
+        if val is None or not val.strip():
+            return default
+        return tuple(float(part) for part in val.split(",") if part.strip())
+
     def parse_opt_int(val: str | None) -> int | None:
         if val is None:
             return None
@@ -259,6 +268,12 @@ def load_settings(env_file: str | None = None) -> Settings:
         stop_loss_pct=Decimal(os.getenv("STOP_LOSS_PCT", "3")),
         max_position_age_hours=float(os.getenv("MAX_POSITION_AGE_HOURS", "24.0")),
         exit_check_interval_seconds=float(os.getenv("EXIT_CHECK_INTERVAL_SECONDS", "15.0")),
+        close_fill_poll_delays=parse_float_list(
+            os.getenv("CLOSE_FILL_POLL_DELAYS"), (0.05, 0.15, 0.4)
+        ),
+        close_fill_poll_jitter_seconds=float(os.getenv("CLOSE_FILL_POLL_JITTER_SECONDS", "0.05")),
+        positions_save_interval_seconds=float(os.getenv("POSITIONS_SAVE_INTERVAL_SECONDS", "1.0")),
+        resolution_check_stagger=parse_bool(os.getenv("RESOLUTION_CHECK_STAGGER"), False),
 
         # Order book depth
         min_book_depth_usdc=Decimal(os.getenv("MIN_BOOK_DEPTH_USDC", "10")),
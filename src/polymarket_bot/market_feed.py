@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Any
+from typing import Any, Callable
 
 from polymarket_bot.wss import MarketWssClient
 
@@ -18,9 +18,13 @@ log = logging.getLogger(__name__)
 class EnhancedMarketFeed:
     """Enhanced market data feed with better bid/ask tracking."""
 
-    def __init__(self, asset_ids: list[str]):
+    def __init__(
+        self,
+        asset_ids: list[str],
+        on_event: Callable[[Any], None] | None = None,
+    ):
         self.asset_ids = asset_ids
-        self.wss = MarketWssClient(asset_ids=asset_ids)
+        self.wss = MarketWssClient(asset_ids=asset_ids, on_event=on_event)
         
         # Enhanced data structures
         self.best_bid: dict[str, float] = {}
@@ -9,7 +9,7 @@ import logging
 import time
 from dataclasses import dataclass, replace
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable
 
 from polymarket_bot.config import Settings
 from polymarket_bot.market_feed import EnhancedMarketFeed
@@ -86,6 +86,9 @@ class StrategyOrchestrator:
         # start or doesn't have data yet, we fall back to Gamma prices.
         self._feed: EnhancedMarketFeed | None = None
         self._feed_started = False
+        # Optional callback for raw market-channel events (e.g. resolution
+        # notifications); must be set before the feed starts.
+        self.on_market_event: Callable[[Any], None] | None = None
         
         # State tracking
         self.active_positions: list[str] = []  # Track active condition_ids (duplicates = stacked entries)
@@ -413,7 +416,7 @@ class StrategyOrchestrator:
                 return
 
             try:
-                self._feed = EnhancedMarketFeed(asset_ids=token_ids)
+                self._feed = EnhancedMarketFeed(asset_ids=token_ids, on_event=self.on_market_event)
                 self._feed.start()
                 self._feed_started = True
                 log.info("✅ Top-of-book feed started (assets=%d)", len(token_ids))
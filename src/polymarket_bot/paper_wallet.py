@@ -9,14 +9,21 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 log = logging.getLogger(__name__)
 
+# os.preadv is POSIX-only; on Windows we fall back to Path.read_bytes() (which
+# also avoids holding a handle that would block editors replacing the file).
+_HAS_PREADV = hasattr(os, "preadv")
+
 
 @dataclass(frozen=True)
 class PaperWalletSnapshot:
@@ -53,6 +60,7 @@ class PaperWalletController:
         default_starting_balance: Decimal,
         default_tier_spec: str,
         refresh_seconds: float = 5.0,
+        expected_tick_seconds: float = 1.0,
     ) -> None:
         self.file_path = file_path
         self.default_starting_balance = default_starting_balance
@@ -61,6 +69,15 @@ class PaperWalletController:
 
         self._last_refresh_ts = 0.0
         self._last_mtime: float | None = None
+        self._fd: int | None = None
+        # Reused read buffer, grown only when the wallet file gets bigger.
+        self._buf = bytearray()
+        self._fd_ino: int | None = None
+
+        # snapshot(auto_refresh=True) reloads every N ticks instead of reading
+        # the clock on each call.
+        self._refresh_every = max(1, int(refresh_seconds / max(expected_tick_seconds, 1e-9)))
+        self._ticks_since_refresh = 0
 
         self.starting_balance: Decimal = default_starting_balance
         self.manual_adjustment: Decimal = Decimal("0")
@@ -96,7 +113,10 @@ class PaperWalletController:
         if not force and (now - self._last_refresh_ts) < self.refresh_seconds:
             return
         self._last_refresh_ts = now
+        self._reload(force=force)
 
+    def _reload(self, *, force: bool = False) -> None:
+        """Re-read the wallet file when its mtime advanced (or when forced)."""
         if not self.file_path.exists():
             return
 
@@ -106,7 +126,7 @@ class PaperWalletController:
             if not force and self._last_mtime is not None and mtime <= self._last_mtime:
                 return
 
-            raw = json.loads(self.file_path.read_text(encoding="utf-8"))
+            raw = orjson.loads(self._read_file(stat))
             self._last_mtime = mtime
 
             self.starting_balance = Decimal(str(raw.get("starting_balance", self.default_starting_balance)))
@@ -129,12 +149,63 @@ class PaperWalletController:
         except Exception as e:
             log.warning("Failed to refresh paper wallet config %s: %s", self.file_path, e)
 
+    def _read_file(self, stat: os.stat_result) -> bytes | memoryview:
+        """Read the wallet file through a cached descriptor and buffer.
+
+        The descriptor is reopened when the file is replaced (inode change),
+        so editors that write-and-rename are picked up as well. The returned
+        view into the shared buffer is only valid until the next read.
+        """
+        if not _HAS_PREADV:
+            return self.file_path.read_bytes()
+
+        if self._fd is None or self._fd_ino != stat.st_ino:
+            self.close()
+            self._fd = os.open(self.file_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+            self._fd_ino = stat.st_ino
+
+        if len(self._buf) < stat.st_size:
+            self._buf = bytearray(stat.st_size)
+        view = memoryview(self._buf)[:stat.st_size]
+        try:
+            n = os.preadv(self._fd, [view], 0)
+        except OSError:
+            self.close()
+            raise
+        return view[:n]
+
+    def close(self) -> None:
+        """Release the cached file descriptor, if any."""
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+            self._fd_ino = None
+
     # ------------------------------------------------------------------
     # Equity / sizing
     # ------------------------------------------------------------------
 
-    def snapshot(self, *, portfolio_stats: dict[str, Any]) -> PaperWalletSnapshot:
-        """Compute current paper equity and sizing multiplier."""
+    def snapshot(
+        self,
+        *,
+        portfolio_stats: dict[str, Any],
+        auto_refresh: bool = False,
+    ) -> PaperWalletSnapshot:
+        """Compute current paper equity and sizing multiplier.
+
+        With ``auto_refresh=True`` the runtime file is reloaded every
+        ``refresh_seconds / expected_tick_seconds`` calls, replacing the
+        usual ``refresh()`` + ``snapshot()`` pair on each tick.
+        """
+        if auto_refresh:
+            self._ticks_since_refresh += 1
+            if self._ticks_since_refresh >= self._refresh_every:
+                self._ticks_since_refresh = 0
+                self._reload()
+
         realized = Decimal(str(portfolio_stats.get("total_realized_pnl", 0)))
         unrealized = Decimal(str(portfolio_stats.get("total_unrealized_pnl", 0)))
 
@@ -2,17 +2,37 @@
 Polymarket API Client
 Handles interaction with Polymarket's CLOB API
 """
+import asyncio
+import functools
 import logging
+import random
 import re
+import threading
 import time
 import concurrent.futures
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
 from decimal import Decimal, ROUND_DOWN
 from typing import List, Dict, Optional, Any
+from urllib.parse import quote
 
-import requests
 import httpx
+import orjson
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, MarketOrderArgs, OrderType
+from py_clob_client.clob_types import (
+    AssetType,
+    BalanceAllowanceParams,
+    MarketOrderArgs,
+    OrderArgs,
+    OrderType,
+    RequestArgs,
+    TradeParams,
+)
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.endpoints import TRADES
+from py_clob_client.exceptions import PolyApiException, PolyException
+from py_clob_client.headers.headers import create_level_2_headers
+from py_clob_client.http_helpers.helpers import get as clob_get, overloadHeaders
 
 # Backwards-compatible Config import: try the legacy bare `config` module first
 # (used by archive/mirror_trading), then fall back to the new package path.
@@ -30,6 +50,140 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Rate-limit backoff ladder (1 -> 2 -> 4 -> 8 -> 16s, capped at 32s) with jitter.
+_BACKOFF_STATUSES = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_MAX_ATTEMPTS = 5
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 32.0
+# "429" as a standalone number in an error message, not part of a price or id.
+_RATE_LIMIT_MSG_RE = re.compile(r"(?<![\w.])429(?![\w.])")
+
+# L2 auth headers are HMAC(timestamp, method, path); within this bucket the
+# same headers are reused (pagination already reuses one set across pages).
+_L2_HEADER_TTL_SECONDS = 5
+
+# Taker-trade pages keyed by (address, cursor); re-polls within the TTL reuse them.
+_TRADE_PAGE_CACHE_TTL_SECONDS = 3.0
+_TRADE_PAGE_CACHE_MAXSIZE = 256
+
+# get_market_info results, LRU-bounded; the bot looks up markets continuously.
+_MARKET_CACHE_MAXSIZE = 2048
+
+# Workers for time-boxed CLOB trade fetches. At least get_user_trades_bulk's
+# fan-out, so bulk CLOB fallbacks never queue behind each other.
+_CLOB_FETCH_WORKERS = 8
+
+# Maker amount (USD) precision for marketable BUY orders.
+_TWO_PLACES = Decimal("0.01")
+
+
+@functools.lru_cache(maxsize=1024)
+def _to_decimal(value: float) -> Decimal:
+    """Decimal from a float via its shortest repr (Decimal.from_float would keep binary noise)."""
+    return Decimal(str(value))
+
+
+# Exact CLOB error strings -> structured order error names (O(1) dispatch before
+# falling back to substring matching in _classify_order_error).
+_ORDER_ERROR_CODES = {
+    "insufficient_funds_or_approval": "insufficient_funds_or_approval",
+    "not enough balance / allowance": "insufficient_funds_or_approval",
+    "insufficient funds": "insufficient_funds_or_approval",
+}
+
+# Cloudflare block page detection / Ray ID extraction.
+_CF_BLOCK_RE = re.compile(r"Cloudflare|Sorry, you have been blocked")
+_CF_RAY_MARKER = "Cloudflare Ray ID:"
+# 256-entry lookup table: _HEX_LUT[byte] is 1 for ASCII hex digits, else 0.
+_HEX_LUT = bytes(1 if chr(i) in "0123456789abcdefABCDEF" else 0 for i in range(256))
+
+
+def _take_hex(text: str, limit: int = 32) -> str:
+    """Return the leading run of hex characters in ``text`` (at most ``limit``)."""
+    # latin-1 with "replace" keeps one byte per char; non-latin chars become "?".
+    end = 0
+    for byte in text[:limit].encode("latin-1", "replace"):
+        if not _HEX_LUT[byte]:
+            break
+        end += 1
+    return text[:end]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP-date form is ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Jittered exponential delay for ``attempt`` (0-based), floored at Retry-After."""
+    delay = min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * (2 ** attempt))
+    delay *= random.uniform(0.5, 1.0)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, _BACKOFF_MAX_SECONDS))
+    return delay
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """httpx transport with a declarative retry policy, modelled on urllib3's Retry.
+
+    Retries idempotent requests whose status is in ``status_forcelist`` with
+    jittered exponential backoff, using Retry-After as the minimum delay when
+    ``respect_retry_after_header`` is set.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        total: int = _BACKOFF_MAX_ATTEMPTS,
+        status_forcelist: frozenset = _BACKOFF_STATUSES,
+        allowed_methods: frozenset = frozenset({"GET"}),
+        respect_retry_after_header: bool = True,
+    ) -> None:
+        self._transport = transport
+        self.total = total
+        self.status_forcelist = status_forcelist
+        self.allowed_methods = allowed_methods
+        self.respect_retry_after_header = respect_retry_after_header
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._transport.handle_request(request)
+            if (
+                request.method not in self.allowed_methods
+                or response.status_code not in self.status_forcelist
+                or attempt >= self.total - 1
+            ):
+                return response
+
+            retry_after = (
+                _parse_retry_after(response.headers.get("Retry-After"))
+                if self.respect_retry_after_header
+                else None
+            )
+            response.close()
+            delay = _backoff_delay(attempt, retry_after)
+            logger.warning(
+                "%s %s returned %s; backing off %.1fs (attempt %d/%d)",
+                request.method,
+                request.url.host,
+                response.status_code,
+                delay,
+                attempt + 1,
+                self.total,
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
 
 class PolymarketClient:
     """Client for interacting with Polymarket API"""
@@ -47,12 +201,55 @@ class PolymarketClient:
         """
         self.api_url = Config.POLYMARKET_API_URL
         self.has_valid_creds = False
-        # Circuit breaker for Cloudflare blocks (403 HTML).
-        self._blocked_until_ts = 0.0
+        # key -> (last emitted monotonic ts, suppressed count); see _log_throttled().
+        self._last_log: dict[str, tuple[float, int]] = {}
+        # Circuit breaker for Cloudflare blocks (403 HTML), scoped per endpoint
+        # ("post_order", "get_trades", "data_api") on the monotonic clock.
+        self._blocked_until: dict[str, float] = {}
         self._last_block_reason = None
 
+        # condition_id -> (fetched_at, market). Market metadata is effectively static.
+        self._market_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._market_cache_lock = threading.Lock()
+        self._market_cache_ttl = float(getattr(Config, "MARKET_CACHE_TTL_SECONDS", 300.0))
+        # address -> (monotonic fetch ts, open orders); lets intra-tick callers share one fetch.
+        self._open_orders_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self._open_orders_ttl = float(getattr(Config, "OPEN_ORDERS_CACHE_TTL_SECONDS", 0.5))
+        # API creds object that last got a 401 from get_orders; skip the call until it changes.
+        self._open_orders_auth_failed_creds: Any = None
+
+        # Single-slot cache: (signer_address, request_path, time bucket) -> L2 headers.
+        self._l2_headers_key: Optional[tuple[str, str, int]] = None
+        self._l2_headers: dict[str, str] = {}
+
+        # (address, cursor) -> (monotonic fetched_at, page response); LRU-bounded.
+        self._trade_page_cache: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._trade_page_lock = threading.Lock()
+
         # Ensure py-clob-client uses sane HTTP timeouts (prevents indefinite hangs).
         self._configure_clob_http_client_timeouts()
+
+        # Shared HTTP/2 client for the Data API: keep-alive plus multiplexing, so
+        # concurrent polls for many wallets share a handful of sockets.
+        # Status retries (429/5xx, honoring Retry-After) live in the transport.
+        self._data_httpx = httpx.Client(
+            transport=_RetryTransport(
+                httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+                    retries=2,  # connect errors
+                ),
+            ),
+            timeout=httpx.Timeout(15.0, connect=10.0),
+            headers={"Accept": "application/json"},
+        )
+
+        # Persistent pool for time-boxed CLOB trade fetches (see get_user_trades_best_effort).
+        self._clob_fetch_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_CLOB_FETCH_WORKERS, thread_name_prefix="clob-fetch"
+        )
         
         if private_key:
             # Polymarket uses a signer (EOA) that may control a funded proxy wallet.
@@ -104,18 +301,20 @@ class PolymarketClient:
                 logger.info("Successfully initialized Polymarket client with API credentials")
                 logger.info("   You can now execute trades on Polymarket")
             except Exception as e:
-                logger.error("=" * 60)
-                logger.error("CRITICAL: Failed to create API credentials")
-                logger.error(f"   Error: {e}")
-                logger.error("")
-                logger.error("This bot requires valid API credentials to function.")
-                logger.error("Without credentials, you CANNOT monitor or execute trades.")
-                logger.error("")
-                logger.error("To fix this:")
-                logger.error("1. Check your MIRROR_ACCOUNT_PRIVATE_KEY in .env is correct")
-                logger.error("2. Ensure you have network connectivity to Polymarket API")
-                logger.error("3. Verify your account has API access enabled")
-                logger.error("=" * 60)
+                self._log_throttled(
+                    "api_creds",
+                    logging.ERROR,
+                    "%s\nCRITICAL: Failed to create API credentials\n   Error: %s\n\n"
+                    "This bot requires valid API credentials to function.\n"
+                    "Without credentials, you CANNOT monitor or execute trades.\n\n"
+                    "To fix this:\n"
+                    "1. Check your MIRROR_ACCOUNT_PRIVATE_KEY in .env is correct\n"
+                    "2. Ensure you have network connectivity to Polymarket API\n"
+                    "3. Verify your account has API access enabled\n%s",
+                    "=" * 60,
+                    e,
+                    "=" * 60,
+                )
                 self.has_valid_creds = False
         else:
             # Initialize read-only client - but note this WON'T work for trade monitoring
@@ -124,6 +323,14 @@ class PolymarketClient:
             logger.warning("Initialized client without private key")
             logger.warning("   Trade monitoring will NOT work without authentication")
 
+    def close(self) -> None:
+        """Release pooled HTTP connections held by this client."""
+        try:
+            self._data_httpx.close()
+        except Exception:
+            pass
+        self._clob_fetch_executor.shutdown(wait=False)
+
     @staticmethod
     def _configure_clob_http_client_timeouts() -> None:
         """Patch py-clob-client's module-level httpx client to include timeouts.
@@ -143,6 +350,73 @@ class PolymarketClient:
             # If patching fails, continue with py-clob-client defaults.
             pass
     
+    def _log_throttled(
+        self,
+        key: str,
+        level: int,
+        msg: str,
+        *args: Any,
+        min_interval: float = 30.0,
+    ) -> None:
+        """Log ``msg`` at most once per ``min_interval`` seconds per ``key``.
+
+        Suppressed repeats are counted and reported with the next emitted line.
+        """
+        now = time.monotonic()
+        last_ts, suppressed = self._last_log.get(key, (float("-inf"), 0))
+        if now - last_ts < min_interval:
+            self._last_log[key] = (last_ts, suppressed + 1)
+            return
+        self._last_log[key] = (now, 0)
+        if suppressed:
+            msg = f"{msg} (suppressed {suppressed} similar in last {min_interval:.0f}s)"
+        logger.log(level, msg, *args)
+
+    def _is_blocked(self, endpoint: str) -> bool:
+        """True while ``endpoint`` is cooling down after a Cloudflare block."""
+        until = self._blocked_until.get(endpoint)
+        return until is not None and time.monotonic() < until
+
+    def _trip(self, endpoint: str, seconds: float) -> None:
+        """Open the circuit for ``endpoint`` for ``seconds``."""
+        self._blocked_until[endpoint] = time.monotonic() + seconds
+
+    @staticmethod
+    def _is_cloudflare_block(msg: str) -> bool:
+        return "403" in msg and _CF_BLOCK_RE.search(msg) is not None
+
+    @staticmethod
+    def _cloudflare_cooldown_seconds() -> int:
+        return max(60, int(getattr(Config, "CLOUDFLARE_BLOCK_COOLDOWN_SECONDS", 600)))
+
+    def _post_order_with_backoff(self, signed_order: Any, order_type_enum: Any) -> Any:
+        """post_order() that retries when the CLOB rate-limits us (HTTP 429)."""
+        attempt = 0
+        while True:
+            try:
+                posted = self.client.post_order(signed_order, orderType=order_type_enum)
+                self.invalidate_open_orders()
+                return posted
+            except Exception as e:
+                # Trust the status code when there is one; only status-less
+                # errors fall back to looking for 429 in the message.
+                status_code = getattr(e, "status_code", None)
+                if status_code is not None:
+                    is_rate_limited = status_code == 429
+                else:
+                    is_rate_limited = _RATE_LIMIT_MSG_RE.search(str(e)) is not None
+                if not is_rate_limited or attempt >= _BACKOFF_MAX_ATTEMPTS - 1:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(
+                    "Order post rate-limited (429); retrying in %.1fs (attempt %d/%d)",
+                    delay,
+                    attempt + 1,
+                    _BACKOFF_MAX_ATTEMPTS,
+                )
+                time.sleep(delay)
+                attempt += 1
+
     def get_user_trades(self, address: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get recent trades for a user
@@ -159,12 +433,11 @@ class PolymarketClient:
         Returns:
             List of trade dictionaries (deduplicated by trade ID)
         """
+        if self._is_blocked("get_trades"):
+            logger.debug("Skipping CLOB trade fetch: endpoint cooling down after Cloudflare block")
+            return []
+
         try:
-            from py_clob_client.clob_types import TradeParams
-            from py_clob_client.http_helpers.helpers import get
-            from py_clob_client.endpoints import TRADES
-            from py_clob_client.constants import END_CURSOR
-            
             # Check if we have valid API credentials
             if not hasattr(self.client, 'creds') or self.client.creds is None:
                 logger.error(
@@ -177,10 +450,8 @@ class PolymarketClient:
                 )
                 return []
             
-            all_trades = []
-            seen_trade_ids = set()
+            trades_by_id: dict[str, dict[str, Any]] = {}
             maker_trade_count = 0
-            taker_trade_count = 0
             
             # Fetch trades where user was the MAKER
             logger.debug(f"Fetching maker trades for {address[:10]}...")
@@ -197,20 +468,24 @@ class PolymarketClient:
                 if maker_trades:
                     for trade in maker_trades:
                         trade_id = trade.get("id") or trade.get("order_id")
-                        if trade_id and trade_id not in seen_trade_ids:
-                            seen_trade_ids.add(trade_id)
-                            all_trades.append(trade)
-                            maker_trade_count += 1
+                        if trade_id and trade_id not in trades_by_id:
+                            trades_by_id[trade_id] = trade
+                    maker_trade_count = len(trades_by_id)
                     logger.debug(f"Found {maker_trade_count} unique maker trades")
             except Exception as e:
-                logger.error(f"Error fetching maker trades: {e}")
+                self._log_throttled(
+                    "maker_trades", logging.ERROR, "Error fetching maker trades: %s", e
+                )
                 # Check if it's an authentication error
-                if "401" in str(e) or "authentication" in str(e).lower() or "credentials" in str(e).lower():
-                    logger.error(
+                err = str(e).lower()
+                if "401" in err or "authentication" in err or "credentials" in err:
+                    self._log_throttled(
+                        "maker_trades_auth",
+                        logging.ERROR,
                         "Authentication failed. Please verify:\n"
                         "1. Your MIRROR_ACCOUNT_PRIVATE_KEY is correct in .env\n"
                         "2. You have network connectivity to Polymarket API\n"
-                        "3. Your account has proper API access enabled"
+                        "3. Your account has proper API access enabled",
                     )
                     return []
             
@@ -221,61 +496,226 @@ class PolymarketClient:
             try:
                 # Build URL manually with taker parameter
                 # We need to handle authentication for Level 2 endpoints
-                from py_clob_client.headers.headers import create_level_2_headers
-                from py_clob_client.clob_types import RequestArgs
-                
                 # Verify we have a signer as well
                 if not hasattr(self.client, 'signer') or self.client.signer is None:
                     logger.warning("No signer available, skipping taker trades")
-                    logger.debug(f"Retrieved total {len(all_trades)} unique trades ({maker_trade_count} maker, 0 taker) for {address[:10]}...")
-                    return all_trades
+                    logger.debug(
+                        "Retrieved total %d unique trades (%d maker, 0 taker) for %s...",
+                        len(trades_by_id), maker_trade_count, address[:10],
+                    )
+                    return list(trades_by_id.values())
                 
                 # Create headers for authenticated request
-                request_args = RequestArgs(method="GET", request_path=TRADES)
-                headers = create_level_2_headers(self.client.signer, self.client.creds, request_args)
+                headers = self._level_2_headers(TRADES)
                 
                 # Fetch all pages of taker trades
-                # Starting cursor for pagination (base64 encoded '0')
-                next_cursor = "MA=="
-                max_pages = 100  # Safety limit to prevent infinite loops
-                page_count = 0
-                
-                while next_cursor != END_CURSOR and page_count < max_pages:
-                    url = f"{self.api_url}{TRADES}?taker={address}&next_cursor={next_cursor}"
-                    response = get(url, headers=headers)
-                    next_cursor = response.get("next_cursor", END_CURSOR)
-                    page_count += 1
-                    
-                    taker_trades = response.get("data", [])
-                    if taker_trades:
-                        for trade in taker_trades:
-                            trade_id = trade.get("id") or trade.get("order_id")
-                            if trade_id and trade_id not in seen_trade_ids:
-                                seen_trade_ids.add(trade_id)
-                                all_trades.append(trade)
-                                taker_trade_count += 1
-                
-                if page_count >= max_pages:
-                    logger.warning(f"Reached pagination limit ({max_pages} pages) for taker trades")
+                trades_by_id.update(
+                    (trade_id, trade)
+                    for trade in self._iter_taker_trades(address, headers)
+                    if (trade_id := trade.get("id") or trade.get("order_id"))
+                    and trade_id not in trades_by_id
+                )
                 
+                taker_trade_count = len(trades_by_id) - maker_trade_count
                 logger.debug(f"Found {taker_trade_count} unique taker trades")
                 
             except Exception as e:
                 error_msg = str(e)
-                if "401" in error_msg or "authentication" in error_msg.lower():
-                    logger.error(f"Authentication failed when fetching taker trades: {e}")
-                    logger.error("Your API credentials may be invalid or expired")
+                if self._is_cloudflare_block(error_msg):
+                    self._trip("get_trades", self._cloudflare_cooldown_seconds())
+                    self._log_throttled(
+                        "taker_trades_cloudflare",
+                        logging.ERROR,
+                        "Taker trade fetch blocked by Cloudflare (HTTP 403); "
+                        "cooling down trade fetches",
+                    )
+                elif "401" in error_msg or "authentication" in error_msg.lower():
+                    self._log_throttled(
+                        "taker_trades_auth",
+                        logging.ERROR,
+                        "Authentication failed when fetching taker trades: %s\n"
+                        "Your API credentials may be invalid or expired",
+                        e,
+                    )
                 else:
-                    logger.warning(f"Could not fetch taker trades (may not be critical): {e}")
+                    self._log_throttled(
+                        "taker_trades",
+                        logging.WARNING,
+                        "Could not fetch taker trades (may not be critical): %s",
+                        e,
+                    )
                 # Continue with just maker trades if taker fetch fails
             
-            logger.debug(f"Retrieved total {len(all_trades)} unique trades ({maker_trade_count} maker, {taker_trade_count} taker) for {address[:10]}...")
-            return all_trades
+            taker_trade_count = len(trades_by_id) - maker_trade_count
+            logger.debug(
+                "Retrieved total %d unique trades (%d maker, %d taker) for %s...",
+                len(trades_by_id), maker_trade_count, taker_trade_count, address[:10],
+            )
+            return list(trades_by_id.values())
             
         except Exception as e:
             logger.error(f"Error fetching trades for {address}: {e}")
             return []
 
+    async def get_user_trades_async(
+        self,
+        address: str,
+        limit: int = 100,
+        http: Optional[httpx.AsyncClient] = None,
+    ) -> list[dict[str, Any]]:
+        """Async variant of get_user_trades().
+
+        The maker fetch (py-clob-client, synchronous) runs on a worker thread while
+        taker pages stream over an HTTP/2 AsyncClient; both legs run concurrently.
+        Pass ``http`` to share one AsyncClient when fanning out over many wallets.
+
+        Returns:
+            List of trade dictionaries (deduplicated by trade ID)
+        """
+        if self._is_blocked("get_trades"):
+            logger.debug("Skipping CLOB trade fetch: endpoint cooling down after Cloudflare block")
+            return []
+        if getattr(self.client, "creds", None) is None:
+            logger.error(
+                "Cannot fetch trades: API credentials are not set up. "
+                "Please ensure your POLY_PRIVATE_KEY is correctly configured in .env"
+            )
+            return []
+
+        async def _maker() -> list[dict[str, Any]]:
+            trades = await asyncio.to_thread(
+                self.client.get_trades, TradeParams(maker_address=address)
+            )
+            if isinstance(trades, dict) and "data" in trades:
+                trades = trades["data"]
+            return list(trades or [])
+
+        async def _taker(client: httpx.AsyncClient) -> list[dict[str, Any]]:
+            if getattr(self.client, "signer", None) is None:
+                logger.warning("No signer available, skipping taker trades")
+                return []
+            headers = self._level_2_headers(TRADES)
+            return [t async for t in self._aiter_taker_trades(client, address, headers)]
+
+        client = http or httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(
+                float(getattr(Config, "CLOB_HTTP_TIMEOUT_SECONDS", 20.0)),
+                connect=float(getattr(Config, "CLOB_CONNECT_TIMEOUT_SECONDS", 10.0)),
+            ),
+        )
+        try:
+            maker_res, taker_res = await asyncio.gather(
+                _maker(), _taker(client), return_exceptions=True
+            )
+        finally:
+            if http is None:
+                await client.aclose()
+
+        trades_by_id: dict[str, dict[str, Any]] = {}
+        for side, res in (("maker", maker_res), ("taker", taker_res)):
+            if isinstance(res, BaseException):
+                error_msg = str(res)
+                if side == "taker" and self._is_cloudflare_block(error_msg):
+                    self._trip("get_trades", self._cloudflare_cooldown_seconds())
+                logger.warning(f"Could not fetch {side} trades for {address[:10]}...: {res}")
+                continue
+            for trade in res:
+                trade_id = trade.get("id") or trade.get("order_id")
+                if trade_id and trade_id not in trades_by_id:
+                    trades_by_id[trade_id] = trade
+
+        logger.debug(f"Retrieved total {len(trades_by_id)} unique trades for {address[:10]}...")
+        return list(trades_by_id.values())
+
+    def _level_2_headers(self, request_path: str) -> dict[str, str]:
+        """Return L2 auth headers for a GET on ``request_path``, reused for a few seconds."""
+        signer = self.client.signer
+        key = (signer.address(), request_path, int(time.time() // _L2_HEADER_TTL_SECONDS))
+        if key != self._l2_headers_key:
+            request_args = RequestArgs(method="GET", request_path=request_path)
+            self._l2_headers = create_level_2_headers(signer, self.client.creds, request_args)
+            self._l2_headers_key = key
+        # py-clob-client mutates the headers dict it is given; hand out a copy.
+        return dict(self._l2_headers)
+
+    def _get_cached_trade_page(self, address: str, cursor: str) -> Optional[dict[str, Any]]:
+        key = (address, cursor)
+        with self._trade_page_lock:
+            entry = self._trade_page_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= _TRADE_PAGE_CACHE_TTL_SECONDS:
+                del self._trade_page_cache[key]
+                return None
+            self._trade_page_cache.move_to_end(key)
+            return entry[1]
+
+    def _put_trade_page(self, address: str, cursor: str, page: Any) -> None:
+        if not isinstance(page, dict):
+            return
+        key = (address, cursor)
+        with self._trade_page_lock:
+            self._trade_page_cache[key] = (time.monotonic(), page)
+            self._trade_page_cache.move_to_end(key)
+            while len(self._trade_page_cache) > _TRADE_PAGE_CACHE_MAXSIZE:
+                self._trade_page_cache.popitem(last=False)
+
+    def _iter_taker_trades(
+        self,
+        address: str,
+        headers: dict[str, Any],
+        max_pages: int = 100,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield taker-side trades for ``address`` page by page (CLOB /data/trades)."""
+        # Only the cursor changes between pages (base64, so '+', '/' and '=' are escaped).
+        base_url = f"{self.api_url}{TRADES}?taker={quote(address, safe='')}&next_cursor="
+        # Starting cursor for pagination (base64 encoded '0')
+        next_cursor = "MA=="
+        page_count = 0
+        # max_pages is a safety limit to prevent infinite loops
+        while next_cursor != END_CURSOR and page_count < max_pages:
+            response = self._get_cached_trade_page(address, next_cursor)
+            if response is None:
+                response = clob_get(base_url + quote(next_cursor, safe=""), headers=headers)
+                self._put_trade_page(address, next_cursor, response)
+            next_cursor = response.get("next_cursor", END_CURSOR)
+            page_count += 1
+            yield from response.get("data") or []
+
+        if page_count >= max_pages:
+            logger.warning(f"Reached pagination limit ({max_pages} pages) for taker trades")
+
+    async def _aiter_taker_trades(
+        self,
+        http: httpx.AsyncClient,
+        address: str,
+        headers: dict[str, Any],
+        max_pages: int = 100,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async counterpart of _iter_taker_trades() over a caller-supplied AsyncClient."""
+        base_url = f"{self.api_url}{TRADES}?taker={quote(address, safe='')}&next_cursor="
+        next_cursor = "MA=="
+        page_count = 0
+        while next_cursor != END_CURSOR and page_count < max_pages:
+            response = self._get_cached_trade_page(address, next_cursor)
+            if response is None:
+                resp = await http.get(
+                    base_url + quote(next_cursor, safe=""),
+                    headers=overloadHeaders("GET", dict(headers)),
+                )
+                if resp.status_code != 200:
+                    raise PolyApiException(resp)
+                response = orjson.loads(resp.content)
+                self._put_trade_page(address, next_cursor, response)
+            next_cursor = response.get("next_cursor", END_CURSOR)
+            page_count += 1
+            for trade in response.get("data") or []:
+                yield trade
+
+        if page_count >= max_pages:
+            logger.warning(f"Reached pagination limit ({max_pages} pages) for taker trades")
+
     def get_user_trades_data_api(self, address: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent trades for a user from Polymarket's unauthenticated Data API.
 
@@ -289,34 +729,51 @@ class PolymarketClient:
         Returns:
             List of normalized trade dicts.
         """
+        if self._is_blocked("data_api"):
+            logger.debug(
+                "Skipping Data API trade fetch: endpoint cooling down after Cloudflare block"
+            )
+            return []
+
         try:
             url = f"{self.DATA_API_BASE_URL}/trades"
             params = {"user": address, "limit": int(limit)}
-            resp = requests.get(url, params=params, timeout=15)
+            resp = self._data_httpx.get(url, params=params)
             resp.raise_for_status()
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
             if not isinstance(data, list):
                 logger.warning("Unexpected Data API /trades response shape")
                 return []
 
+            # Best-effort cap (Data API may return more than requested); trim
+            # before normalizing so overshoot rows are never materialized.
+            if limit and len(data) > limit:
+                data = data[:limit]
+
             # Normalize into a shape compatible with TradeMonitor.parse_trade_details()
             normalized: List[Dict[str, Any]] = []
             for t in data:
                 if not isinstance(t, dict):
                     continue
 
+                tx_hash = t.get("transactionHash") or t.get("txHash")
+                # Prefer tx hash so we can dedupe reliably
+                trade_id = tx_hash or t.get("id")
+                asset = t.get("asset") or t.get("asset_id") or t.get("token_id")
+                condition_id = t.get("conditionId") or t.get("condition_id")
+                side = t.get("side")
+
                 normalized.append(
                     {
-                        # Prefer tx hash so we can dedupe reliably
-                        "id": t.get("transactionHash") or t.get("txHash") or t.get("id"),
-                        "order_id": t.get("transactionHash") or t.get("txHash") or t.get("id"),
-                        "transactionHash": t.get("transactionHash") or t.get("txHash"),
-                        "asset_id": t.get("asset") or t.get("asset_id") or t.get("token_id"),
-                        "token_id": t.get("asset") or t.get("asset_id") or t.get("token_id"),
-                        "condition_id": t.get("conditionId") or t.get("condition_id"),
-                        "market": t.get("conditionId") or t.get("condition_id"),
-                        "side": (t.get("side") or "").upper() or None,  # CLOB requires uppercase BUY/SELL
+                        "id": trade_id,
+                        "order_id": trade_id,
+                        "transactionHash": tx_hash,
+                        "asset_id": asset,
+                        "token_id": asset,
+                        "condition_id": condition_id,
+                        "market": condition_id,
+                        "side": side.upper() if side else None,  # CLOB requires uppercase BUY/SELL
                         "price": t.get("price"),
                         "size": t.get("size"),
                         "timestamp": t.get("timestamp"),
@@ -331,13 +788,20 @@ class PolymarketClient:
                     }
                 )
 
-            # Best-effort cap (Data API may return more than requested)
-            if limit and len(normalized) > limit:
-                normalized = normalized[:limit]
-
             return normalized
         except Exception as e:
-            logger.error(f"Error fetching Data API trades for {address}: {e}")
+            response = getattr(e, "response", None)
+            if response is not None and self._is_cloudflare_block(
+                f"{response.status_code} {response.text}"
+            ):
+                self._trip("data_api", self._cloudflare_cooldown_seconds())
+            self._log_throttled(
+                f"data_api:{address}",
+                logging.ERROR,
+                "Error fetching Data API trades for %s: %s",
+                address,
+                e,
+            )
             return []
 
     def get_user_trades_best_effort(self, address: str, limit: int = 100) -> List[Dict[str, Any]]:
@@ -358,14 +822,26 @@ class PolymarketClient:
             if Config.DISABLE_CLOB_TRADE_FETCH:
                 return []
             timeout_s = float(getattr(Config, "CLOB_TRADE_FETCH_TIMEOUT_SECONDS", 8.0))
+            started = threading.Event()
+
+            def _fetch() -> list[dict[str, Any]]:
+                started.set()
+                return self.get_user_trades(address, limit)
+
+            fut = self._clob_fetch_executor.submit(_fetch)
+            # The fetch timeout runs from when the fetch starts, not from when
+            # it was queued; a pool that stays busy is reported separately.
+            if not started.wait(timeout_s):
+                fut.cancel()
+                logger.warning("CLOB trade fetch pool busy; skipping")
+                return []
             try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-                    fut = ex.submit(self.get_user_trades, address, limit)
-                    trades = fut.result(timeout=timeout_s)
+                trades = fut.result(timeout=timeout_s)
                 if trades:
                     logger.debug(f"Using CLOB trades: {len(trades)}")
                 return trades
             except concurrent.futures.TimeoutError:
+                fut.cancel()
                 logger.warning("CLOB trade fetch timed out; skipping")
                 return []
             except Exception:
@@ -392,6 +868,40 @@ class PolymarketClient:
         logger.info("No trades returned from CLOB or Data API")
         return []
     
+    def get_user_trades_bulk(
+        self,
+        addresses: list[str],
+        limit: int = 100,
+        max_workers: int = _CLOB_FETCH_WORKERS,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch trades for many wallets concurrently.
+
+        Each address goes through get_user_trades_best_effort() on a thread pool;
+        the calls are IO-bound so N wallets take roughly the slowest single fetch.
+        A failure for one address yields an empty list for that address only.
+        ``max_workers`` is capped at the CLOB fetch pool size so CLOB fallbacks
+        don't wait on each other.
+        """
+        unique = list(dict.fromkeys(a for a in addresses if a))
+        results: dict[str, list[dict[str, Any]]] = {a: [] for a in unique}
+        if not unique:
+            return results
+
+        workers = max(1, min(max_workers, len(unique), _CLOB_FETCH_WORKERS))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="trades-bulk"
+        ) as ex:
+            futures = {
+                ex.submit(self.get_user_trades_best_effort, a, limit): a for a in unique
+            }
+            for fut in concurrent.futures.as_completed(futures):
+                address = futures[fut]
+                try:
+                    results[address] = fut.result() or []
+                except Exception as e:
+                    logger.warning(f"Bulk trade fetch failed for {address[:10]}...: {e}")
+        return results
+
     def get_market_info(self, condition_id: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a specific market
@@ -402,10 +912,25 @@ class PolymarketClient:
         Returns:
             Market information dictionary or None if not found
         """
+        now = time.time()
+        with self._market_cache_lock:
+            cached = self._market_cache.get(condition_id)
+            if cached is not None:
+                if (now - cached[0]) < self._market_cache_ttl:
+                    self._market_cache.move_to_end(condition_id)
+                    return cached[1]
+                del self._market_cache[condition_id]
+
         try:
             market = self.client.get_market(condition_id)
             # Some client versions/stubs type this as Any|str; at runtime it's a dict.
-            return market if isinstance(market, dict) else {"raw": market}
+            info = market if isinstance(market, dict) else {"raw": market}
+            with self._market_cache_lock:
+                self._market_cache[condition_id] = (now, info)
+                self._market_cache.move_to_end(condition_id)
+                while len(self._market_cache) > _MARKET_CACHE_MAXSIZE:
+                    self._market_cache.popitem(last=False)
+            return info
         except Exception as e:
             logger.error(f"Error fetching market {condition_id}: {e}")
             return None
@@ -431,10 +956,11 @@ class PolymarketClient:
         Returns:
             Order result dictionary or None if failed
         """
-        now = time.time()
-        if now < self._blocked_until_ts:
-            remaining = int(self._blocked_until_ts - now)
-            logger.warning(
+        if self._is_blocked("post_order"):
+            remaining = int(self._blocked_until["post_order"] - time.monotonic())
+            self._log_throttled(
+                "post_order_cooldown",
+                logging.WARNING,
                 "Order placement skipped: still in cooldown after Cloudflare block (%ss remaining).",
                 remaining,
             )
@@ -464,9 +990,9 @@ class PolymarketClient:
             # We observed 400s when sending BUY orders as share-sized limit orders in FOK/IOC.
             # For non-GTC BUY orders, use the market-order builder with amount=price*size.
             if side_u == "BUY" and order_type_enum != OrderType.GTC:
-                notional = Decimal(str(price)) * Decimal(str(size))
+                notional = _to_decimal(price) * _to_decimal(size)
                 # Maker amount (USD) => 2 decimals, round down to be safe.
-                notional = notional.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+                notional = notional.quantize(_TWO_PLACES, rounding=ROUND_DOWN)
                 amount = float(notional)
                 if amount <= 0:
                     return {
@@ -485,7 +1011,7 @@ class PolymarketClient:
                     order_type=order_type_enum,
                 )
                 signed_order = self.client.create_market_order(market_args)
-                posted = self.client.post_order(signed_order, orderType=order_type_enum)
+                posted = self._post_order_with_backoff(signed_order, order_type_enum)
 
                 result: Dict[str, Any]
                 if isinstance(posted, dict):
@@ -508,7 +1034,7 @@ class PolymarketClient:
 
             # Create (sign) then post the order with the requested type.
             signed_order = self.client.create_order(order_args)
-            posted = self.client.post_order(signed_order, orderType=order_type_enum)
+            posted = self._post_order_with_backoff(signed_order, order_type_enum)
 
             # Normalize return to a dict (some client versions return typed objects)
             result: Dict[str, Any]
@@ -526,47 +1052,48 @@ class PolymarketClient:
         except Exception as e:
             # py-clob-client raises PolyApiException and may include a Cloudflare HTML page.
             msg = str(e)
-            status_code: Optional[int] = None
-            raw_payload: Any = None
-            try:
-                status_code = getattr(e, "status_code", None)
-                raw_payload = getattr(e, "error_msg", None)
-            except Exception:
-                pass
+            status_code: Optional[int] = getattr(e, "status_code", None)
+            raw_payload: Any = getattr(e, "error_msg", None)
 
-            # If this is a PolyApiException, try to extract the underlying response payload
-            # (often a dict like {"error":"insufficient_funds_or_approval", ...}).
-            try:
-                error_payload = getattr(e, "error_msg", None)
-                if isinstance(error_payload, dict):
-                    # Prefer canonical keys
-                    for k in ["error", "message", "msg", "detail"]:
-                        if k in error_payload and isinstance(error_payload[k], str):
-                            msg = error_payload[k]
-                            break
-                    else:
-                        # Fall back to full dict rendering
-                        msg = str(error_payload)
-            except Exception:
-                pass
+            # If this is a PolyApiException with a JSON payload (often a dict like
+            # {"error":"insufficient_funds_or_approval", ...}), dispatch on its error
+            # field directly; a JSON payload can never be a Cloudflare HTML page.
+            error_code: Optional[str] = None
+            structured = isinstance(raw_payload, dict)
+            if structured:
+                # Prefer canonical keys
+                for k in ("error", "message", "msg", "detail"):
+                    v = raw_payload.get(k)
+                    if isinstance(v, str):
+                        msg = v
+                        break
+                else:
+                    # Fall back to full dict rendering
+                    msg = str(raw_payload)
+                error_code = _ORDER_ERROR_CODES.get(msg.strip().lower())
 
             if logger.isEnabledFor(logging.DEBUG) and raw_payload is not None:
                 logger.debug("CLOB API error payload: %s", raw_payload)
 
-            if "403" in msg and ("Cloudflare" in msg or "Sorry, you have been blocked" in msg):
+            if not structured and self._is_cloudflare_block(msg):
                 ray_id = self._extract_cloudflare_ray_id(msg)
-                cooldown_seconds = int(getattr(Config, "CLOUDFLARE_BLOCK_COOLDOWN_SECONDS", 600))
-                self._blocked_until_ts = time.time() + max(60, cooldown_seconds)
-                self._last_block_reason = f"Cloudflare 403 blocked (Ray ID: {ray_id})" if ray_id else "Cloudflare 403 blocked"
+                cooldown_seconds = self._cloudflare_cooldown_seconds()
+                self._trip("post_order", cooldown_seconds)
+                self._last_block_reason = "Cloudflare 403 blocked"
+                if ray_id:
+                    self._last_block_reason += f" (Ray ID: {ray_id})"
 
-                logger.error(
-                    "CLOB order rejected by Cloudflare (HTTP 403). %s. Cooling down for %ss to avoid bans.",
+                self._log_throttled(
+                    "post_order_cloudflare",
+                    logging.ERROR,
+                    "CLOB order rejected by Cloudflare (HTTP 403). %s. "
+                    "Cooling down for %ss to avoid bans.\n"
+                    "Likely causes: IP reputation (VPN/datacenter IP), too many rapid requests, "
+                    "or region/access restrictions. "
+                    "Fix: run from a residential IP, disable VPN/proxy, slow polling/execution, "
+                    "or contact Polymarket support with the Ray ID.",
                     (f"Ray ID: {ray_id}" if ray_id else "(Ray ID not found)"),
-                    int(self._blocked_until_ts - time.time()),
-                )
-                logger.error(
-                    "Likely causes: IP reputation (VPN/datacenter IP), too many rapid requests, or region/access restrictions. "
-                    "Fix: run from a residential IP, disable VPN/proxy, slow polling/execution, or contact Polymarket support with the Ray ID."
+                    cooldown_seconds,
                 )
                 return {
                     "_ok": False,
@@ -579,39 +1106,32 @@ class PolymarketClient:
             logger.error("Error placing order")
 
             # Surface structured errors for common reject reasons so callers can react.
-            lowered = msg.lower()
-            if (
-                "insufficient_funds_or_approval" in lowered
-                or "not enough balance" in lowered
-                or "insufficient funds" in lowered
-                or "allowance" in lowered
-            ):
-                return {
-                    "_ok": False,
-                    "_error": "insufficient_funds_or_approval",
-                    "_details": msg,
-                    "_status_code": status_code,
-                    "_payload": raw_payload,
-                }
-
-            # Example: "invalid amount for a marketable BUY order ($0.86), min size: $1"
-            if "invalid amount" in lowered and "min size" in lowered:
-                return {
-                    "_ok": False,
-                    "_error": "min_order_notional",
-                    "_details": msg,
-                    "_status_code": status_code,
-                    "_payload": raw_payload,
-                }
-
+            if error_code is None:
+                error_code = self._classify_order_error(msg)
             return {
                 "_ok": False,
-                "_error": "order_failed",
+                "_error": error_code,
                 "_details": msg,
                 "_status_code": status_code,
                 "_payload": raw_payload,
             }
 
+    @staticmethod
+    def _classify_order_error(msg: str) -> str:
+        """Substring fallback for order rejects that carry no known error code."""
+        lowered = msg.lower()
+        if (
+            "insufficient_funds_or_approval" in lowered
+            or "not enough balance" in lowered
+            or "insufficient funds" in lowered
+            or "allowance" in lowered
+        ):
+            return "insufficient_funds_or_approval"
+        # Example: "invalid amount for a marketable BUY order ($0.86), min size: $1"
+        if "invalid amount" in lowered and "min size" in lowered:
+            return "min_order_notional"
+        return "order_failed"
+
     def update_balance_allowance_best_effort(
         self,
         asset_type: str,
@@ -629,8 +1149,6 @@ class PolymarketClient:
         if not self.has_valid_creds:
             return None
         try:
-            from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
-
             at_name = (asset_type or "").upper()
             if at_name == "COLLATERAL":
                 at = AssetType.COLLATERAL
@@ -653,8 +1171,6 @@ class PolymarketClient:
         if not self.has_valid_creds:
             return None
         try:
-            from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
-
             at_name = (asset_type or "").upper()
             if at_name == "COLLATERAL":
                 at = AssetType.COLLATERAL
@@ -668,6 +1184,46 @@ class PolymarketClient:
             logger.warning(f"Could not fetch balance/allowance ({asset_type}): {e}")
             return None
 
+    def update_balance_allowances_bulk(
+        self,
+        requests_: list[tuple[str, Optional[str]]],
+        max_workers: int = 8,
+    ) -> list[Optional[dict[str, Any]]]:
+        """Concurrent update_balance_allowance_best_effort() over (asset_type, token_id) pairs.
+
+        Results are returned in input order.
+        """
+        return self._balance_allowance_bulk(
+            self.update_balance_allowance_best_effort, requests_, max_workers
+        )
+
+    def get_balance_allowances_bulk(
+        self,
+        requests_: list[tuple[str, Optional[str]]],
+        max_workers: int = 8,
+    ) -> list[Optional[dict[str, Any]]]:
+        """Concurrent get_balance_allowance_best_effort() over (asset_type, token_id) pairs.
+
+        Results are returned in input order.
+        """
+        return self._balance_allowance_bulk(
+            self.get_balance_allowance_best_effort, requests_, max_workers
+        )
+
+    def _balance_allowance_bulk(
+        self,
+        fn: Any,
+        requests_: list[tuple[str, Optional[str]]],
+        max_workers: int,
+    ) -> list[Optional[dict[str, Any]]]:
+        if not requests_ or not self.has_valid_creds:
+            return [None] * len(requests_)
+        workers = max(1, min(max_workers, len(requests_)))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="balance-allowance"
+        ) as ex:
+            return list(ex.map(lambda req: fn(req[0], req[1]), requests_))
+
     def get_wallet_mode(self) -> Dict[str, Any]:
         """Return the effective signer/funder/signature_type used by the underlying client."""
         out: Dict[str, Any] = {"has_valid_creds": bool(self.has_valid_creds)}
@@ -689,14 +1245,22 @@ class PolymarketClient:
     def _extract_cloudflare_ray_id(html_or_text: str) -> Optional[str]:
         """Extract Cloudflare Ray ID from a Cloudflare block HTML page."""
         # Example: Cloudflare Ray ID: <strong class="font-semibold">9bb2dcee08a91dd8</strong>
-        m = re.search(r"Cloudflare Ray ID:\s*<strong[^>]*>([0-9a-fA-F]+)</strong>", html_or_text)
-        if m:
-            return m.group(1)
-        # Fallback: sometimes appears as plain text
-        m2 = re.search(r"Cloudflare Ray ID:\s*([0-9a-fA-F]+)", html_or_text)
-        if m2:
-            return m2.group(1)
-        return None
+        # Fallback: sometimes appears as plain text ("Cloudflare Ray ID: 9bb2...").
+        text_match: Optional[str] = None
+        idx = html_or_text.find(_CF_RAY_MARKER)
+        while idx != -1:
+            start = idx + len(_CF_RAY_MARKER)
+            tail = html_or_text[start : start + 512].lstrip(" \t")
+            if tail.startswith("<strong"):
+                attrs, sep, after = tail.partition(">")
+                if sep and len(attrs) <= 207:
+                    token = _take_hex(after)
+                    if token and after.startswith("</strong>", len(token)):
+                        return token
+            elif text_match is None:
+                text_match = _take_hex(tail) or None
+            idx = html_or_text.find(_CF_RAY_MARKER, start)
+        return text_match
     
 
     
@@ -710,6 +1274,15 @@ class PolymarketClient:
         Returns:
             List of open order dictionaries
         """
+        cached = self._open_orders_cache.get(address)
+        if cached is not None and (time.monotonic() - cached[0]) < self._open_orders_ttl:
+            # Callers may filter in place; never hand out the cached list itself.
+            return list(cached[1])
+        if not self.has_valid_creds:
+            return []
+        creds = getattr(self.client, "creds", None)
+        if creds is not None and creds is self._open_orders_auth_failed_creds:
+            return []
         try:
             # NOTE: This py-clob-client version's get_orders() only supports OpenOrderParams
             # (id/market/asset_id) and does not accept maker/status filters.
@@ -720,16 +1293,38 @@ class PolymarketClient:
             if isinstance(orders, dict) and "data" in orders:
                 data = orders.get("data") or []
                 logger.debug(f"Retrieved {len(data)} open orders")
-                return data
-            if isinstance(orders, list):
+            elif isinstance(orders, list):
+                data = orders
                 logger.debug(f"Retrieved {len(orders)} open orders")
-                return orders
-
-            logger.debug("Retrieved open orders (unexpected shape)")
-            return []
-        except Exception as e:
+            else:
+                data = []
+                logger.debug("Retrieved open orders (unexpected shape)")
+            self._open_orders_cache[address] = (time.monotonic(), data)
+            return list(data)
+        except (PolyException, httpx.HTTPError) as e:
+            if getattr(e, "status_code", None) == 401:
+                # Credentials are rejected; don't hammer the API until they are replaced.
+                self._open_orders_auth_failed_creds = creds
+                self._log_throttled(
+                    "open_orders_auth",
+                    logging.ERROR,
+                    "Open orders fetch unauthorized (401); "
+                    "skipping until API credentials are refreshed",
+                )
+                return []
             logger.error(f"Error fetching open orders for {address}: {e}")
             return []
+        except Exception:
+            # Best effort: a malformed payload or client bug must not reach the trading loop.
+            logger.exception("Unexpected error fetching open orders for %s", address)
+            return []
+
+    def invalidate_open_orders(self, address: Optional[str] = None) -> None:
+        """Drop cached open orders for ``address`` (or for every address when omitted)."""
+        if address is None:
+            self._open_orders_cache.clear()
+        else:
+            self._open_orders_cache.pop(address, None)
 
     def cancel_order_best_effort(self, order_id: str) -> bool:
         """Best-effort order cancel.
@@ -744,7 +1339,53 @@ class PolymarketClient:
         try:
             # py-clob-client cancel endpoint: DELETE /order
             self.client.cancel(oid)
+            # Orders are not tracked per address, so burst every cached listing.
+            self.invalidate_open_orders()
             return True
-        except Exception as e:
+        except (PolyException, httpx.HTTPError) as e:
             logger.warning(f"Could not cancel order {oid}: {e}")
             return False
+        except Exception:
+            logger.exception("Unexpected error cancelling order %s", oid)
+            return False
+
+    def cancel_orders_best_effort(
+        self, order_ids: Iterable[str], max_workers: int = 8
+    ) -> dict[str, bool]:
+        """Best-effort cancel of many orders in a single DELETE /orders request.
+
+        Falls back to parallel single cancels if the client has no batch
+        endpoint. Returns order_id -> cancelled for each distinct non-empty id.
+        """
+        ids = list(dict.fromkeys(oid.strip() for oid in order_ids if oid and oid.strip()))
+        if not ids:
+            return {}
+        if not self.has_valid_creds:
+            return {oid: False for oid in ids}
+
+        cancel_orders = getattr(self.client, "cancel_orders", None)
+        if cancel_orders is None:
+            workers = max(1, min(max_workers, len(ids)))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="clob-cancel"
+            ) as ex:
+                return dict(zip(ids, ex.map(self.cancel_order_best_effort, ids)))
+
+        try:
+            resp = cancel_orders(ids)
+        except (PolyException, httpx.HTTPError) as e:
+            logger.warning(f"Could not cancel {len(ids)} orders: {e}")
+            return {oid: False for oid in ids}
+        except Exception:
+            logger.exception("Unexpected error cancelling %d orders", len(ids))
+            return {oid: False for oid in ids}
+        self.invalidate_open_orders()
+
+        # CLOB reply: {"canceled": [...ids], "not_canceled": {id: reason}}
+        if isinstance(resp, dict) and ("canceled" in resp or "not_canceled" in resp):
+            canceled = set(resp.get("canceled") or [])
+            not_canceled = resp.get("not_canceled") or {}
+            for oid, reason in not_canceled.items() if isinstance(not_canceled, dict) else ():
+                logger.debug(f"Order {oid} not cancelled: {reason}")
+            return {oid: oid in canceled for oid in ids}
+        return {oid: True for oid in ids}
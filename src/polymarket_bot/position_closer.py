@@ -6,23 +6,110 @@ targets or when markets resolve.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import operator
+import random
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable
 
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs
 from py_clob_client.order_builder.constants import SELL
 
 from polymarket_bot.config import Settings, is_live
-from polymarket_bot.position_manager import Position, PositionManager
+from polymarket_bot.position_manager import _DATACLASS_SLOTS, Position, PositionManager
 from polymarket_bot.resolution_monitor import ResolutionMonitor
 
 log = logging.getLogger(__name__)
 
-
-@dataclass(frozen=True)
+# Slack on the columnar pre-screen so float rounding never hides a position
+# that the per-position check in _should_close_position would close.
+_SCREEN_EPSILON = 1e-9
+
+# Shared Decimal constants for per-tick and redemption math. _ONE keeps the
+# "1.0" spelling so persisted redemption exit prices read as before.
+_ZERO = Decimal(0)
+_ONE = Decimal("1.0")
+_HUNDRED = Decimal(100)
+
+# Max live sell orders signed/posted at once when a tick closes many positions.
+_LIVE_CLOSE_CONCURRENCY = 8
+
+# Order statuses after which polling for more fills is pointless.
+TERMINAL_STATUSES = frozenset(
+    {
+        "filled",
+        "matched",
+        "partially_filled",
+        "partial",
+        "canceled",
+        "cancelled",
+        "rejected",
+        "expired",
+        "failed",
+    }
+)
+
+# Statuses that imply the full requested size filled when no size is reported.
+_FILLED_STATUSES = frozenset({"filled", "matched", "executed"})
+
+# Lowercased keys that carry the filled size / fill price in order payloads.
+_FILL_SIZE_KEYS = frozenset(
+    {
+        "size_matched",
+        "matched_size",
+        "filled_size",
+        "filled",
+        "executed_size",
+        "filledamount",
+        "sizefilled",
+        "totalsizefilled",
+    }
+)
+_FILL_PRICE_KEYS = frozenset(
+    {
+        "avg_price",
+        "average_price",
+        "filled_price",
+        "execution_price",
+        "match_price",
+        "price",
+    }
+)
+
+
+def _pick_decimal(obj: object, keyset: frozenset[str]) -> Decimal | None:
+    """Breadth-first search of nested dicts/lists for the first decodable key.
+
+    Keys are matched case-insensitively against ``keyset`` (already lowercased);
+    shallower matches win over deeper ones.
+    """
+    queue: deque[object] = deque((obj,))
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                kl = k.lower() if isinstance(k, str) else str(k).lower()
+                if kl in keyset and v is not None:
+                    try:
+                        return Decimal(str(v))
+                    except Exception:
+                        pass
+                if isinstance(v, (dict, list)):
+                    queue.append(v)
+        elif isinstance(node, list):
+            queue.extend(node)
+    return None
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CloseResult:
     """Result of closing a position."""
     success: bool
@@ -47,11 +134,22 @@ class PositionCloser:
         self.settings = settings
         self.position_manager = position_manager
         self.resolution_monitor = resolution_monitor
+        # Settings are frozen; evaluate the live/paper switch once.
+        self._is_live = is_live(settings)
+        # Order-ID accessor per post_order response type, resolved on first use.
+        self._orderid_extractors: dict[type, Callable[[object], str | None]] = {}
         
         # Exit rule parameters from settings
-        self.profit_target_pct = settings.profit_target_pct / Decimal("100")
-        self.stop_loss_pct = settings.stop_loss_pct / Decimal("100")
+        self.profit_target_pct = settings.profit_target_pct / _HUNDRED
+        self.stop_loss_pct = settings.stop_loss_pct / _HUNDRED
         self.max_position_age_seconds = settings.max_position_age_hours * 3600.0
+        # Float copies of the thresholds for the per-tick pre-screen.
+        self._profit_target_f = float(self.profit_target_pct)
+        self._stop_loss_f = float(self.stop_loss_pct)
+
+        # Live close fill verification backoff
+        self.fill_poll_delays = tuple(settings.close_fill_poll_delays)
+        self.fill_poll_jitter = settings.close_fill_poll_jitter_seconds
         
         # Statistics
         self.close_count = 0
@@ -59,8 +157,14 @@ class PositionCloser:
         self.profit_target_closes = 0
         self.stop_loss_closes = 0
         self.time_based_closes = 0
-        self.total_realized_pnl = Decimal("0")
+        self.total_realized_pnl = _ZERO
     
+    def refresh(self, settings: Settings | None = None) -> None:
+        """Re-read the live/paper switch, optionally from replacement settings."""
+        if settings is not None:
+            self.settings = settings
+        self._is_live = is_live(self.settings)
+
     def check_and_close_positions(self, price_data: dict[str, Decimal]) -> list[CloseResult]:
         """Check all positions and close those meeting exit criteria.
         
@@ -70,113 +174,195 @@ class PositionCloser:
         Returns:
             List of close results
         """
-        results: list[CloseResult] = []
-        
-        # Update unrealized P&L
-        self.position_manager.update_unrealized_pnl(price_data)
-        
-        # Check for positions to close
-        open_positions = self.position_manager.get_open_positions()
-        redeemable_positions = self.position_manager.get_redeemable_positions()
-        
+        return list(self.iter_check_and_close_positions(price_data))
+
+    def iter_check_and_close_positions(
+        self, price_data: dict[str, Decimal]
+    ) -> Iterator[CloseResult]:
+        """Lazy form of check_and_close_positions.
+
+        Results are yielded as each stage finishes (redemptions, rule-based
+        closes, arb group age exits), so consume the iterator fully to run
+        every stage.
+        """
         # Close redeemable positions first (market resolved)
-        for position in redeemable_positions:
-            result = self.redeem_position(position)
-            results.append(result)
+        for position in self.position_manager.get_redeemable_positions():
+            yield self.redeem_position(position)
         
-        # Check open positions for profit targets
-        for position in open_positions:
-            # Multi-outcome arb positions must be held as a complete group.
-            # Individual bracket exits break the arb — they should only exit
-            # when the market resolves (one bracket pays $1, rest pay $0).
-            # Same applies to conditional arb (partial bracket sets).
-            #
-            # However — as a capital-recycling safety valve — if the entire
-            # group has been held longer than max_position_age_hours, force-
-            # close all brackets in the group at their current mid price.
-            if position.strategy in ("multi_outcome_arb", "conditional_arb"):
-                continue
+        # Exit rules price positions from the float shadows, so the stored
+        # unrealized P&L is left to the caller (see update_unrealized_pnl).
+        now = time.monotonic()
+
+        # Multi-outcome arb positions must be held as a complete group.
+        # Individual bracket exits break the arb — they should only exit
+        # when the market resolves (one bracket pays $1, rest pay $0).
+        # Same applies to conditional arb (partial bracket sets). The
+        # PositionManager keeps them in a separate bucket, so only
+        # individually closeable positions go through the exit rules.
+        #
+        # However — as a capital-recycling safety valve — if the entire
+        # group has been held longer than max_position_age_hours, force-
+        # close all brackets in the group at their current mid price.
+        singles = self.position_manager.get_individually_closeable_positions()
+        arb_groups: dict[str, list[Position]] = {}
+        arb_group_min_entry: dict[str, float] = {}
+        for position in self.position_manager.get_held_to_resolution_positions():
+            cid = position.condition_id
+            arb_groups.setdefault(cid, []).append(position)
+            arb_group_min_entry[cid] = min(
+                arb_group_min_entry.get(cid, float("inf")), position.entry_monotonic
+            )
 
-            if self._should_close_position(position, price_data):
-                result = self.close_position(position, price_data)
-                results.append(result)
+        max_age = self.max_position_age_seconds
+        sl = self._stop_loss_f
+        tp = self._profit_target_f
+        check = self._check_exit_rules
+        to_close = [
+            position
+            for position in self._screen_exit_candidates(singles, price_data, now)
+            if check(position, price_data.get(position.token_id), now, max_age, sl, tp)
+        ]
+        yield from self.close_positions(to_close, price_data)
 
         # Arb group age-based exit: close entire groups that exceeded max age.
-        if self.max_position_age_seconds > 0:
-            arb_results = self._check_arb_group_age_exit(open_positions, price_data)
-            results.extend(arb_results)
-        
-        return results
+        if self.max_position_age_seconds > 0 and self.position_manager.open_arb_count > 0:
+            yield from self._check_arb_group_age_exit(
+                arb_groups, arb_group_min_entry, price_data, now
+            )
     
-    def _should_close_position(self, position: Position, price_data: dict[str, Decimal]) -> bool:
+    def _screen_exit_candidates(
+        self,
+        open_positions: list[Position],
+        price_data: dict[str, Decimal],
+        now: float,
+    ) -> list[Position]:
+        """Return the positions that may meet an exit rule, in input order.
+
+        One float pass over the slotted float fields of every open position.
+        Thresholds include _SCREEN_EPSILON of slack, so the result is a
+        superset of what the full rule checks (and counters) in
+        _check_exit_rules will close.
+        """
+        max_age = self.max_position_age_seconds
+        tp = self._profit_target_f
+        sl = self._stop_loss_f
+        age_cut = max_age - _SCREEN_EPSILON if max_age > 0 else math.inf
+        take_profit = tp - _SCREEN_EPSILON if tp > 0 else math.inf
+        stop_loss = _SCREEN_EPSILON - sl if sl > 0 else -math.inf
+        get_price = price_data.get
+
+        candidates = []
+        for position in open_positions:
+            if now - position.entry_monotonic > age_cut:
+                candidates.append(position)
+                continue
+            price = get_price(position.token_id)
+            cost = position._cost_basis_f
+            if price is None or cost <= 0:
+                continue
+            ret = (float(price) - position._entry_price_f) * position._qty_f / cost
+            if ret <= stop_loss or ret >= take_profit:
+                candidates.append(position)
+        return candidates
+
+    def _should_close_position(
+        self,
+        position: Position,
+        price_data: dict[str, Decimal],
+        now: float | None = None,
+    ) -> bool:
         """Determine if a position should be closed.
 
         Exit rules (checked in order):
         1. Stop loss: close if unrealized P&L drops below -stop_loss_pct
         2. Profit target: close if unrealized P&L exceeds +profit_target_pct
         3. Time-based: close if position age exceeds max_position_age
+
+        ``now`` is a time.monotonic() reading shared across a whole tick.
         """
-        import time as _time
+        return self._check_exit_rules(
+            position,
+            price_data.get(position.token_id),
+            time.monotonic() if now is None else now,
+            self.max_position_age_seconds,
+            self._stop_loss_f,
+            self._profit_target_f,
+        )
 
-        # Need price data for this token
-        current_price = price_data.get(position.token_id)
+    def _check_exit_rules(
+        self,
+        position: Position,
+        current_price: Decimal | None,
+        now: float,
+        max_age: float,
+        sl: float,
+        tp: float,
+    ) -> bool:
+        """Apply the exit rules with the tick's loop-invariant values passed in.
+
+        ``sl``/``tp`` are the stop-loss and profit-target fractions; 0 disables
+        a rule, as does ``max_age`` <= 0 for the time exit.
+        """
         if current_price is None:
             # Can't evaluate without price — check time-based exit only
-            if self.max_position_age_seconds > 0:
-                age = _time.time() - position.entry_time
-                if age > self.max_position_age_seconds:
-                    log.info(
-                        "⏰ TIME EXIT: %s aged %.1fh (max %.1fh) — closing",
-                        position.position_id,
-                        age / 3600,
-                        self.max_position_age_seconds / 3600,
-                    )
+            if max_age > 0:
+                age = now - position.entry_monotonic
+                if age > max_age:
+                    if log.isEnabledFor(logging.INFO):
+                        log.info(
+                            "⏰ TIME EXIT: %s aged %.1fh (max %.1fh) — closing",
+                            position.position_id,
+                            age / 3600,
+                            max_age / 3600,
+                        )
                     self.time_based_closes += 1
                     return True
             return False
 
-        # Update unrealized P&L for this position
-        position.update_unrealized_pnl(current_price)
-
-        # Calculate return on cost basis
-        if position.cost_basis <= 0:
+        # Calculate return on cost basis. The decision only needs float
+        # precision; the P&L booked on close stays Decimal.
+        cost_basis = position._cost_basis_f
+        if cost_basis <= 0:
             return False
 
-        return_pct = position.unrealized_pnl / position.cost_basis
+        return_pct = position.unrealized_pnl_from(float(current_price)) / cost_basis
 
         # 1. Stop loss
-        if self.stop_loss_pct > 0 and return_pct <= -self.stop_loss_pct:
-            log.warning(
-                "🛑 STOP LOSS: %s return=%.2f%% (limit=-%.2f%%) — closing",
-                position.position_id,
-                float(return_pct * 100),
-                float(self.stop_loss_pct * 100),
-            )
+        if sl > 0 and return_pct <= -sl:
+            if log.isEnabledFor(logging.WARNING):
+                log.warning(
+                    "🛑 STOP LOSS: %s return=%.2f%% (limit=-%.2f%%) — closing",
+                    position.position_id,
+                    return_pct * 100,
+                    sl * 100,
+                )
             self.stop_loss_closes += 1
             return True
 
         # 2. Profit target
-        if self.profit_target_pct > 0 and return_pct >= self.profit_target_pct:
-            log.info(
-                "🎯 PROFIT TARGET: %s return=%.2f%% (target=%.2f%%) — closing",
-                position.position_id,
-                float(return_pct * 100),
-                float(self.profit_target_pct * 100),
-            )
+        if tp > 0 and return_pct >= tp:
+            if log.isEnabledFor(logging.INFO):
+                log.info(
+                    "🎯 PROFIT TARGET: %s return=%.2f%% (target=%.2f%%) — closing",
+                    position.position_id,
+                    return_pct * 100,
+                    tp * 100,
+                )
             self.profit_target_closes += 1
             return True
 
         # 3. Time-based exit
-        if self.max_position_age_seconds > 0:
-            age = _time.time() - position.entry_time
-            if age > self.max_position_age_seconds:
-                log.info(
-                    "⏰ TIME EXIT: %s aged %.1fh (max %.1fh) return=%.2f%% — closing",
-                    position.position_id,
-                    age / 3600,
-                    self.max_position_age_seconds / 3600,
-                    float(return_pct * 100),
-                )
+        if max_age > 0:
+            age = now - position.entry_monotonic
+            if age > max_age:
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "⏰ TIME EXIT: %s aged %.1fh (max %.1fh) return=%.2f%% — closing",
+                        position.position_id,
+                        age / 3600,
+                        max_age / 3600,
+                        return_pct * 100,
+                    )
                 self.time_based_closes += 1
                 return True
 
@@ -198,13 +384,102 @@ class PositionCloser:
             current_price = position.entry_price
         
         # Execute sell (regardless of profitability — exit rules already decided)
-        if not is_live(self.settings):
+        if not self._is_live:
             # Paper mode
             return self._paper_close(position, current_price)
         else:
             # Live mode
             return self._live_close(position, current_price)
     
+    def close_positions(
+        self,
+        positions: list[Position],
+        price_data: dict[str, Decimal],
+    ) -> list[CloseResult]:
+        """Close several positions, overlapping live order I/O.
+
+        Live sells are signed and posted concurrently (at most
+        _LIVE_CLOSE_CONCURRENCY in flight) and their fill checks overlap, so
+        a tick that closes N positions costs roughly one round trip plus one
+        verification window instead of N of each. Inside a running event
+        loop sells are posted one at a time, with the next one signed while
+        the previous one posts. Ledger updates and stats are still applied
+        serially, in input order.
+        """
+        if len(positions) <= 1 or not self._is_live or not self.client:
+            return [self.close_position(p, price_data) for p in positions]
+        batch: list[tuple[Position, Decimal]] = []
+        for position in positions:
+            current_price = price_data.get(position.token_id)
+            if current_price is None:
+                current_price = position.entry_price
+            batch.append((position, current_price))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop: post one at a time, but sign ahead.
+            return self._close_pipelined(batch)
+
+        async def _run_batch() -> list[Any]:
+            sem = asyncio.Semaphore(_LIVE_CLOSE_CONCURRENCY)
+            return list(
+                await asyncio.gather(
+                    *(self._alive_close(position, price, sem) for position, price in batch),
+                    return_exceptions=True,
+                )
+            )
+
+        results: list[CloseResult] = []
+        for (position, _), outcome in zip(batch, asyncio.run(_run_batch())):
+            if isinstance(outcome, CloseResult):
+                results.append(outcome)
+            elif isinstance(outcome, BaseException):
+                results.append(self._live_close_error(position, outcome))
+            else:
+                order_id, fill = outcome
+                try:
+                    results.append(self._finish_live_close(position, order_id, *fill))
+                except Exception as e:
+                    results.append(self._live_close_error(position, e))
+        return results
+
+    def _close_pipelined(self, batch: list[tuple[Position, Decimal]]) -> list[CloseResult]:
+        """Close live positions in order, signing each sell while the previous one posts."""
+        results: list[CloseResult] = []
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="close-sign") as signer:
+            signing = [signer.submit(self._sign_close_order, p, price) for p, price in batch]
+            for (position, exit_price), future in zip(batch, signing):
+                try:
+                    signed_order = future.result()
+                except Exception as e:
+                    results.append(self._live_close_error(position, e))
+                    continue
+                results.append(self._live_close(position, exit_price, signed_order))
+        return results
+
+    async def _alive_close(
+        self,
+        position: Position,
+        exit_price: Decimal,
+        sem: asyncio.Semaphore,
+    ) -> CloseResult | tuple[str, tuple[Decimal, Decimal, str]]:
+        """Post and verify one live sell; booking is left to the caller."""
+        async with sem:
+            submitted = await asyncio.to_thread(self._submit_live_close, position, exit_price)
+        if isinstance(submitted, CloseResult):
+            return submitted
+        order_id, response = submitted
+        fill = await self._averify_live_close_fill(
+            order_id=order_id,
+            post_response=response,
+            requested_size=position.quantity,
+            requested_price=exit_price,
+        )
+        return order_id, fill
+    
     def redeem_position(self, position: Position) -> CloseResult:
         """Redeem a position in a resolved market.
         
@@ -218,9 +493,9 @@ class PositionCloser:
                 error="Position is not marked as redeemable",
             )
         
-        redemption_value = Decimal("1.0")
+        redemption_value = _ONE
         
-        if not is_live(self.settings):
+        if not self._is_live:
             # Paper mode
             pnl = self.position_manager.close_position(
                 position.position_id,
@@ -231,10 +506,12 @@ class PositionCloser:
             self.total_realized_pnl += pnl
             
             log.warning(
-                f"📄 PAPER REDEMPTION [{position.strategy}]: "
-                f"pos={position.position_id} qty={position.quantity} "
-                f"entry=${position.entry_price:.4f} exit=$1.00 "
-                f"P&L=${pnl:.4f}"
+                "📄 PAPER REDEMPTION [%s]: pos=%s qty=%s entry=$%.4f exit=$1.00 P&L=$%.4f",
+                position.strategy,
+                position.position_id,
+                position.quantity,
+                position.entry_price,
+                pnl,
             )
             
             return CloseResult(
@@ -271,10 +548,13 @@ class PositionCloser:
         self.total_realized_pnl += pnl
         
         log.warning(
-            f"📄 PAPER CLOSE [{position.strategy}]: "
-            f"pos={position.position_id} qty={position.quantity} "
-            f"entry=${position.entry_price:.4f} exit=${exit_price:.4f} "
-            f"P&L=${pnl:.4f}"
+            "📄 PAPER CLOSE [%s]: pos=%s qty=%s entry=$%.4f exit=$%.4f P&L=$%.4f",
+            position.strategy,
+            position.position_id,
+            position.quantity,
+            position.entry_price,
+            exit_price,
+            pnl,
         )
         
         return CloseResult(
@@ -284,38 +564,18 @@ class PositionCloser:
             realized_pnl=pnl,
         )
     
-    def _live_close(self, position: Position, exit_price: Decimal) -> CloseResult:
+    def _live_close(
+        self,
+        position: Position,
+        exit_price: Decimal,
+        signed_order: object | None = None,
+    ) -> CloseResult:
         """Close a position in live mode by selling."""
-        if not self.client:
-            return CloseResult(
-                success=False,
-                position_id=position.position_id,
-                reason="no_client",
-                error="Client not initialized",
-            )
-        
         try:
-            # Create sell order
-            order_args = OrderArgs(
-                price=float(exit_price),
-                size=float(position.quantity),
-                side=SELL,
-                token_id=position.token_id,
-            )
-            
-            # Sign and post
-            signed_order = self.client.create_order(order_args)
-            response = self.client.post_order(signed_order, orderType="FOK")  # type: ignore[arg-type]
-            
-            # Extract order ID
-            order_id = self._extract_order_id(response)
-            if not order_id:
-                return CloseResult(
-                    success=False,
-                    position_id=position.position_id,
-                    reason="live_close_missing_order_id",
-                    error="Order posted but no order ID returned",
-                )
+            submitted = self._submit_live_close(position, exit_price, signed_order)
+            if isinstance(submitted, CloseResult):
+                return submitted
+            order_id, response = submitted
 
             filled_size, filled_price, status = self._verify_live_close_fill(
                 order_id=order_id,
@@ -323,60 +583,135 @@ class PositionCloser:
                 requested_size=position.quantity,
                 requested_price=exit_price,
             )
+            return self._finish_live_close(position, order_id, filled_size, filled_price, status)
+        except Exception as e:
+            return self._live_close_error(position, e)
 
-            if filled_size < position.quantity:
-                return CloseResult(
-                    success=False,
-                    position_id=position.position_id,
-                    reason="live_close_not_fully_filled",
-                    order_id=order_id,
-                    error=(
-                        f"status={status} filled={filled_size} requested={position.quantity}; "
-                        "position left open"
-                    ),
-                )
-            
-            # Close position
-            pnl = self.position_manager.close_position(
-                position.position_id,
-                exit_price=filled_price,
-                exit_order_id=order_id,
-            )
-            
-            self.close_count += 1
-            self.total_realized_pnl += pnl
-            
-            log.warning(
-                f"✅ LIVE CLOSE [{position.strategy}]: "
-                f"pos={position.position_id} P&L=${pnl:.4f} order={order_id} status={status}"
+    def _submit_live_close(
+        self,
+        position: Position,
+        exit_price: Decimal,
+        signed_order: object | None = None,
+    ) -> CloseResult | tuple[str, object]:
+        """Post the FOK sell; returns (order_id, response) or a failed CloseResult.
+
+        signed_order may be supplied when the sell was already signed ahead of time.
+        """
+        if not self.client:
+            return CloseResult(
+                success=False,
+                position_id=position.position_id,
+                reason="no_client",
+                error="Client not initialized",
             )
-            
+
+        if signed_order is None:
+            signed_order = self._sign_close_order(position, exit_price)
+        response = self.client.post_order(signed_order, orderType="FOK")  # type: ignore[arg-type]
+
+        # Extract order ID
+        order_id = self._extract_order_id(response)
+        if not order_id:
             return CloseResult(
-                success=True,
+                success=False,
                 position_id=position.position_id,
-                reason="live_closed",
-                realized_pnl=pnl,
-                order_id=order_id,
+                reason="live_close_missing_order_id",
+                error="Order posted but no order ID returned",
             )
-            
-        except Exception as e:
-            log.exception(f"Failed to close position {position.position_id}")
+        return order_id, response
+
+    def _sign_close_order(self, position: Position, exit_price: Decimal) -> object:
+        """Build and sign the sell order for a position (CPU-bound, no I/O)."""
+        order_args = OrderArgs(
+            price=float(exit_price),
+            size=float(position.quantity),
+            side=SELL,
+            token_id=position.token_id,
+        )
+        return self.client.create_order(order_args)  # type: ignore[union-attr]
+
+    def _finish_live_close(
+        self,
+        position: Position,
+        order_id: str,
+        filled_size: Decimal,
+        filled_price: Decimal,
+        status: str,
+    ) -> CloseResult:
+        """Book a verified live close, or report it as not fully filled."""
+        if filled_size < position.quantity:
             return CloseResult(
                 success=False,
                 position_id=position.position_id,
-                reason="error",
-                error=str(e),
+                reason="live_close_not_fully_filled",
+                order_id=order_id,
+                error=(
+                    f"status={status} filled={filled_size} requested={position.quantity}; "
+                    "position left open"
+                ),
             )
+        
+        # Close position
+        pnl = self.position_manager.close_position(
+            position.position_id,
+            exit_price=filled_price,
+            exit_order_id=order_id,
+        )
+        
+        self.close_count += 1
+        self.total_realized_pnl += pnl
+        
+        log.warning(
+            "✅ LIVE CLOSE [%s]: pos=%s P&L=$%.4f order=%s status=%s",
+            position.strategy,
+            position.position_id,
+            pnl,
+            order_id,
+            status,
+        )
+        
+        return CloseResult(
+            success=True,
+            position_id=position.position_id,
+            reason="live_closed",
+            realized_pnl=pnl,
+            order_id=order_id,
+        )
+
+    def _live_close_error(self, position: Position, error: BaseException) -> CloseResult:
+        log.error("Failed to close position %s", position.position_id, exc_info=error)
+        return CloseResult(
+            success=False,
+            position_id=position.position_id,
+            reason="error",
+            error=str(error),
+        )
     
     def _extract_order_id(self, response: object) -> str | None:
-        """Extract order ID from response."""
+        """Extract order ID from response.
+
+        The accessor is resolved once per response type and memoized.
+        """
+        extractor = self._orderid_extractors.get(type(response))
+        if extractor is None:
+            extractor = self._orderid_extractor_for(response)
+            self._orderid_extractors[type(response)] = extractor
         try:
-            if isinstance(response, dict):
-                return response.get("orderID") or response.get("orderId")
-            return getattr(response, "orderID", None) or getattr(response, "orderId", None)
-        except Exception:
+            return extractor(response)
+        except AttributeError:
             return None
 
+    @staticmethod
+    def _orderid_extractor_for(response: object) -> Callable[[object], str | None]:
+        """Pick the order-ID accessor for ``type(response)``."""
+        if isinstance(response, dict):
+            # Key spelling varies by client version, not by dict type.
+            return lambda r: r.get("orderID") or r.get("orderId")  # type: ignore[attr-defined]
+        for attr in ("orderID", "orderId"):
+            if getattr(response, attr, None):
+                return operator.attrgetter(attr)
+        return lambda r: getattr(r, "orderID", None) or getattr(r, "orderId", None)
+
     def _verify_live_close_fill(
         self,
         *,
@@ -386,39 +721,61 @@ class PositionCloser:
         requested_price: Decimal,
     ) -> tuple[Decimal, Decimal, str]:
         """Verify full close fill using post response and brief get_order polling."""
-        import time as _time
-
-        filled_size, filled_price, status = self._extract_fill_details(
-            payload=post_response,
+        filled_size, filled_price, status = self._extract_from_dict(
+            self._coerce_payload(post_response),
             requested_size=requested_size,
             requested_price=requested_price,
         )
-        terminal = {
-            "filled",
-            "matched",
-            "partially_filled",
-            "partial",
-            "canceled",
-            "cancelled",
-            "rejected",
-            "expired",
-            "failed",
-        }
-        if filled_size > Decimal("0") or status in terminal:
+        if filled_size > _ZERO or status in TERMINAL_STATUSES:
             return filled_size, filled_price, status
 
-        for _ in range(3):
-            _time.sleep(0.2)
+        for delay in self.fill_poll_delays:
+            time.sleep(delay + random.uniform(0, self.fill_poll_jitter))
             try:
                 payload = self.client.get_order(order_id) if self.client else None
             except Exception:
                 continue
-            filled_size, filled_price, status = self._extract_fill_details(
-                payload=payload,
+            filled_size, filled_price, status = self._extract_from_dict(
+                self._coerce_payload(payload),
+                requested_size=requested_size,
+                requested_price=requested_price,
+            )
+            if filled_size > _ZERO or status in TERMINAL_STATUSES:
+                return filled_size, filled_price, status
+
+        return filled_size, filled_price, status
+
+    async def _averify_live_close_fill(
+        self,
+        *,
+        order_id: str,
+        post_response: object,
+        requested_size: Decimal,
+        requested_price: Decimal,
+    ) -> tuple[Decimal, Decimal, str]:
+        """Async twin of _verify_live_close_fill so several closes can poll at once."""
+        filled_size, filled_price, status = self._extract_from_dict(
+            self._coerce_payload(post_response),
+            requested_size=requested_size,
+            requested_price=requested_price,
+        )
+        if filled_size > _ZERO or status in TERMINAL_STATUSES:
+            return filled_size, filled_price, status
+
+        for delay in self.fill_poll_delays:
+            await asyncio.sleep(delay + random.uniform(0, self.fill_poll_jitter))
+            try:
+                payload = None
+                if self.client:
+                    payload = await asyncio.to_thread(self.client.get_order, order_id)
+            except Exception:
+                continue
+            filled_size, filled_price, status = self._extract_from_dict(
+                self._coerce_payload(payload),
                 requested_size=requested_size,
                 requested_price=requested_price,
             )
-            if filled_size > Decimal("0") or status in terminal:
+            if filled_size > _ZERO or status in TERMINAL_STATUSES:
                 return filled_size, filled_price, status
 
         return filled_size, filled_price, status
@@ -431,8 +788,18 @@ class PositionCloser:
         requested_price: Decimal,
     ) -> tuple[Decimal, Decimal, str]:
         """Extract (filled_size, fill_price, status) from variable payload shapes."""
-        data: Any = payload
-        if hasattr(payload, "model_dump"):
+        return self._extract_from_dict(
+            self._coerce_payload(payload),
+            requested_size=requested_size,
+            requested_price=requested_price,
+        )
+
+    @staticmethod
+    def _coerce_payload(payload: object) -> Any:
+        """Unwrap a client response (pydantic model / plain object) into a dict once."""
+        if type(payload) is dict:
+            data: Any = payload
+        elif hasattr(payload, "model_dump"):
             try:
                 data = payload.model_dump()
             except Exception:
@@ -442,77 +809,37 @@ class PositionCloser:
                 data = dict(getattr(payload, "__dict__"))
             except Exception:
                 data = payload
+        else:
+            data = payload
 
         if isinstance(data, dict):
             if isinstance(data.get("order"), dict):
                 data = data["order"]
             elif isinstance(data.get("data"), dict):
                 data = data["data"]
+        return data
 
+    def _extract_from_dict(
+        self,
+        data: Any,
+        *,
+        requested_size: Decimal,
+        requested_price: Decimal,
+    ) -> tuple[Decimal, Decimal, str]:
+        """Extract (filled_size, fill_price, status) from a _coerce_payload result."""
         status = "unknown"
         if isinstance(data, dict):
             s = data.get("status") or data.get("state") or data.get("order_status")
-            if s is not None:
+            if type(s) is str:
+                status = s.strip().lower()
+            elif s is not None:
                 status = str(s).strip().lower()
 
-        def _pick_decimal(obj: object, keys: set[str]) -> Decimal | None:
-            keyset = {k.lower() for k in keys}
-
-            def _to_decimal(v: object) -> Decimal | None:
-                if v is None:
-                    return None
-                try:
-                    return Decimal(str(v))
-                except Exception:
-                    return None
-
-            def _walk(node: object) -> Decimal | None:
-                if isinstance(node, dict):
-                    for k, v in node.items():
-                        if str(k).lower() in keyset:
-                            d = _to_decimal(v)
-                            if d is not None:
-                                return d
-                    for v in node.values():
-                        d = _walk(v)
-                        if d is not None:
-                            return d
-                elif isinstance(node, list):
-                    for item in node:
-                        d = _walk(item)
-                        if d is not None:
-                            return d
-                return None
-
-            return _walk(obj)
-
-        size = _pick_decimal(
-            data,
-            {
-                "size_matched",
-                "matched_size",
-                "filled_size",
-                "filled",
-                "executed_size",
-                "filledamount",
-                "sizefilled",
-                "totalsizefilled",
-            },
-        )
-        price = _pick_decimal(
-            data,
-            {
-                "avg_price",
-                "average_price",
-                "filled_price",
-                "execution_price",
-                "match_price",
-                "price",
-            },
-        )
+        size = _pick_decimal(data, _FILL_SIZE_KEYS)
+        price = _pick_decimal(data, _FILL_PRICE_KEYS)
 
         if size is None:
-            size = requested_size if status in {"filled", "matched", "executed"} else Decimal("0")
+            size = requested_size if status in _FILLED_STATUSES else _ZERO
         if price is None or price <= 0:
             price = requested_price
 
@@ -535,36 +862,27 @@ class PositionCloser:
 
     def _check_arb_group_age_exit(
         self,
-        open_positions: list[Position],
+        arb_groups: dict[str, list[Position]],
+        arb_group_min_entry: dict[str, float],
         price_data: dict[str, Decimal],
+        now: float,
     ) -> list[CloseResult]:
         """Force-close entire arb groups that exceeded max_position_age.
 
+        ``arb_groups`` maps condition_id to the open arb legs in that market and
+        ``arb_group_min_entry`` to the earliest leg's entry_monotonic, both as
+        built by check_and_close_positions.
+
         Without this, arb positions (which skip normal exit rules) could lock up
         capital forever if the resolution monitor misses a market.
 
         The exit uses the current mid-price for each bracket so P&L reflects
         actual market conditions.
         """
-        import time as _time
-
         results: list[CloseResult] = []
-        now = _time.time()
-
-        arb_positions = [
-            p for p in open_positions
-            if p.strategy in ("multi_outcome_arb", "conditional_arb")
-        ]
-        if not arb_positions:
-            return results
-
-        # Group by condition_id.
-        groups: dict[str, list[Position]] = {}
-        for p in arb_positions:
-            groups.setdefault(p.condition_id, []).append(p)
 
-        for cid, group_positions in groups.items():
-            oldest_age = max(now - p.entry_time for p in group_positions)
+        for cid, group_positions in arb_groups.items():
+            oldest_age = now - arb_group_min_entry[cid]
             if oldest_age <= self.max_position_age_seconds:
                 continue
 
@@ -576,9 +894,6 @@ class PositionCloser:
                 self.max_position_age_seconds / 3600,
             )
 
-            for p in group_positions:
-                exit_price = price_data.get(p.token_id, p.entry_price)
-                result = self.close_position(p, price_data)
-                results.append(result)
+            results.extend(self.close_positions(group_positions, price_data))
 
         return results
@@ -7,17 +7,67 @@ calculation and portfolio management.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
+import sys
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 log = logging.getLogger(__name__)
 
+# Strategies whose legs are held (and valued/exited) as a complete group.
+ARB_STRATEGIES = frozenset(("multi_outcome_arb", "conditional_arb"))
+
+# Exit policies used to bucket open positions.
+EXIT_POLICY_HELD = "held_to_resolution"
+EXIT_POLICY_CLOSEABLE = "individually_closeable"
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Debounced mode appends changed positions to a log next to the snapshot and
+# rewrites the snapshot once this many events have accumulated.
+_SNAPSHOT_EVERY_EVENTS = 1000
+
+
+def exit_policy_for(strategy: str) -> str:
+    """Arb legs are held as a group until resolution; everything else exits alone."""
+    return EXIT_POLICY_HELD if strategy in ARB_STRATEGIES else EXIT_POLICY_CLOSEABLE
+
+
+def _arb_group_leg_pnl(positions: list[Position]) -> Decimal:
+    """Per-leg unrealized P&L of one arb group, held to resolution.
+
+    The expected value is $1.00 × qty per execution (one bracket wins). If
+    the same group was executed N times (e.g. across restarts before the
+    dedup fix), there are N × B positions (B = unique brackets). We detect N
+    by comparing total positions to the number of unique token_ids.
+    """
+    qty = positions[0].quantity  # All brackets have the same size
+    unique_tokens = len({p.token_id for p in positions})
+    num_executions = max(1, len(positions) // unique_tokens) if unique_tokens else 1
+    group_cost = sum(p.entry_price * qty for p in positions)
+    group_value = Decimal("1.00") * qty * num_executions  # One winner per execution
+    return (group_value - group_cost) / len(positions)
+
+
+def _position_number(position_id: str) -> int:
+    """The ``n`` in a ``pos_<n>`` id (0 for ids in any other format)."""
+    _, _, number = position_id.rpartition("_")
+    return int(number) if number.isdigit() else 0
+
 
 class PositionStatus(str, Enum):
     """Status of a position."""
@@ -27,7 +77,7 @@ class PositionStatus(str, Enum):
     REDEEMABLE = "redeemable"  # Market resolved, can redeem for $1
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Position:
     """Represents a trading position."""
     position_id: str  # Unique identifier
@@ -56,11 +106,49 @@ class Position:
     
     # Metadata
     metadata: dict[str, Any] = field(default_factory=dict)
+
+    # exit_policy_for(strategy), resolved once so bucket moves skip the lookup.
+    exit_policy: str = field(init=False, repr=False, compare=False)
+
+    # outcome.upper(), for matching against resolved winning outcomes.
+    outcome_upper: str = field(init=False, repr=False, compare=False)
+
+    # negRisk group IDs ("0x...") name an arb group rather than a single
+    # Gamma market; resolution is then checked per bracket.
+    is_neg_risk_group: bool = field(init=False, repr=False, compare=False)
+
+    # entry_price * quantity, fixed at construction (entry details don't change).
+    _cost_basis: Decimal = field(init=False, repr=False, compare=False)
+
+    # Float shadows of the entry details for exit screening (booking stays Decimal).
+    _entry_price_f: float = field(init=False, repr=False, compare=False)
+    _qty_f: float = field(init=False, repr=False, compare=False)
+    _cost_basis_f: float = field(init=False, repr=False, compare=False)
+
+    # Entry time on the time.monotonic() clock, for age checks that must not
+    # jump with wall-clock corrections. Rebased from entry_time on load.
+    entry_monotonic: float = field(init=False, repr=False, compare=False)
+
+    # to_dict() of a CLOSED position, which no longer changes; reset by close().
+    _closed_dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Price unrealized_pnl was last marked at; unchanged marks skip the Decimal math.
+    _mark_price: Decimal | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._entry_price_f = float(self.entry_price)
+        self._qty_f = float(self.quantity)
+        self.exit_policy = exit_policy_for(self.strategy)
+        self.outcome_upper = self.outcome.upper()
+        self.is_neg_risk_group = self.condition_id.startswith("0x")
+        self._cost_basis = self.entry_price * self.quantity
+        self._cost_basis_f = float(self._cost_basis)
+        self.entry_monotonic = time.monotonic() - max(0.0, time.time() - self.entry_time)
     
     @property
     def cost_basis(self) -> Decimal:
         """Total cost of the position."""
-        return self.entry_price * self.quantity
+        return self._cost_basis
     
     @property
     def is_open(self) -> bool:
@@ -79,16 +167,25 @@ class Position:
     
     def update_unrealized_pnl(self, current_price: Decimal) -> None:
         """Update unrealized P&L based on current price."""
-        if self.is_open:
+        if self.is_open and current_price != self._mark_price:
+            self._mark_price = current_price
             current_value = current_price * self.quantity
             self.unrealized_pnl = current_value - self.cost_basis
     
+    def unrealized_pnl_from(self, current_price: float) -> float:
+        """Float unrealized P&L at ``current_price``, without touching state.
+
+        For exit screening only; booked P&L goes through the Decimal methods.
+        """
+        return (current_price - self._entry_price_f) * self._qty_f
+
     def close(self, exit_price: Decimal, exit_order_id: str | None = None) -> Decimal:
         """Close the position and calculate realized P&L.
         
         Returns:
             Realized profit/loss
         """
+        self._closed_dict = None
         self.exit_price = exit_price
         self.exit_time = time.time()
         self.exit_order_id = exit_order_id
@@ -102,6 +199,7 @@ class Position:
     
     def mark_redeemable(self) -> None:
         """Mark position as redeemable (market resolved, winning side)."""
+        self._closed_dict = None
         self.status = PositionStatus.REDEEMABLE
         # For winning shares, exit price is $1
         self.exit_price = Decimal("1.0")
@@ -109,8 +207,14 @@ class Position:
         self.unrealized_pnl = (Decimal("1.0") * self.quantity) - self.cost_basis
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert position to dictionary for serialization."""
-        return {
+        """Convert position to dictionary for serialization.
+
+        Closed positions are final, so their dict is built once and reused
+        by every later snapshot; treat the result as read-only.
+        """
+        if self._closed_dict is not None:
+            return self._closed_dict
+        data = {
             "position_id": self.position_id,
             "condition_id": self.condition_id,
             "token_id": self.token_id,
@@ -128,6 +232,9 @@ class Position:
             "unrealized_pnl": str(self.unrealized_pnl),
             "metadata": self.metadata,
         }
+        if self.status is PositionStatus.CLOSED:
+            self._closed_dict = data
+        return data
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Position:
@@ -153,15 +260,68 @@ class Position:
 
 
 class PositionManager:
-    """Manages all trading positions."""
+    """Manages all trading positions.
+
+    With ``save_interval_seconds`` > 0, mutations only mark positions dirty
+    and a background thread appends them to ``<storage>.log`` at most once
+    per interval; the JSON snapshot is rewritten every
+    _SNAPSHOT_EVERY_EVENTS events and on close(). Call flush() or close() to
+    persist immediately. The default of 0 rewrites the snapshot on every
+    change.
+    """
     
-    def __init__(self, storage_path: str | None = None):
+    def __init__(self, storage_path: str | None = None, save_interval_seconds: float = 0.0):
         self.storage_path = Path(storage_path) if storage_path else None
+        self.save_interval_seconds = save_interval_seconds
+        self._log_path = self.storage_path.with_suffix(".log") if self.storage_path else None
+        self._log_events = 0  # events appended since the last snapshot
+        self._dirty_ids: set[str] = set()
+        self._batch_ids: set[str] | None = None  # set while inside _batched()
+        self._dirty_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        # Held while positions change and while they are serialized, so the
+        # flusher never writes a half-updated record. Never held while
+        # persisting (flusher order is _save_lock -> _state_lock).
+        self._state_lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flusher: threading.Thread | None = None
         self.positions: dict[str, Position] = {}
         self._next_position_id = 1
+        self._version = 0  # bumped on every mutation
+        # Secondary indexes over self.positions (position_id -> Position, in
+        # insertion order), kept in step with every status change.
+        self._open: dict[str, Position] = {}
+        self._redeemable: dict[str, Position] = {}
+        self._by_condition: dict[str, dict[str, Position]] = {}
+        self._by_strategy: dict[str, dict[str, Position]] = {}
+        # condition_id -> OPEN positions in that market (no empty entries).
+        self._open_by_condition: dict[str, dict[str, Position]] = {}
+        # group condition_id -> bracket_condition_id -> OPEN arb legs
+        # (position_id -> Position), for legs that carry a bracket id.
+        self._bracket_index: dict[str, dict[str, dict[str, Position]]] = {}
+        # Shares held in REDEEMABLE positions (each redeems for $1).
+        self._redeemable_total = Decimal("0")
+        # Running cost-basis totals over held (OPEN + REDEEMABLE) positions;
+        # the per-key entries are (cost, position count), dropped at zero.
+        self._held_cost_total = Decimal("0")
+        self._held_cost_by_condition: dict[str, tuple[Decimal, int]] = {}
+        self._held_cost_by_strategy: dict[str, tuple[Decimal, int]] = {}
+        # Running realized-P&L totals over CLOSED positions, for get_portfolio_stats.
+        self._closed_count = 0
+        self._realized_total = Decimal("0")
+        self._realized_by_strategy: dict[str, float] = {}
+        # OPEN positions bucketed by exit policy (position_id -> Position).
+        self._by_exit_policy: dict[str, dict[str, Position]] = {
+            EXIT_POLICY_HELD: {},
+            EXIT_POLICY_CLOSEABLE: {},
+        }
+        # Per-leg unrealized P&L of each open arb group (condition_id -> P&L).
+        # Group value doesn't depend on prices, so it only changes when a leg
+        # opens or leaves OPEN.
+        self._arb_group_pnl: dict[str, Decimal] = {}
         
         # Load positions from storage if available
-        if self.storage_path and self.storage_path.exists():
+        if self.storage_path and (self.storage_path.exists() or self._log_path.exists()):
             self._load_positions()
     
     def open_position(
@@ -180,28 +340,35 @@ class PositionManager:
         Returns:
             The newly created position
         """
-        position_id = f"pos_{self._next_position_id}"
-        self._next_position_id += 1
-        
-        position = Position(
-            position_id=position_id,
-            condition_id=condition_id,
-            token_id=token_id,
-            outcome=outcome,
-            strategy=strategy,
-            entry_price=entry_price,
-            quantity=quantity,
-            entry_time=time.time(),
-            entry_order_id=entry_order_id,
-            metadata=metadata or {},
-        )
-        
-        self.positions[position_id] = position
-        self._save_positions()
+        with self._state_lock:
+            position_id = f"pos_{self._next_position_id}"
+            self._next_position_id += 1
+
+            position = Position(
+                position_id=position_id,
+                condition_id=condition_id,
+                token_id=token_id,
+                outcome=outcome,
+                strategy=strategy,
+                entry_price=entry_price,
+                quantity=quantity,
+                entry_time=time.time(),
+                entry_order_id=entry_order_id,
+                metadata=metadata or {},
+            )
+
+            self.positions[position_id] = position
+            self._index(position)
+            self._arb_group_pnl.pop(condition_id, None)
+        self._mark_dirty(position_id)
         
         log.info(
-            f"Opened position {position_id}: {outcome} {quantity} @ ${entry_price} "
-            f"(condition={condition_id[:8]}...)"
+            "Opened position %s: %s %s @ $%s (condition=%s...)",
+            position_id,
+            outcome,
+            quantity,
+            entry_price,
+            condition_id[:8],
         )
         
         return position
@@ -221,16 +388,40 @@ class PositionManager:
             raise ValueError(f"Position {position_id} not found")
         
         position = self.positions[position_id]
-        pnl = position.close(exit_price, exit_order_id)
-        self._save_positions()
+        with self._state_lock:
+            self._untrack_open(position)
+            if self._redeemable.pop(position_id, None) is not None:
+                self._redeemable_total -= position.quantity
+            if position.is_closed:
+                self._book_realized(position, -1)
+            else:
+                self._hold(position, -1)
+            pnl = position.close(exit_price, exit_order_id)
+            self._book_realized(position)
+        self._mark_dirty(position_id)
         
         log.info(
-            f"Closed position {position_id}: "
-            f"entry=${position.entry_price:.4f} exit=${exit_price:.4f} "
-            f"P&L=${pnl:.4f}"
+            "Closed position %s: entry=$%.4f exit=$%.4f P&L=$%.4f",
+            position_id,
+            position.entry_price,
+            exit_price,
+            pnl,
         )
         
         return pnl
+
+    def close_positions_many(
+        self,
+        position_ids: Iterable[str],
+        exit_price: Decimal,
+    ) -> dict[str, Decimal]:
+        """Close several positions at one price, persisting once.
+
+        Returns:
+            Realized profit/loss per position ID
+        """
+        with self._batched():
+            return {pid: self.close_position(pid, exit_price) for pid in position_ids}
     
     def mark_redeemable(self, position_id: str) -> None:
         """Mark a position as redeemable (market resolved)."""
@@ -238,33 +429,185 @@ class PositionManager:
             raise ValueError(f"Position {position_id} not found")
         
         position = self.positions[position_id]
-        position.mark_redeemable()
-        self._save_positions()
+        with self._state_lock:
+            self._untrack_open(position)
+            if position.is_closed:
+                self._book_realized(position, -1)
+                self._hold(position)
+            position.mark_redeemable()
+            if position_id not in self._redeemable:
+                self._redeemable_total += position.quantity
+            self._redeemable[position_id] = position
+        self._mark_dirty(position_id)
         
         log.info(
-            f"Position {position_id} marked redeemable: "
-            f"unrealized P&L=${position.unrealized_pnl:.4f}"
+            "Position %s marked redeemable: unrealized P&L=$%.4f",
+            position_id,
+            position.unrealized_pnl,
         )
+
+    def mark_redeemable_many(self, position_ids: Iterable[str]) -> None:
+        """Mark several positions redeemable, persisting once."""
+        with self._batched():
+            for pid in position_ids:
+                self.mark_redeemable(pid)
     
+    def _index(self, position: Position) -> None:
+        """Add ``position`` to the secondary indexes for its current status."""
+        pid = position.position_id
+        self._by_condition.setdefault(position.condition_id, {})[pid] = position
+        self._by_strategy.setdefault(position.strategy, {})[pid] = position
+        if not position.is_closed:
+            self._hold(position)
+        if position.is_open:
+            self._open[pid] = position
+            self._open_by_condition.setdefault(position.condition_id, {})[pid] = position
+            bcid = (position.metadata or {}).get("bracket_condition_id")
+            if bcid:
+                brackets = self._bracket_index.setdefault(position.condition_id, {})
+                brackets.setdefault(bcid, {})[pid] = position
+            self._by_exit_policy[position.exit_policy][pid] = position
+        elif position.is_redeemable:
+            self._redeemable[pid] = position
+            self._redeemable_total += position.quantity
+        elif position.is_closed:
+            self._book_realized(position)
+
+    def _hold(self, position: Position, sign: int = 1) -> None:
+        """Add (or with ``sign=-1`` remove) a held position's cost basis."""
+        cost = position.cost_basis if sign > 0 else -position.cost_basis
+        self._held_cost_total += cost
+        for totals, key in (
+            (self._held_cost_by_condition, position.condition_id),
+            (self._held_cost_by_strategy, position.strategy),
+        ):
+            total, count = totals.get(key, (Decimal("0"), 0))
+            count += sign
+            if count:
+                totals[key] = (total + cost, count)
+            else:
+                del totals[key]
+
+    def _book_realized(self, position: Position, sign: int = 1) -> None:
+        """Add (or with ``sign=-1`` remove) a CLOSED position's realized P&L."""
+        self._closed_count += sign
+        pnl = position.realized_pnl
+        self._realized_total += pnl if sign > 0 else -pnl
+        strategy = position.strategy
+        self._realized_by_strategy[strategy] = (
+            self._realized_by_strategy.get(strategy, 0.0) + sign * float(pnl)
+        )
+
+    def _untrack_open(self, position: Position) -> None:
+        """Drop ``position`` from the OPEN indexes as it leaves OPEN."""
+        if self._open.pop(position.position_id, None) is None:
+            return
+        cid = position.condition_id
+        open_in_market = self._open_by_condition[cid]
+        del open_in_market[position.position_id]
+        if not open_in_market:
+            del self._open_by_condition[cid]
+        bcid = (position.metadata or {}).get("bracket_condition_id")
+        brackets = self._bracket_index.get(cid)
+        if bcid and brackets and bcid in brackets:
+            legs = brackets[bcid]
+            legs.pop(position.position_id, None)
+            if not legs:
+                del brackets[bcid]
+                if not brackets:
+                    del self._bracket_index[cid]
+        self._by_exit_policy[position.exit_policy].pop(position.position_id, None)
+        self._arb_group_pnl.pop(cid, None)
+
+    def _rebuild_indexes(self) -> None:
+        for index in (
+            self._open,
+            self._redeemable,
+            self._by_condition,
+            self._by_strategy,
+            self._open_by_condition,
+            self._bracket_index,
+            self._arb_group_pnl,
+            *self._by_exit_policy.values(),
+        ):
+            index.clear()
+        self._redeemable_total = Decimal("0")
+        self._held_cost_total = Decimal("0")
+        self._held_cost_by_condition = {}
+        self._held_cost_by_strategy = {}
+        self._closed_count = 0
+        self._realized_total = Decimal("0")
+        self._realized_by_strategy = {}
+        for p in self.positions.values():
+            self._index(p)
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every position mutation, for change detection."""
+        return self._version
+
+    @property
+    def open_arb_count(self) -> int:
+        """Number of OPEN positions whose strategy is in ARB_STRATEGIES."""
+        return len(self._by_exit_policy[EXIT_POLICY_HELD])
+
+    def get_individually_closeable_positions(self) -> list[Position]:
+        """Open positions that may be exited one at a time (non-arb)."""
+        return list(self._by_exit_policy[EXIT_POLICY_CLOSEABLE].values())
+
+    def get_held_to_resolution_positions(self) -> list[Position]:
+        """Open arb legs, which are only exited as a complete group."""
+        return list(self._by_exit_policy[EXIT_POLICY_HELD].values())
+
     def get_position(self, position_id: str) -> Position | None:
         """Get a position by ID."""
         return self.positions.get(position_id)
     
     def get_open_positions(self) -> list[Position]:
         """Get all open positions."""
-        return [p for p in self.positions.values() if p.is_open]
+        return list(self._open.values())
     
     def get_redeemable_positions(self) -> list[Position]:
         """Get all redeemable positions."""
-        return [p for p in self.positions.values() if p.is_redeemable]
+        return list(self._redeemable.values())
+
+    def get_redeemable_total(self) -> Decimal:
+        """Total shares across redeemable positions (their $ redemption value)."""
+        return self._redeemable_total
+
+    def get_redeemable_count(self) -> int:
+        """Number of redeemable positions."""
+        return len(self._redeemable)
+
+    def get_open_condition_ids(self) -> list[str]:
+        """Condition IDs with at least one open position."""
+        return list(self._open_by_condition)
+
+    def get_open_conditions(self) -> list[tuple[str, bool]]:
+        """``(condition_id, is_neg_risk_group)`` for markets with open positions."""
+        return [
+            (cid, next(iter(positions.values())).is_neg_risk_group)
+            for cid, positions in self._open_by_condition.items()
+        ]
+
+    def get_open_positions_by_condition(self, condition_id: str) -> list[Position]:
+        """Open positions in a specific market."""
+        return list(self._open_by_condition.get(condition_id, {}).values())
     
+    def get_bracket_map(self, group_condition_id: str) -> dict[str, list[Position]]:
+        """``bracket_condition_id`` -> open legs for an arb group."""
+        return {
+            bcid: list(legs.values())
+            for bcid, legs in self._bracket_index.get(group_condition_id, {}).items()
+        }
+
     def get_positions_by_condition(self, condition_id: str) -> list[Position]:
         """Get all positions for a specific market."""
-        return [p for p in self.positions.values() if p.condition_id == condition_id]
+        return list(self._by_condition.get(condition_id, {}).values())
     
     def get_positions_by_strategy(self, strategy: str) -> list[Position]:
         """Get all positions from a specific strategy."""
-        return [p for p in self.positions.values() if p.strategy == strategy]
+        return list(self._by_strategy.get(strategy, {}).values())
     
     def update_unrealized_pnl(self, price_data: dict[str, Decimal]) -> None:
         """Update unrealized P&L for all open positions.
@@ -279,79 +622,85 @@ class PositionManager:
         Args:
             price_data: Dict of token_id -> current_price
         """
-        open_positions = self.get_open_positions()
+        for _ in self.iter_positions_with_prices(price_data):
+            pass
+
+    def iter_positions_with_prices(
+        self,
+        price_data: dict[str, Decimal],
+    ) -> Iterator[tuple[Position, Decimal | None]]:
+        """Yield ``(position, current_price or None)`` for every open position.
 
+        Individually closeable positions come first, then arb legs. Unrealized
+        P&L is refreshed in the same pass (see update_unrealized_pnl).
+        Non-arb positions are updated before they are yielded. Arb groups are
+        valued once the iterator is exhausted, so consume it fully.
+        """
         # --- Multi-outcome arb: group-level P&L ---
         # Group arb positions by condition_id (= neg_risk_market_id).
         arb_groups: dict[str, list[Position]] = {}
-        non_arb: list[Position] = []
 
-        for position in open_positions:
-            if position.strategy in ("multi_outcome_arb", "conditional_arb"):
-                arb_groups.setdefault(position.condition_id, []).append(position)
-            else:
-                non_arb.append(position)
-
-        # For each arb group, the expected value is $1.00 × qty per execution
-        # (one bracket wins).  If the same group was executed N times (e.g.
-        # across restarts before the dedup fix), there are N × B positions
-        # (B = unique brackets).  We detect N by comparing total positions
-        # to the number of unique token_ids.
-        for _group_id, positions in arb_groups.items():
-            if not positions:
-                continue
-            qty = positions[0].quantity  # All brackets have the same size
-            unique_tokens = len({p.token_id for p in positions})
-            num_executions = max(1, len(positions) // unique_tokens) if unique_tokens else 1
-            group_cost = sum(p.entry_price * qty for p in positions)
-            group_value = Decimal("1.00") * qty * num_executions  # One winner per execution
-            group_pnl = group_value - group_cost
-            per_position_pnl = group_pnl / len(positions)
+        # --- All other strategies: standard per-token valuation ---
+        for position in list(self._by_exit_policy[EXIT_POLICY_CLOSEABLE].values()):
+            current_price = price_data.get(position.token_id)
+            if current_price is not None:
+                position.update_unrealized_pnl(current_price)
+            yield position, current_price
+
+        for position in list(self._by_exit_policy[EXIT_POLICY_HELD].values()):
+            arb_groups.setdefault(position.condition_id, []).append(position)
+            yield position, price_data.get(position.token_id)
+
+        for group_id, positions in arb_groups.items():
+            per_position_pnl = self._arb_group_pnl.get(group_id)
+            if per_position_pnl is None:
+                per_position_pnl = self._arb_group_pnl[group_id] = _arb_group_leg_pnl(positions)
             for p in positions:
                 p.unrealized_pnl = per_position_pnl
-
-        # --- All other strategies: standard per-token valuation ---
-        for position in non_arb:
-            if position.token_id in price_data:
-                position.update_unrealized_pnl(price_data[position.token_id])
     
     def get_portfolio_stats(self) -> dict[str, Any]:
-        """Get portfolio statistics."""
-        open_positions = self.get_open_positions()
-        closed_positions = [p for p in self.positions.values() if p.is_closed]
-        redeemable_positions = self.get_redeemable_positions()
+        """Get portfolio statistics.
 
+        Cost-basis and realized figures come from running totals kept as
+        positions open and close; only unrealized P&L, which moves every
+        tick, takes a pass over held (open + redeemable) positions. The
+        figures are for display, so they are returned (and the unrealized
+        pass summed) in float; per-trade P&L on each Position stays Decimal.
+        """
         # Breakdowns for risk/metrics.
-        cost_by_condition: dict[str, float] = {}
+        cost_by_condition = {k: float(v[0]) for k, v in self._held_cost_by_condition.items()}
+        cost_by_strategy = {k: float(v[0]) for k, v in self._held_cost_by_strategy.items()}
         pnl_by_condition: dict[str, float] = {}
-        cost_by_strategy: dict[str, float] = {}
-        realized_by_strategy: dict[str, float] = {}
         unrealized_by_strategy: dict[str, float] = {}
 
-        for p in open_positions + redeemable_positions:
-            cost_by_condition[p.condition_id] = cost_by_condition.get(p.condition_id, 0.0) + float(p.cost_basis)
-            pnl_by_condition[p.condition_id] = pnl_by_condition.get(p.condition_id, 0.0) + float(p.unrealized_pnl)
-
-            cost_by_strategy[p.strategy] = cost_by_strategy.get(p.strategy, 0.0) + float(p.cost_basis)
-            unrealized_by_strategy[p.strategy] = unrealized_by_strategy.get(p.strategy, 0.0) + float(p.unrealized_pnl)
+        total_unrealized_pnl = 0.0
+        total_cost_basis = float(self._held_cost_total)
+        for held in (self._open, self._redeemable):
+            for p in held.values():
+                unrealized_f = float(p.unrealized_pnl)
+                total_unrealized_pnl += unrealized_f
+                cid = p.condition_id
+                strategy = p.strategy
+                pnl_by_condition[cid] = pnl_by_condition.get(cid, 0.0) + unrealized_f
+                unrealized_by_strategy[strategy] = (
+                    unrealized_by_strategy.get(strategy, 0.0) + unrealized_f
+                )
 
-        for p in closed_positions:
-            realized_by_strategy[p.strategy] = realized_by_strategy.get(p.strategy, 0.0) + float(p.realized_pnl)
-        
-        total_realized_pnl = sum(p.realized_pnl for p in closed_positions)
-        total_unrealized_pnl = sum(p.unrealized_pnl for p in open_positions + redeemable_positions)
-        total_cost_basis = sum(p.cost_basis for p in open_positions + redeemable_positions)
+        total_realized_pnl = float(self._realized_total)
+        realized_by_strategy = dict(self._realized_by_strategy)
         
         return {
             "total_positions": len(self.positions),
-            "open_positions": len(open_positions),
-            "closed_positions": len(closed_positions),
-            "redeemable_positions": len(redeemable_positions),
-            "total_realized_pnl": float(total_realized_pnl),
-            "total_unrealized_pnl": float(total_unrealized_pnl),
-            "total_pnl": float(total_realized_pnl + total_unrealized_pnl),
-            "total_cost_basis": float(total_cost_basis),
-            "realized_roi": float((total_realized_pnl / total_cost_basis * 100) if total_cost_basis > 0 else Decimal("0")),
+            "open_positions": len(self._open),
+            "closed_positions": self._closed_count,
+            "redeemable_positions": len(self._redeemable),
+            "total_realized_pnl": total_realized_pnl,
+            "total_unrealized_pnl": total_unrealized_pnl,
+            "total_pnl": total_realized_pnl + total_unrealized_pnl,
+            "total_cost_basis": total_cost_basis,
+            "realized_roi": (
+                (total_realized_pnl / total_cost_basis * 100) if total_cost_basis > 0 else 0.0
+            ),
             "cost_by_condition": cost_by_condition,
             "unrealized_pnl_by_condition": pnl_by_condition,
             "by_strategy": {
@@ -361,37 +710,170 @@ class PositionManager:
             },
         }
     
+    def _mark_dirty(self, position_id: str) -> None:
+        """Persist a mutation now, or let the background flusher pick it up."""
+        self._version += 1
+        if self._batch_ids is not None:
+            self._batch_ids.add(position_id)
+            return
+        self._persist((position_id,))
+
+    @contextmanager
+    def _batched(self) -> Iterator[None]:
+        """Defer persistence of the mutations made inside the block to its end."""
+        if self._batch_ids is not None:
+            yield
+            return
+        self._batch_ids = set()
+        try:
+            yield
+        finally:
+            ids, self._batch_ids = self._batch_ids, None
+            if ids:
+                self._persist(ids)
+
+    def _persist(self, position_ids: Iterable[str]) -> None:
+        if self.save_interval_seconds <= 0 or self._flush_stop.is_set():
+            self._save_positions()
+            return
+        with self._dirty_lock:
+            self._dirty_ids.update(position_ids)
+        if self._flusher is None and self.storage_path:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="positions-flush", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        while not self._flush_stop.wait(self.save_interval_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        """Append pending changes to the log (or snapshot when it is due)."""
+        if not self._dirty_ids or not self.storage_path:
+            return
+        with self._save_lock:
+            with self._dirty_lock:
+                dirty, self._dirty_ids = self._dirty_ids, set()
+            if self._log_events + len(dirty) >= _SNAPSHOT_EVERY_EVENTS:
+                ok = self._write_snapshot()
+            else:
+                ok = self._append_log(dirty)
+            if not ok:
+                # Keep the batch pending so the next flush retries it.
+                with self._dirty_lock:
+                    self._dirty_ids |= dirty
+
+    def _append_log(self, dirty: set[str]) -> bool:
+        """Append upsert events for ``dirty``; callers hold _save_lock."""
+        try:
+            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._state_lock:
+                lines = b"".join(
+                    orjson.dumps(
+                        {"op": "upsert", "pos": self.positions[pid].to_dict()},
+                        default=str,
+                    )
+                    + b"\n"
+                    for pid in dirty
+                    if pid in self.positions
+                )
+            with open(self._log_path, "ab") as f:
+                f.write(lines)
+            self._log_events += len(dirty)
+            return True
+        except Exception as e:
+            log.error("Failed to append position log: %s", e)
+            return False
+
+    def close(self) -> None:
+        """Stop the background flusher and write any pending changes.
+
+        Later mutations are written through immediately.
+        """
+        self._flush_stop.set()
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+            atexit.unregister(self.close)
+        if self._dirty_ids or self._log_events:
+            self._save_positions()
+
     def _save_positions(self) -> None:
-        """Save positions to storage."""
+        """Save a full snapshot of all positions to storage."""
         if not self.storage_path:
             return
-        
+        with self._save_lock:
+            with self._dirty_lock:
+                dirty, self._dirty_ids = self._dirty_ids, set()
+            if not self._write_snapshot():
+                with self._dirty_lock:
+                    self._dirty_ids |= dirty
+
+    def _write_snapshot(self) -> bool:
+        """Write the snapshot (temp file, then rename) and drop the event log.
+
+        Callers hold _save_lock. Returns False if the write failed.
+        """
         try:
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                "positions": [p.to_dict() for p in self.positions.values()],
-                "next_position_id": self._next_position_id,
-            }
-            with open(self.storage_path, "w") as f:
+            with self._state_lock:
+                data = {
+                    "positions": [p.to_dict() for p in self.positions.values()],
+                    "next_position_id": self._next_position_id,
+                }
+            tmp_path = self.storage_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.storage_path)
+            self._log_path.unlink(missing_ok=True)
+            self._log_events = 0
+            return True
         except Exception as e:
-            log.error(f"Failed to save positions: {e}")
+            log.error("Failed to save positions: %s", e)
+            return False
     
     def _load_positions(self) -> None:
-        """Load positions from storage."""
+        """Load the positions snapshot, then replay the event log on top."""
         try:
-            with open(self.storage_path, "r") as f:
-                data = json.load(f)
+            data: dict[str, Any] = {}
+            if self.storage_path.exists():
+                with open(self.storage_path) as f:
+                    data = json.load(f)
             
             self.positions = {
                 p["position_id"]: Position.from_dict(p)
                 for p in data.get("positions", [])
             }
-            self._next_position_id = data.get("next_position_id", 1)
+            if self._log_path.exists():
+                self._replay_log()
+            # Ids are never reused, so the counter follows from the highest
+            # "pos_<n>" on record; the snapshot's stored value is only a floor
+            # (and kept in the file for older readers).
+            self._next_position_id = max(
+                data.get("next_position_id", 1),
+                max(map(_position_number, self.positions), default=0) + 1,
+            )
+            self._rebuild_indexes()
             
-            log.info(f"Loaded {len(self.positions)} positions from {self.storage_path}")
+            log.info("Loaded %d positions from %s", len(self.positions), self.storage_path)
         except Exception as e:
-            log.error(f"Failed to load positions: {e}")
+            log.error("Failed to load positions: %s", e)
+
+    def _replay_log(self) -> None:
+        with open(self._log_path, "rb") as f:
+            for line in f:
+                try:
+                    event = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A torn final line from a crash mid-append.
+                    log.warning("Skipping unreadable position log entry in %s", self._log_path)
+                    continue
+                if event.get("op") == "upsert":
+                    position = Position.from_dict(event["pos"])
+                    self.positions[position.position_id] = position
+                self._log_events += 1
 
     def reset_all_positions(self) -> None:
         """Clear all positions and persist an empty portfolio.
@@ -400,8 +882,10 @@ class PositionManager:
         first so that a failed write can never leave stale data behind.
         """
         stale_count = len(self.positions)
-        self.positions = {}
-        self._next_position_id = 1
+        with self._state_lock:
+            self.positions = {}
+            self._next_position_id = 1
+            self._rebuild_indexes()
 
         # Delete the old file *before* writing, so a crash can never leave
         # stale positions that get reloaded on the next start.
@@ -7,7 +7,9 @@ positions that can be closed or redeemed.
 from __future__ import annotations
 
 import logging
+import threading
 import time
+import zlib
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
@@ -17,6 +19,8 @@ from polymarket_bot.scanner import MarketScanner
 
 log = logging.getLogger(__name__)
 
+_ZERO = Decimal(0)  # exit price of a losing position
+
 
 @dataclass
 class ResolutionEvent:
@@ -36,14 +40,67 @@ class ResolutionMonitor:
         position_manager: PositionManager,
         scanner: MarketScanner,
         check_interval: float = 60.0,
+        rescan_ttl: float = 300.0,
+        unresolved_ttl: float = 300.0,
+        stagger: bool = False,
     ):
         self.position_manager = position_manager
         self.scanner = scanner
         self.check_interval = check_interval
+        # Unchanged markets are re-fetched at most once per rescan_ttl while
+        # no position has changed since their last scan.
+        self.rescan_ttl = rescan_ttl
+        # A market (or arb bracket) reported unresolved is not re-fetched by
+        # the periodic scan for unresolved_ttl seconds.
+        self.unresolved_ttl = unresolved_ttl
+        # With stagger, each market is checked every check_interval from its
+        # own stable offset, spreading scanner load across the window; the
+        # caller should then call check_resolutions() on every loop tick.
+        self.stagger = stagger
         
         # Track resolved markets
         self._resolved_markets: dict[str, ResolutionEvent] = {}
         self._last_check = 0.0
+        # condition_id -> (position_manager.version, time) of its last scan.
+        self._scan_state: dict[str, tuple[int, float]] = {}
+        # Negative cache: market / bracket id -> time its unresolved answer expires.
+        self._unresolved_until: dict[str, float] = {}
+        # Ids the last lookups returned nothing for; retried every tick.
+        self._failed_lookups: set[str] = set()
+        # condition_id -> next time it is due (stagger mode only).
+        self._due_at: dict[str, float] = {}
+
+        # Condition / asset ids named by ``market_resolved`` websocket events,
+        # checked on the next call regardless of check_interval.
+        self._hint_lock = threading.Lock()
+        self._resolution_hints: set[str] = set()
+
+    def notify_market_event(self, event: Any) -> None:
+        """Record ``market_resolved`` events from the market websocket channel.
+
+        Safe to call from the websocket thread.  The next
+        :meth:`check_resolutions` call checks just the affected markets
+        immediately; the periodic full scan remains the safety net.
+        """
+        items = event if isinstance(event, list) else [event]
+        ids: set[str] = set()
+        for item in items:
+            if not isinstance(item, dict) or item.get("event_type") != "market_resolved":
+                continue
+            for key in ("market", "condition_id", "asset_id", "winning_asset_id"):
+                value = item.get(key)
+                if value:
+                    ids.add(str(value))
+            for value in item.get("assets_ids") or item.get("asset_ids") or ():
+                ids.add(str(value))
+        if ids:
+            with self._hint_lock:
+                self._resolution_hints |= ids
+
+    @property
+    def has_pending_hints(self) -> bool:
+        """Whether a websocket resolution event is waiting to be checked."""
+        return bool(self._resolution_hints)
     
     def check_resolutions(self) -> list[ResolutionEvent]:
         """Check for newly resolved markets affecting open positions.
@@ -52,45 +109,118 @@ class ResolutionMonitor:
             List of new resolution events
         """
         now = time.time()
-        if now - self._last_check < self.check_interval:
+        with self._hint_lock:
+            hints, self._resolution_hints = self._resolution_hints, set()
+        # In stagger mode per-market due times replace the global gate.
+        periodic = self.stagger or now - self._last_check >= self.check_interval
+        if not periodic and not hints:
             return []
-        
-        self._last_check = now
+
+        if periodic and not self.stagger:
+            self._last_check = now
         new_events: list[ResolutionEvent] = []
         
-        # Get all open positions
-        open_positions = self.position_manager.get_open_positions()
-        if not open_positions:
+        # Markets with open positions, minus those already processed.  In a
+        # long-running bot most are resolved, so drop them before any
+        # per-market work (including hint matching).
+        resolved = self._resolved_markets
+        open_conditions = [
+            c for c in self.position_manager.get_open_conditions() if c[0] not in resolved
+        ]
+        # Markets named by a websocket hint are checked now, bypassing the
+        # interval, rescan and negative caches.
+        hinted = self._hinted_conditions(open_conditions, hints) if hints else []
+        forced = {condition_id for condition_id, _ in hinted}
+        if self.stagger:
+            # Forget schedules of markets that have no open positions any more.
+            if len(self._due_at) > len(open_conditions):
+                still_open = {condition_id for condition_id, _ in open_conditions}
+                for condition_id in self._due_at.keys() - still_open:
+                    del self._due_at[condition_id]
+            open_conditions = [
+                c for c in open_conditions if c[0] in forced or self._take_due(c[0], now)
+            ]
+        elif not periodic:
+            open_conditions = hinted
+        if not open_conditions:
             return []
         
-        # Get unique condition IDs
-        condition_ids = list(set(p.condition_id for p in open_positions))
+        log.debug("Checking resolution status for %d markets", len(open_conditions))
         
-        log.debug(f"Checking resolution status for {len(condition_ids)} markets")
-        
-        for condition_id in condition_ids:
-            # Skip if already processed
-            if condition_id in self._resolved_markets:
+        version = self.position_manager.version
+        market_ids: list[str] = []
+        groups: dict[str, dict[str, list[Position]]] = {}
+        for condition_id, is_neg_risk_group in open_conditions:
+            # Skip markets scanned recently with no position change since,
+            # unless a websocket hint points at them.
+            state = self._scan_state.get(condition_id)
+            if (
+                condition_id not in forced
+                and state is not None
+                and state[0] == version
+                and now - state[1] < self.rescan_ttl
+            ):
                 continue
 
             # negRisk group IDs (e.g. "0xb9aa...") are not individual Gamma
             # market IDs — check per-bracket instead via _check_arb_brackets.
-            if condition_id.startswith("0x"):
-                bracket_events = self._check_arb_brackets(condition_id, now)
-                new_events.extend(bracket_events)
+            if is_neg_risk_group:
+                bracket_cids = self._pending_brackets(condition_id)
+                if condition_id not in forced:
+                    bracket_cids = {
+                        bcid: legs for bcid, legs in bracket_cids.items()
+                        if not self._known_unresolved(bcid, now)
+                    }
+                if bracket_cids:
+                    groups[condition_id] = bracket_cids
+                continue
+
+            if condition_id not in forced and self._known_unresolved(condition_id, now):
                 continue
-            
-            # Check market status
-            market = self.scanner.get_market(condition_id)
+            market_ids.append(condition_id)
+
+        if not market_ids and not groups:
+            return new_events
+
+        # Plain markets and every arb bracket share one scanner round trip.
+        all_ids = list(dict.fromkeys(
+            market_ids + [bcid for bracket_cids in groups.values() for bcid in bracket_cids]
+        ))
+        markets = self._fetch_markets(all_ids)
+
+        for group_condition_id, bracket_cids in groups.items():
+            new_events.extend(
+                self._check_arb_brackets(group_condition_id, now, bracket_cids, markets)
+            )
+
+        # Ids with no market data from either the batch or the token-id
+        # fallback (which adds its finds to ``markets``) are reported and kept
+        # out of the rescan cache, so the next periodic tick retries them.
+        # Brackets of a group that just settled no longer matter.
+        failed = {mid for mid in all_ids if mid not in markets}
+        for group_condition_id, bracket_cids in groups.items():
+            if group_condition_id in self._resolved_markets:
+                failed.difference_update(bracket_cids)
+            elif failed.isdisjoint(bracket_cids):
+                self._scan_state[group_condition_id] = (version, now)
+        self._record_failed_lookups(all_ids, failed)
+        for condition_id in market_ids:
+            if condition_id not in failed:
+                self._scan_state[condition_id] = (version, now)
+
+        for condition_id in market_ids:
+            market = markets.get(condition_id)
             if not market:
                 continue
-            
-            if market.resolved and market.winning_outcome:
+            if not market.resolved:
+                self._unresolved_until[condition_id] = now + self.unresolved_ttl
+                continue
+
+            if market.winning_outcome:
                 # Market has resolved!
                 affected_positions = [
                     p.position_id
-                    for p in self.position_manager.get_positions_by_condition(condition_id)
-                    if p.is_open
+                    for p in self.position_manager.get_open_positions_by_condition(condition_id)
                 ]
                 
                 event = ResolutionEvent(
@@ -102,12 +232,16 @@ class ResolutionMonitor:
                 )
                 
                 self._resolved_markets[condition_id] = event
+                self._scan_state.pop(condition_id, None)
+                self._due_at.pop(condition_id, None)
+                self._unresolved_until.pop(condition_id, None)
                 new_events.append(event)
                 
                 log.warning(
-                    f"🎯 Market resolved: {market.question[:50]}... "
-                    f"Winner: {market.winning_outcome}, "
-                    f"Affects {len(affected_positions)} positions"
+                    "🎯 Market resolved: %s... Winner: %s, Affects %d positions",
+                    market.question[:50],
+                    market.winning_outcome,
+                    len(affected_positions),
                 )
                 
                 # Mark winning positions as redeemable
@@ -115,7 +249,103 @@ class ResolutionMonitor:
         
         return new_events
 
-    def _check_arb_brackets(self, group_condition_id: str, now: float) -> list[ResolutionEvent]:
+    def _record_failed_lookups(self, requested: list[str], failed: set[str]) -> None:
+        """Track lookups that returned no market, warning when an id first fails."""
+        new_failures = failed - self._failed_lookups
+        self._failed_lookups.difference_update(requested)
+        self._failed_lookups |= failed
+        if new_failures:
+            log.warning(
+                "No market data for %d id(s) (%s); retrying next check",
+                len(new_failures),
+                ", ".join(sorted(new_failures)[:5]),
+            )
+
+    def _take_due(self, condition_id: str, now: float) -> bool:
+        """Stagger mode: whether ``condition_id`` is due, scheduling its next check.
+
+        A market first seen is scheduled at a stable offset (a hash of its id)
+        within check_interval, so markets opened together don't poll together.
+        """
+        due = self._due_at.get(condition_id)
+        if due is None:
+            window = max(1, int(self.check_interval))
+            due = now + zlib.crc32(condition_id.encode()) % window
+        if due > now:
+            self._due_at[condition_id] = due
+            return False
+        self._due_at[condition_id] = now + self.check_interval
+        return True
+
+    def _known_unresolved(self, market_id: str, now: float) -> bool:
+        """Whether ``market_id`` was reported unresolved within unresolved_ttl."""
+        until = self._unresolved_until.get(market_id)
+        if until is None:
+            return False
+        if until > now:
+            return True
+        del self._unresolved_until[market_id]
+        return False
+
+    def _hinted_conditions(
+        self, open_conditions: list[tuple[str, bool]], hints: set[str],
+    ) -> list[tuple[str, bool]]:
+        """Open conditions that a websocket resolution hint refers to.
+
+        A hint may name the condition itself, a held token, or (for arb
+        groups) one of the group's bracket condition ids.
+        """
+        matched: list[tuple[str, bool]] = []
+        for condition_id, is_neg_risk_group in open_conditions:
+            if condition_id in hints or any(
+                p.token_id in hints
+                or (p.metadata or {}).get("bracket_condition_id") in hints
+                for p in self.position_manager.get_open_positions_by_condition(condition_id)
+            ):
+                matched.append((condition_id, is_neg_risk_group))
+        return matched
+
+    def _fetch_markets(self, market_ids: list[str]) -> dict[str, Any]:
+        """Look up markets by id, in one round trip where the scanner supports it.
+
+        Falls back to per-id ``get_market`` calls when the scanner has no bulk
+        lookup or the bulk call fails; ids that cannot be fetched are omitted.
+        """
+        if not market_ids:
+            return {}
+        get_markets = getattr(self.scanner, "get_markets", None)
+        if callable(get_markets):
+            try:
+                return get_markets(market_ids)
+            except Exception as e:
+                log.debug("Bulk market lookup failed, fetching individually: %s", e)
+
+        markets: dict[str, Any] = {}
+        for market_id in market_ids:
+            try:
+                market = self.scanner.get_market(market_id)
+            except Exception as e:
+                log.debug("Market lookup failed for %s: %s", market_id, e)
+                market = None
+            if market is not None:
+                markets[market_id] = market
+        return markets
+
+    def _pending_brackets(self, group_condition_id: str) -> dict[str, list[Position]]:
+        """Map each unresolved bracket condition_id of an arb group to its positions."""
+        return {
+            bcid: legs
+            for bcid, legs in self.position_manager.get_bracket_map(group_condition_id).items()
+            if bcid not in self._resolved_markets
+        }
+
+    def _check_arb_brackets(
+        self,
+        group_condition_id: str,
+        now: float,
+        bracket_cids: dict[str, list[Position]] | None = None,
+        markets: dict[str, Any] | None = None,
+    ) -> list[ResolutionEvent]:
         """Check per-bracket resolution for multi-outcome / conditional arb groups.
 
         Each arb position stores a ``bracket_condition_id`` in its metadata
@@ -124,21 +354,18 @@ class ResolutionMonitor:
         we process the entire group:
         - The winning bracket's position is marked redeemable ($1/share).
         - All other brackets in the same group are closed at $0.
+
+        ``bracket_cids`` and ``markets`` may be supplied by the caller when the
+        lookups were already batched with other markets.
         """
         events: list[ResolutionEvent] = []
-        positions = [
-            p for p in self.position_manager.get_positions_by_condition(group_condition_id)
-            if p.is_open
-        ]
+        positions = self.position_manager.get_open_positions_by_condition(group_condition_id)
         if not positions:
             return events
 
         # Collect unique bracket condition_ids we haven't checked yet.
-        bracket_cids: dict[str, list[Position]] = {}
-        for p in positions:
-            bcid = (p.metadata or {}).get("bracket_condition_id")
-            if bcid and bcid not in self._resolved_markets:
-                bracket_cids.setdefault(bcid, []).append(p)
+        if bracket_cids is None:
+            bracket_cids = self._pending_brackets(group_condition_id)
 
         if not bracket_cids:
             return events
@@ -148,15 +375,24 @@ class ResolutionMonitor:
             len(bracket_cids), group_condition_id[:12],
         )
 
+        if markets is None:
+            markets = self._fetch_markets(list(bracket_cids))
+
         resolved_winner: str | None = None
         resolved_market = None
         resolved_bcid: str | None = None
 
-        for bcid, bracket_positions in bracket_cids.items():
-            try:
-                market = self.scanner.get_market(bcid)
-            except Exception:
-                market = None
+        def _likely_resolved_first(item: tuple[str, list[Position]]) -> tuple[bool, bool, float]:
+            # Brackets already fetched come first, longest-past end date first;
+            # those needing a token-id lookup (extra requests) come last.
+            market = markets.get(item[0])
+            if market is None:
+                return (True, True, 0.0)
+            hours = MarketScanner.hours_to_resolution(market.end_date)
+            return (False, hours is None, hours or 0.0)
+
+        for bcid, bracket_positions in sorted(bracket_cids.items(), key=_likely_resolved_first):
+            market = markets.get(bcid)
 
             # Fallback: resolve bracket market by token_id if condition-id lookup
             # isn't available in Gamma for this bracket id format.
@@ -169,11 +405,15 @@ class ResolutionMonitor:
                         except Exception:
                             market = None
                         if market is not None:
+                            markets[bcid] = market
                             break
 
             if not market:
                 continue
-            if market.resolved:
+            if not market.resolved:
+                self._unresolved_until[bcid] = now + self.unresolved_ttl
+            else:
+                self._unresolved_until.pop(bcid, None)
                 log.warning(
                     "🎯 Arb bracket resolved: %s  winner=%s  group=%s",
                     market.question[:50],
@@ -198,59 +438,66 @@ class ResolutionMonitor:
             affected_positions=affected,
         )
         self._resolved_markets[group_condition_id] = event
+        self._scan_state.pop(group_condition_id, None)
+        self._due_at.pop(group_condition_id, None)
         events.append(event)
 
-        # Determine which positions are winners vs losers.
+        # Determine which positions are winners vs losers.  Arb strategies
+        # buy YES on each bracket; the winning bracket is simply the resolved
+        # bracket condition_id, regardless of the stored `outcome` label
+        # (which may be UNKNOWN in legacy entries).
+        winners: list[Position] = []
+        losers: list[Position] = []
         for p in positions:
             p_bcid = (p.metadata or {}).get("bracket_condition_id")
-            # Arb strategies buy YES on each bracket; the winning bracket is
-            # simply the resolved bracket condition_id, regardless of the
-            # stored `outcome` label (which may be UNKNOWN in legacy entries).
-            if p_bcid == resolved_bcid:
-                # This bracket won — shares worth $1.
-                self.position_manager.mark_redeemable(p.position_id)
-                log.info(
-                    "✅ Arb bracket winner: %s  qty=%.2f  cost=$%.4f",
-                    p.position_id, float(p.quantity), float(p.cost_basis),
-                )
-            else:
-                # All other brackets lose — shares worth $0.
-                self.position_manager.close_position(
-                    p.position_id, exit_price=Decimal("0"),
-                )
-                log.info(
-                    "❌ Arb bracket loser: %s  P&L=$%.4f",
-                    p.position_id, float(p.realized_pnl),
-                )
+            (winners if p_bcid == resolved_bcid else losers).append(p)
+
+        # This bracket won — shares worth $1; all others lose — worth $0.
+        self.position_manager.mark_redeemable_many(p.position_id for p in winners)
+        self.position_manager.close_positions_many(
+            (p.position_id for p in losers), exit_price=_ZERO,
+        )
+        for p in winners:
+            log.info(
+                "✅ Arb bracket winner: %s  qty=%.2f  cost=$%.4f",
+                p.position_id, p.quantity, p.cost_basis,
+            )
+        for p in losers:
+            log.info(
+                "❌ Arb bracket loser: %s  P&L=$%.4f",
+                p.position_id, p.realized_pnl,
+            )
 
         return events
     
     def _process_resolution(self, event: ResolutionEvent, market: Any) -> None:
         """Process a resolution event and update positions."""
-        positions = self.position_manager.get_positions_by_condition(event.condition_id)
+        positions = self.position_manager.get_open_positions_by_condition(event.condition_id)
+        winning_outcome = event.winning_outcome.upper()
         
+        winners: list[Position] = []
+        losers: list[Position] = []
         for position in positions:
-            if not position.is_open:
-                continue
-            
             # Check if this position is on the winning side
-            if position.outcome.upper() == event.winning_outcome.upper():
-                # Winning position - mark as redeemable
-                self.position_manager.mark_redeemable(position.position_id)
-                log.info(
-                    f"✅ Position {position.position_id} is a WINNER! "
-                    f"Can redeem {position.quantity} shares @ $1.00"
-                )
-            else:
-                # Losing position - close at $0
-                self.position_manager.close_position(
-                    position.position_id,
-                    exit_price=Decimal("0"),
-                )
-                log.info(
-                    f"❌ Position {position.position_id} lost. "
-                    f"P&L: ${position.realized_pnl:.4f}"
-                )
+            (winners if position.outcome_upper == winning_outcome else losers).append(position)
+
+        # Winning positions are redeemable; losing positions close at $0.
+        self.position_manager.mark_redeemable_many(p.position_id for p in winners)
+        self.position_manager.close_positions_many(
+            (p.position_id for p in losers), exit_price=_ZERO,
+        )
+        for position in winners:
+            log.info(
+                "✅ Position %s is a WINNER! Can redeem %s shares @ $1.00",
+                position.position_id,
+                position.quantity,
+            )
+        for position in losers:
+            log.info(
+                "❌ Position %s lost. P&L: $%.4f",
+                position.position_id,
+                position.realized_pnl,
+            )
     
     def get_resolution_event(self, condition_id: str) -> ResolutionEvent | None:
         """Get resolution event for a market."""
@@ -262,13 +509,13 @@ class ResolutionMonitor:
     
     def get_redeemable_value(self) -> Decimal:
         """Get total value of redeemable positions."""
-        redeemable = self.position_manager.get_redeemable_positions()
-        return sum(p.quantity for p in redeemable)  # Each share is worth $1
+        return self.position_manager.get_redeemable_total()  # Each share is worth $1
     
     def get_stats(self) -> dict[str, Any]:
         """Get resolution monitoring statistics."""
         return {
             "resolved_markets": len(self._resolved_markets),
-            "redeemable_positions": len(self.position_manager.get_redeemable_positions()),
+            "failed_lookups": len(self._failed_lookups),
+            "redeemable_positions": self.position_manager.get_redeemable_count(),
             "redeemable_value": float(self.get_redeemable_value()),
         }
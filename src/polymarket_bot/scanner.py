@@ -6,6 +6,7 @@ and provide real-time data to trading strategies.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
@@ -13,8 +14,11 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 
+import httpx
+import orjson
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from tenacity import AsyncRetrying, RetryError, retry, stop_after_attempt, wait_random_exponential
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +34,38 @@ DEFAULT_FETCH_LIMIT = 10000
 # If we fetch within this many markets of the limit, warn the user
 LIMIT_WARNING_THRESHOLD = 10
 
+# Max IDs per bulk /markets lookup, keeping request URLs well under server limits.
+GAMMA_BATCH_SIZE = 100
+
+# Max concurrent Gamma connections for get_markets_async().
+ASYNC_MAX_CONNECTIONS = 16
+
+# Circuit breaker: after this many consecutive failed Gamma calls (each one
+# already retried), fail fast for GAMMA_CIRCUIT_COOLDOWN_SECONDS.
+GAMMA_FAILURE_THRESHOLD = 5
+GAMMA_CIRCUIT_COOLDOWN_SECONDS = 30.0
+
+
+_D0 = Decimal(0)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Decimal from a Gamma number; ints and numeric strings skip the str() round trip."""
+    kind = type(value)
+    if kind is str or kind is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _dec_or_none(data: dict[str, Any], key: str) -> Decimal | None:
+    """Optional reward / spread field (may be absent or null)."""
+    value = data.get(key)
+    return _to_decimal(value) if value is not None else None
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Gamma while the scanner's circuit is open."""
+
 
 @dataclass(frozen=True)
 class MarketInfo:
@@ -86,15 +122,40 @@ class MarketScanner:
         self._markets_cache_by_token: dict[str, MarketInfo] = {}
         self._last_refresh = 0.0
         self._refresh_interval = 60.0  # Cache for 60 seconds
+        # Keep-alive session so repeated Gamma calls reuse TCP/TLS connections.
+        # Retries stay with tenacity on _get, so the adapter doesn't retry.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+        )
+        # Consecutive outage-like failures and when the open circuit closes.
+        self._failure_count = 0
+        self._circuit_open_until = 0.0
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a GET request to Gamma API with retries."""
+        """Make a GET request to Gamma API with retries, failing fast during outages."""
+        self._check_circuit(endpoint)
+        try:
+            result = self._get_with_retry(endpoint, params)
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._failure_count = 0
+        return result
+
+    @retry(stop=stop_after_attempt(3), wait=wait_random_exponential(multiplier=1, max=10))
+    def _get_with_retry(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         url = f"{self.api_base}{endpoint}"
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.HTTPError as e:
             log.error(f"HTTP error fetching {endpoint}: {e.response.status_code} - {e.response.text}")
             raise
@@ -102,6 +163,33 @@ class MarketScanner:
             log.error(f"Request failed for {endpoint}: {e}")
             raise
 
+    def _check_circuit(self, endpoint: str) -> None:
+        if time.monotonic() < self._circuit_open_until:
+            raise CircuitOpenError(f"Gamma circuit open; skipped {endpoint}")
+
+    def _record_failure(self, error: BaseException) -> None:
+        """Count an outage-like failure, opening the circuit at the threshold.
+
+        Client errors (4xx, e.g. an unknown market id) mean Gamma is up, so
+        they reset the count instead.
+        """
+        if isinstance(error, RetryError):
+            error = error.last_attempt.exception() or error
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        if status is not None and status < 500:
+            self._failure_count = 0
+            return
+        self._failure_count += 1
+        if self._failure_count >= GAMMA_FAILURE_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + GAMMA_CIRCUIT_COOLDOWN_SECONDS
+            self._failure_count = 0
+            log.warning(
+                "Gamma API failing (%d consecutive errors); pausing requests for %.0fs",
+                GAMMA_FAILURE_THRESHOLD,
+                GAMMA_CIRCUIT_COOLDOWN_SECONDS,
+            )
+
     def get_all_markets(self, limit: int | None = None, active_only: bool = True) -> list[MarketInfo]:
         """Fetch all markets from Gamma API.
         
@@ -131,15 +219,7 @@ class MarketScanner:
                 params["closed"] = False  # Exclude resolved / settled markets
             response = self._get("/markets", params=params)
             
-            markets = []
-            parse_errors = 0
-            for market_data in response:
-                try:
-                    markets.append(self._parse_market(market_data))
-                except Exception as e:
-                    parse_errors += 1
-                    log.debug(f"Failed to parse market: {e}")
-                    continue
+            markets, parse_errors = self._parse_markets_batch(response)
             
             # Log comprehensive stats (debug — fires every scan cycle)
             log.debug(
@@ -169,6 +249,10 @@ class MarketScanner:
             except Exception as e:
                 log.debug(f"Primary market lookup failed for {condition_id}: {e}")
 
+        return self._get_market_by_condition_id(condition_id)
+
+    def _get_market_by_condition_id(self, condition_id: str) -> MarketInfo | None:
+        """Resolve a market from the (refreshed) market list by condition id."""
         # Fallback path: Gamma /markets/{id} may reject condition_id-style hashes
         # with 422. In that case, resolve by scanning market lists and matching
         # the `conditionId` field directly.
@@ -194,6 +278,157 @@ class MarketScanner:
         log.error("Failed to fetch market %s via both id and condition-id lookup", condition_id)
         return None
 
+    def get_markets(self, market_ids: list[str]) -> dict[str, MarketInfo]:
+        """Fetch several markets in as few requests as possible.
+
+        Plain Gamma market IDs go through ``/markets?id=...`` and 0x-style
+        condition ids through ``/markets?condition_ids=...``, in chunks of
+        GAMMA_BATCH_SIZE. Returns a dict keyed by the requested IDs; any ID
+        the batches don't cover falls back to get_market() one at a time.
+        """
+        found: dict[str, MarketInfo] = {}
+        unique = [str(mid) for mid in dict.fromkeys(market_ids)]
+        by_id = [mid for mid in unique if not mid.startswith("0x")]
+        by_condition = {mid.lower(): mid for mid in unique if mid.startswith("0x")}
+
+        wanted = set(by_id)
+        for params in self._bulk_params(by_id, list(by_condition)):
+            self._collect_bulk(self._get_batch(params), wanted, by_condition, found)
+
+        for mid in unique:
+            if mid not in found:
+                market = self.get_market(mid)
+                if market is not None:
+                    found[mid] = market
+        return found
+
+    async def get_markets_async(
+        self,
+        market_ids: list[str],
+        http: httpx.AsyncClient | None = None,
+    ) -> dict[str, MarketInfo]:
+        """Async variant of get_markets() that issues its requests concurrently.
+
+        The bulk chunks are fetched together, then IDs they missed are looked
+        up in parallel via ``/markets/{id}``. Condition-id fallbacks (which
+        refresh the synchronous market cache) run on one worker thread.
+        Pass ``http`` to share an AsyncClient across calls.
+        """
+        found: dict[str, MarketInfo] = {}
+        unique = [str(mid) for mid in dict.fromkeys(market_ids)]
+        by_id = [mid for mid in unique if not mid.startswith("0x")]
+        by_condition = {mid.lower(): mid for mid in unique if mid.startswith("0x")}
+
+        client = http or httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS),
+        )
+        try:
+            batches = await asyncio.gather(*(
+                self._aget_batch(client, params)
+                for params in self._bulk_params(by_id, list(by_condition))
+            ))
+            wanted = set(by_id)
+            for rows in batches:
+                self._collect_bulk(rows, wanted, by_condition, found)
+
+            missing = [mid for mid in by_id if mid not in found]
+            markets = await asyncio.gather(*(
+                self._aget_market(client, mid) for mid in missing
+            ))
+            found.update((mid, m) for mid, m in zip(missing, markets) if m is not None)
+        finally:
+            if http is None:
+                await client.aclose()
+
+        unresolved = [mid for mid in unique if mid not in found]
+        if unresolved:
+            fallback = await asyncio.to_thread(
+                lambda: {mid: self._get_market_by_condition_id(mid) for mid in unresolved}
+            )
+            found.update((mid, m) for mid, m in fallback.items() if m is not None)
+        return {mid: found[mid] for mid in unique if mid in found}
+
+    @staticmethod
+    def _bulk_params(by_id: list[str], condition_ids: list[str]) -> list[dict[str, Any]]:
+        """Query params for the bulk /markets requests covering the given IDs."""
+        params: list[dict[str, Any]] = []
+        for key, ids in (("id", by_id), ("condition_ids", condition_ids)):
+            for start in range(0, len(ids), GAMMA_BATCH_SIZE):
+                chunk = ids[start:start + GAMMA_BATCH_SIZE]
+                params.append({key: chunk, "limit": len(chunk)})
+        return params
+
+    def _collect_bulk(
+        self,
+        rows: list[dict[str, Any]],
+        by_id: set[str],
+        by_condition: dict[str, str],
+        found: dict[str, MarketInfo],
+    ) -> None:
+        """Match bulk /markets rows to the requested IDs (condition ids case-insensitively)."""
+        for data in rows:
+            mid = str(data.get("id", ""))
+            if mid in by_id:
+                found[mid] = self._parse_market(data)
+                continue
+            cid = str(data.get("conditionId") or data.get("condition_id") or "").lower()
+            requested = by_condition.get(cid)
+            if requested is not None:
+                found[requested] = self._parse_market(data)
+
+    def _get_batch(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """One bulk /markets request; an empty list on any failure."""
+        try:
+            response = self._get("/markets", params=params)
+        except Exception as e:
+            log.debug("Bulk market lookup failed (%s): %s", ", ".join(params), e)
+            return []
+        return response if isinstance(response, list) else []
+
+    async def _aget(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Async GET against Gamma with the same retry and circuit policy as _get."""
+        self._check_circuit(endpoint)
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_random_exponential(multiplier=1, max=10),
+                reraise=True,
+            ):
+                with attempt:
+                    response = await client.get(f"{self.api_base}{endpoint}", params=params)
+                    response.raise_for_status()
+                    result = orjson.loads(response.content)
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._failure_count = 0
+        return result
+
+    async def _aget_batch(
+        self, client: httpx.AsyncClient, params: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Async bulk /markets request; an empty list on any failure."""
+        try:
+            response = await self._aget(client, "/markets", params=params)
+        except Exception as e:
+            log.debug("Bulk market lookup failed (%s): %s", ", ".join(params), e)
+            return []
+        return response if isinstance(response, list) else []
+
+    async def _aget_market(self, client: httpx.AsyncClient, market_id: str) -> MarketInfo | None:
+        """Async ``/markets/{id}`` lookup; None on failure."""
+        try:
+            return self._parse_market(await self._aget(client, f"/markets/{market_id}"))
+        except Exception as e:
+            log.debug("Primary market lookup failed for %s: %s", market_id, e)
+            return None
+
     def get_market_by_token(self, token_id: str) -> MarketInfo | None:
         """Fetch market containing a specific CLOB token_id."""
         # Direct Gamma lookup by token id is the most reliable path for negRisk
@@ -263,14 +498,8 @@ class MarketScanner:
             # Look for closed/resolved markets
             response = self._get("/markets", params={"limit": fetch_limit, "closed": True})
             
-            markets = []
-            for market_data in response:
-                try:
-                    market = self._parse_market(market_data)
-                    if market.resolved:
-                        markets.append(market)
-                except Exception:
-                    continue
+            parsed, _ = self._parse_markets_batch(response)
+            markets = [market for market in parsed if market.resolved]
                     
             log.debug(f"Found {len(markets)} resolved markets (limit={fetch_limit})")
             return markets
@@ -393,6 +622,24 @@ class MarketScanner:
             log.error("Failed to fetch short-duration markets: %s", e)
             return []
 
+    def _parse_markets_batch(self, rows: list[dict[str, Any]]) -> tuple[list[MarketInfo], int]:
+        """Parse a /markets response, skipping bad rows.
+
+        Returns:
+            (parsed markets, number of rows that failed to parse)
+        """
+        parse = self._parse_market
+        markets: list[MarketInfo] = []
+        append = markets.append
+        parse_errors = 0
+        for market_data in rows:
+            try:
+                append(parse(market_data))
+            except Exception as e:
+                parse_errors += 1
+                log.debug("Failed to parse market: %s", e)
+        return markets, parse_errors
+
     def _parse_market(self, data: dict[str, Any]) -> MarketInfo:
         """Parse market data from Gamma API response.
 
@@ -403,7 +650,6 @@ class MarketScanner:
         - ``outcomePrices`` (JSON str): e.g. '["0.55", "0.45"]'
         - ``clobTokenIds`` (JSON str): e.g. '["abc123...", "def456..."]'
         """
-        import json as _json
 
         # Parse token data from the three parallel JSON arrays
         tokens: list[TokenInfo] = []
@@ -413,9 +659,11 @@ class MarketScanner:
             prices_raw = data.get("outcomePrices") or "[]"
             token_ids_raw = data.get("clobTokenIds") or "[]"
 
-            outcomes = _json.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
-            prices = _json.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
-            token_ids = _json.loads(token_ids_raw) if isinstance(token_ids_raw, str) else token_ids_raw
+            outcomes = orjson.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
+            prices = orjson.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
+            token_ids = token_ids_raw
+            if isinstance(token_ids_raw, str):
+                token_ids = orjson.loads(token_ids_raw)
 
             # Also pull per-token volume from the newer ``tokens`` field if present
             tokens_extra: list[dict] = data.get("tokens", []) or []
@@ -425,37 +673,32 @@ class MarketScanner:
                     tid = str(tex.get("token_id", ""))
                     vol = tex.get("volume", 0)
                     if tid:
-                        volume_by_id[tid] = Decimal(str(vol))
+                        volume_by_id[tid] = _to_decimal(vol)
                     if bool(tex.get("winner", False)) and winner_outcome_from_tokens is None:
                         winner_outcome_from_tokens = str(tex.get("outcome") or "").upper() or None
 
+            n_ids = len(token_ids)
+            n_prices = len(prices)
             for i, outcome in enumerate(outcomes):
-                token_id = str(token_ids[i]) if i < len(token_ids) else ""
-                price = Decimal(str(prices[i])) if i < len(prices) else Decimal("0")
-                volume = volume_by_id.get(token_id, Decimal("0"))
+                token_id = str(token_ids[i]) if i < n_ids else ""
                 tokens.append(TokenInfo(
                     token_id=token_id,
                     outcome=str(outcome),
-                    price=price,
-                    volume=volume,
+                    price=_to_decimal(prices[i]) if i < n_prices else _D0,
+                    volume=volume_by_id.get(token_id, _D0),
                 ))
         except Exception as e:
             log.debug("Token parsing fallback for market %s: %s", data.get("conditionId", "?")[:12], e)
 
         # Use total market volume as fallback for per-token volume
-        market_volume = Decimal(str(data.get("volume", 0)))
+        market_volume = _to_decimal(data.get("volume", 0))
         if tokens and all(t.volume == 0 for t in tokens):
-            per_token = market_volume / len(tokens) if len(tokens) > 0 else Decimal("0")
+            per_token = market_volume / len(tokens)
             tokens = [
                 TokenInfo(token_id=t.token_id, outcome=t.outcome, price=t.price, volume=per_token)
                 for t in tokens
             ]
 
-        # Parse optional reward / spread fields (may be absent or null)
-        def _dec_or_none(key: str) -> Decimal | None:
-            v = data.get(key)
-            return Decimal(str(v)) if v is not None else None
-
         # Gamma has used multiple field names across payload variants.
         winning_outcome = (
             data.get("winning_outcome")
@@ -473,20 +716,20 @@ class MarketScanner:
             end_date=data.get("endDate") or data.get("endDateIso") or data.get("end_date_iso"),
             tokens=tokens,
             volume=market_volume,
-            liquidity=Decimal(str(data.get("liquidity", 0))),
+            liquidity=_to_decimal(data.get("liquidity", 0)),
             active=bool(data.get("active", True)),
             closed=bool(data.get("closed", False)),
             resolved=bool(data.get("resolved", False)),
             winning_outcome=winning_outcome,
             neg_risk_market_id=data.get("negRiskMarketID") or data.get("neg_risk_market_id"),
             group_item_title=data.get("groupItemTitle") or data.get("group_item_title"),
-            rewards_min_size=_dec_or_none("rewardsMinSize"),
-            rewards_max_spread=_dec_or_none("rewardsMaxSpread"),
-            rewards_daily_rate=_dec_or_none("rewardsDailyRate"),
-            spread=_dec_or_none("spread"),
+            rewards_min_size=_dec_or_none(data, "rewardsMinSize"),
+            rewards_max_spread=_dec_or_none(data, "rewardsMaxSpread"),
+            rewards_daily_rate=_dec_or_none(data, "rewardsDailyRate"),
+            spread=_dec_or_none(data, "spread"),
             one_day_price_change=float(data["oneDayPriceChange"]) if data.get("oneDayPriceChange") is not None else None,
-            best_bid=_dec_or_none("bestBid"),
-            best_ask=_dec_or_none("bestAsk"),
+            best_bid=_dec_or_none(data, "bestBid"),
+            best_ask=_dec_or_none(data, "bestAsk"),
             series_ticker=data.get("seriesSlug") or None,
             event_start_time=data.get("eventStartTime") or None,
             fee_type=data.get("feeType") or None,
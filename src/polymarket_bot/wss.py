@@ -59,7 +59,8 @@ class MarketWssClient:
                 pass
 
     def _on_open(self, ws: WebSocketApp) -> None:
-        msg = {"assets_ids": self.asset_ids, "type": "market"}
+        # custom_feature_enabled opts in to market_resolved events.
+        msg = {"assets_ids": self.asset_ids, "type": "market", "custom_feature_enabled": True}
         ws.send(json.dumps(msg))
 
         def _ping() -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from decimal import Decimal
 from pathlib import Path
 
@@ -89,3 +90,87 @@ def test_manual_adjustment_applies_without_restart(tmp_path: Path):
     )
     assert snap.equity == Decimal("1000")
     assert snap.multiplier == Decimal("1.10")
+
+
+def test_snapshot_auto_refresh_reloads_every_n_ticks(tmp_path: Path):
+    cfg = tmp_path / "paper_wallet.json"
+    wallet = PaperWalletController(
+        file_path=cfg,
+        default_starting_balance=Decimal("100"),
+        default_tier_spec="100:1.00,1000:1.10",
+        refresh_seconds=3,
+        expected_tick_seconds=1,
+    )
+    wallet.ensure_file()
+
+    cfg.write_text('{"starting_balance": "100", "manual_adjustment": "50"}', encoding="utf-8")
+    # Force a newer mtime regardless of filesystem timestamp granularity.
+    st = cfg.stat()
+    os.utime(cfg, (st.st_atime, st.st_mtime + 10))
+
+    stats = {"total_realized_pnl": 0, "total_unrealized_pnl": 0}
+    assert wallet.snapshot(portfolio_stats=stats, auto_refresh=True).equity == Decimal("100")
+    assert wallet.snapshot(portfolio_stats=stats, auto_refresh=True).equity == Decimal("100")
+    assert wallet.snapshot(portfolio_stats=stats, auto_refresh=True).equity == Decimal("150")
+
+
+def test_refresh_picks_up_replaced_file(tmp_path: Path):
+    cfg = tmp_path / "paper_wallet.json"
+    wallet = PaperWalletController(
+        file_path=cfg,
+        default_starting_balance=Decimal("100"),
+        default_tier_spec="100:1.00",
+        refresh_seconds=0,
+    )
+    wallet.ensure_file()
+
+    # Atomic write-and-rename swaps the inode underneath the cached descriptor.
+    tmp = tmp_path / "paper_wallet.json.tmp"
+    tmp.write_text('{"starting_balance": "250", "manual_adjustment": "0"}', encoding="utf-8")
+    os.replace(tmp, cfg)
+    wallet.refresh(force=True)
+    assert wallet.starting_balance == Decimal("250")
+
+    # In-place rewrite with a shorter payload keeps the inode.
+    cfg.write_text('{"starting_balance": "7"}', encoding="utf-8")
+    wallet.refresh(force=True)
+    assert wallet.starting_balance == Decimal("7")
+    wallet.close()
+
+
+def test_reload_reuses_read_buffer_until_file_grows(tmp_path: Path):
+    import json
+
+    import pytest
+
+    if not hasattr(os, "preadv"):
+        pytest.skip("cached-descriptor reads are POSIX-only")
+    cfg = tmp_path / "paper_wallet.json"
+    wallet = PaperWalletController(
+        file_path=cfg,
+        default_starting_balance=Decimal("100"),
+        default_tier_spec="100:1.00",
+        refresh_seconds=0,
+    )
+
+    def _write(adjustment: str, pad: int = 0) -> None:
+        cfg.write_text(
+            json.dumps({"starting_balance": "100", "manual_adjustment": adjustment}) + " " * pad,
+            encoding="utf-8",
+        )
+
+    _write("5", pad=200)
+    wallet.refresh(force=True)
+    buf = wallet._buf
+    assert wallet.manual_adjustment == Decimal("5")
+
+    _write("7")
+    wallet.refresh(force=True)
+    assert wallet._buf is buf
+    assert wallet.manual_adjustment == Decimal("7")
+
+    _write("9", pad=1000)
+    wallet.refresh(force=True)
+    assert wallet._buf is not buf
+    assert wallet.manual_adjustment == Decimal("9")
+    wallet.close()
@@ -0,0 +1,559 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+import pytest
+from py_clob_client.exceptions import PolyApiException
+
+from polymarket_bot import polymarket_client
+from polymarket_bot.polymarket_client import PolymarketClient
+
+
+class _DummyResponse:
+    def __init__(self, payload: Any, status_code: int = 200, headers: dict | None = None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Any:
+        return self._payload
+
+
+class _DummyHttpClient:
+    def __init__(self, payload: Any):
+        self.payload = payload
+        self.calls: list[tuple[str, dict]] = []
+
+    def get(self, url: str, params: dict | None = None, **kwargs: Any) -> _DummyResponse:
+        self.calls.append((url, dict(params or {})))
+        return _DummyResponse(self.payload)
+
+
+def test_data_api_trades_reuse_http_client_and_normalize() -> None:
+    client = PolymarketClient()
+    http = _DummyHttpClient(
+        [
+            {
+                "transactionHash": "0xabc",
+                "asset": "tok1",
+                "conditionId": "c1",
+                "side": "buy",
+                "price": 0.5,
+                "size": 10,
+            },
+            "garbage",
+        ]
+    )
+    client._data_httpx = http  # type: ignore[assignment]
+
+    trades = client.get_user_trades_data_api("0xuser", limit=5)
+    trades_again = client.get_user_trades_data_api("0xuser", limit=5)
+
+    assert len(http.calls) == 2
+    assert http.calls[0][1] == {"user": "0xuser", "limit": 5}
+    assert trades == trades_again
+    assert len(trades) == 1
+    t = trades[0]
+    assert t["id"] == t["order_id"] == "0xabc"
+    assert t["asset_id"] == t["token_id"] == "tok1"
+    assert t["condition_id"] == t["market"] == "c1"
+    assert t["side"] == "BUY"
+
+
+def test_bulk_trade_fetch_isolates_failures() -> None:
+    client = PolymarketClient()
+
+    def _fake_best_effort(address: str, limit: int = 100) -> list[dict]:
+        if address == "bad":
+            raise RuntimeError("boom")
+        return [{"id": f"{address}-1"}]
+
+    client.get_user_trades_best_effort = _fake_best_effort  # type: ignore[method-assign]
+
+    out = client.get_user_trades_bulk(["a", "bad", "b", "a"], limit=10)
+
+    assert out == {"a": [{"id": "a-1"}], "bad": [], "b": [{"id": "b-1"}]}
+
+
+def test_market_info_is_cached_within_ttl() -> None:
+    client = PolymarketClient()
+    calls: list[str] = []
+
+    class _Clob:
+        def get_market(self, condition_id: str) -> dict:
+            calls.append(condition_id)
+            return {"condition_id": condition_id}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    assert client.get_market_info("c1") == {"condition_id": "c1"}
+    assert client.get_market_info("c1") == {"condition_id": "c1"}
+    assert calls == ["c1"]
+
+    client._market_cache_ttl = 0.0
+    client.get_market_info("c1")
+    assert calls == ["c1", "c1"]
+
+
+def test_market_info_cache_is_lru_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(polymarket_client, "_MARKET_CACHE_MAXSIZE", 2)
+    client = PolymarketClient()
+    calls: list[str] = []
+
+    class _Clob:
+        def get_market(self, condition_id: str) -> dict:
+            calls.append(condition_id)
+            return {"condition_id": condition_id}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    for cid in ("c1", "c2", "c1", "c3"):
+        client.get_market_info(cid)
+    assert list(client._market_cache) == ["c1", "c3"]
+
+    assert calls == ["c1", "c2", "c3"]
+
+    # A stale entry is dropped on the miss even when the refetch fails.
+    class _Down:
+        def get_market(self, condition_id: str) -> dict:
+            raise RuntimeError("down")
+
+    client.client = _Down()  # type: ignore[assignment]
+    client._market_cache_ttl = 0.0
+    assert client.get_market_info("c3") is None
+    assert list(client._market_cache) == ["c1"]
+
+
+def test_data_api_transport_backs_off_on_429_and_honors_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import httpx
+
+    statuses = [429, 503, 200]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        headers = {"Retry-After": "3"} if status == 429 else {}
+        return httpx.Response(status, headers=headers, json=[])
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(polymarket_client.time, "sleep", sleeps.append)
+    transport = polymarket_client._RetryTransport(httpx.MockTransport(_handler))
+
+    with httpx.Client(transport=transport) as http:
+        resp = http.get("https://example.invalid/trades")
+
+    assert resp.status_code == 200
+    assert len(sleeps) == 2 and sleeps[0] >= 3.0
+
+
+def test_get_user_trades_dedupes_maker_and_taker(monkeypatch: pytest.MonkeyPatch) -> None:
+    from py_clob_client.constants import END_CURSOR
+
+    client = PolymarketClient()
+
+    class _Signer:
+        def address(self) -> str:
+            return "0xsigner"
+
+    class _Clob:
+        creds = object()
+        signer = _Signer()
+
+        def get_trades(self, params: Any) -> list[dict]:
+            return [{"id": "t1"}, {"id": "t2"}, {"id": "t1"}]
+
+    pages = [
+        {"data": [{"id": "t2"}, {"id": "t3"}], "next_cursor": "NEXT"},
+        {"data": [{"order_id": "t4"}, {}], "next_cursor": END_CURSOR},
+    ]
+    monkeypatch.setattr(polymarket_client, "clob_get", lambda url, headers=None: pages.pop(0))
+    monkeypatch.setattr(polymarket_client, "create_level_2_headers", lambda *a, **k: {})
+    client.client = _Clob()  # type: ignore[assignment]
+
+    trades = client.get_user_trades("0xuser")
+
+    assert [t.get("id") or t.get("order_id") for t in trades] == ["t1", "t2", "t3", "t4"]
+
+
+def test_cloudflare_block_on_orders_does_not_block_trade_fetches() -> None:
+    client = PolymarketClient()
+
+    class _Clob:
+        def create_order(self, order_args: Any) -> Any:
+            return order_args
+
+        def post_order(self, signed_order: Any, orderType: Any = None) -> Any:
+            raise RuntimeError(
+                "403 Sorry, you have been blocked. Cloudflare Ray ID: 9bb2dcee08a91dd8"
+            )
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    result = client.place_order("tok", 0.5, 10, "SELL", order_type="GTC")
+
+    assert result is not None and result["_error"] == "cloudflare_blocked"
+    assert client._is_blocked("post_order")
+    assert not client._is_blocked("get_trades")
+    assert client.place_order("tok", 0.5, 10, "SELL", order_type="GTC") is None
+
+
+def test_data_api_trades_respect_limit() -> None:
+    client = PolymarketClient()
+    http = _DummyHttpClient([{"transactionHash": f"0x{i}", "side": "SELL"} for i in range(10)])
+    client._data_httpx = http  # type: ignore[assignment]
+
+    trades = client.get_user_trades_data_api("0xuser", limit=3)
+
+    assert [t["id"] for t in trades] == ["0x0", "0x1", "0x2"]
+
+
+def test_get_user_trades_async_merges_maker_and_taker() -> None:
+    import asyncio
+
+    import httpx
+    from py_clob_client.constants import END_CURSOR
+
+    client = PolymarketClient()
+
+    class _Signer:
+        def address(self) -> str:
+            return "0xsigner"
+
+    class _Creds:
+        api_key = "k"
+        api_secret = "c2VjcmV0"
+        api_passphrase = "p"
+
+    class _Clob:
+        creds = _Creds()
+        signer = _Signer()
+
+        def get_trades(self, params: Any) -> list[dict]:
+            return [{"id": "m1"}, {"id": "shared"}]
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["taker"] == "0xuser"
+        return httpx.Response(
+            200,
+            json={"data": [{"id": "shared"}, {"id": "t1"}], "next_cursor": END_CURSOR},
+        )
+
+    async def _run() -> list[dict]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http:
+            return await client.get_user_trades_async("0xuser", http=http)
+
+    trades = asyncio.run(_run())
+
+    assert sorted(t["id"] for t in trades) == ["m1", "shared", "t1"]
+
+
+def test_taker_trade_pages_are_cached_briefly(monkeypatch: pytest.MonkeyPatch) -> None:
+    from py_clob_client.constants import END_CURSOR
+
+    client = PolymarketClient()
+    fetched: list[str] = []
+
+    def _fake_get(url: str, headers: Any = None) -> dict:
+        fetched.append(url)
+        return {"data": [{"id": "t1"}], "next_cursor": END_CURSOR}
+
+    monkeypatch.setattr(polymarket_client, "clob_get", _fake_get)
+
+    first = list(client._iter_taker_trades("0xuser", {}))
+    second = list(client._iter_taker_trades("0xuser", {}))
+
+    assert first == second == [{"id": "t1"}]
+    assert len(fetched) == 1
+    assert fetched[0].endswith("taker=0xuser&next_cursor=MA%3D%3D")
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"error": "insufficient_funds_or_approval"}, "insufficient_funds_or_approval"),
+        (
+            {"error": "invalid amount for a marketable BUY order ($0.86), min size: $1"},
+            "min_order_notional",
+        ),
+        ({"error": "something else"}, "order_failed"),
+    ],
+)
+def test_place_order_maps_structured_errors(payload: dict, expected: str) -> None:
+    from py_clob_client.exceptions import PolyApiException
+
+    client = PolymarketClient()
+
+    class _Clob:
+        def create_order(self, order_args: Any) -> Any:
+            return order_args
+
+        def post_order(self, signed_order: Any, orderType: Any = None) -> Any:
+            raise PolyApiException(error_msg=payload)
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    result = client.place_order("tok", 0.5, 10, "SELL", order_type="GTC")
+
+    assert result is not None
+    assert result["_error"] == expected
+    assert result["_payload"] == payload
+
+
+def test_marketable_buy_amount_rounds_down_to_cents() -> None:
+    client = PolymarketClient()
+    seen: list[Any] = []
+
+    class _Clob:
+        def create_market_order(self, market_args: Any) -> Any:
+            seen.append(market_args)
+            return market_args
+
+        def post_order(self, signed_order: Any, orderType: Any = None) -> Any:
+            return {"orderID": "o1"}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    result = client.place_order("tok", 0.29, 7.5, "BUY", order_type="FOK")
+
+    assert result == {"orderID": "o1"}
+    assert seen[0].amount == 2.17
+
+
+def test_balance_allowance_bulk_preserves_order() -> None:
+    client = PolymarketClient()
+    client.has_valid_creds = True
+
+    class _Clob:
+        def update_balance_allowance(self, params: Any) -> dict:
+            return {"token_id": params.token_id}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    out = client.update_balance_allowances_bulk(
+        [("CONDITIONAL", "t1"), ("COLLATERAL", None), ("BOGUS", "x"), ("CONDITIONAL", "t2")]
+    )
+
+    assert out == [{"token_id": "t1"}, {"token_id": None}, None, {"token_id": "t2"}]
+
+
+def test_log_throttled_suppresses_repeats(caplog: pytest.LogCaptureFixture) -> None:
+    import logging
+
+    client = PolymarketClient()
+    caplog.set_level(logging.WARNING, logger=polymarket_client.__name__)
+
+    for _ in range(5):
+        client._log_throttled("k", logging.WARNING, "boom %s", 1)
+    client._last_log["k"] = (client._last_log["k"][0] - 60.0, client._last_log["k"][1])
+    client._log_throttled("k", logging.WARNING, "boom %s", 2)
+
+    messages = [r.getMessage() for r in caplog.records if r.getMessage().startswith("boom")]
+    assert messages == ["boom 1", "boom 2 (suppressed 4 similar in last 30s)"]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            'Cloudflare Ray ID: <strong class="font-semibold">9bb2dcee08a91dd8</strong>',
+            "9bb2dcee08a91dd8",
+        ),
+        ("blocked. Cloudflare Ray ID: 9bb2dcee08a91dd8 • Performance", "9bb2dcee08a91dd8"),
+        ("403 Forbidden", None),
+    ],
+)
+def test_extract_cloudflare_ray_id(text: str, expected) -> None:
+    assert PolymarketClient._extract_cloudflare_ray_id(text) == expected
+
+
+def test_extract_cloudflare_ray_id_bounded_on_adversarial_page() -> None:
+    page = ("Cloudflare Ray ID: <strong " + "x" * 500) * 2000
+    assert PolymarketClient._extract_cloudflare_ray_id(page) is None
+
+
+def test_open_orders_cached_until_cancel_invalidates() -> None:
+    client = PolymarketClient()
+    client.has_valid_creds = True
+    calls: list[str] = []
+
+    class _Clob:
+        def get_orders(self) -> dict:
+            calls.append("get")
+            return {"data": [{"id": "o1"}]}
+
+        def cancel(self, order_id: str) -> dict:
+            return {"canceled": [order_id]}
+
+    client.client = _Clob()  # type: ignore[assignment]
+    client._open_orders_ttl = 60.0
+
+    client.get_open_orders("0xabc").clear()
+    assert client.get_open_orders("0xabc") == [{"id": "o1"}]
+    client.get_open_orders("0xabc").append({"id": "mine"})
+    assert client.get_open_orders("0xabc") == [{"id": "o1"}]
+    assert calls == ["get"]
+
+    assert client.cancel_order_best_effort("o1") is True
+    client.get_open_orders("0xabc")
+    assert calls == ["get", "get"]
+
+
+def test_open_orders_skip_network_after_401_until_creds_change() -> None:
+    client = PolymarketClient()
+    client.has_valid_creds = True
+    client._open_orders_ttl = 0.0
+    calls: list[str] = []
+
+    class _Clob:
+        creds = object()
+
+        def get_orders(self) -> list:
+            calls.append("get")
+            exc = PolyApiException(error_msg="Unauthorized/Invalid api key")
+            exc.status_code = 401
+            raise exc
+
+    clob = _Clob()
+    client.client = clob  # type: ignore[assignment]
+
+    assert client.get_open_orders("0xabc") == []
+    assert client.get_open_orders("0xabc") == []
+    assert calls == ["get"]
+
+    clob.creds = object()  # refreshed credentials
+    client.get_open_orders("0xabc")
+    assert calls == ["get", "get"]
+
+
+def test_best_effort_calls_log_unexpected_errors_instead_of_raising(caplog) -> None:
+    client = PolymarketClient()
+    client.has_valid_creds = True
+
+    class _Clob:
+        def get_orders(self) -> dict:
+            raise KeyError("data")
+
+        def cancel(self, order_id: str) -> dict:
+            raise TypeError("bug")
+
+        def cancel_orders(self, order_ids: list[str]) -> dict:
+            raise ValueError("malformed")
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    with caplog.at_level("ERROR", logger="polymarket_bot.polymarket_client"):
+        assert client.get_open_orders("0xabc") == []
+        assert client.cancel_order_best_effort("o1") is False
+        assert client.cancel_orders_best_effort(["o1", "o2"]) == {"o1": False, "o2": False}
+
+    raised = [r.exc_info[0] for r in caplog.records if r.exc_info]
+    assert raised == [KeyError, TypeError, ValueError]
+
+
+def test_take_hex_stops_at_first_non_hex_char() -> None:
+    assert polymarket_client._take_hex("9bB2f</strong>") == "9bB2f"
+    assert polymarket_client._take_hex("ab€cd") == "ab"
+    assert polymarket_client._take_hex("f" * 40) == "f" * 32
+    assert polymarket_client._take_hex("<strong>") == ""
+
+
+def test_cancel_orders_best_effort_batches_and_maps_results() -> None:
+    client = PolymarketClient()
+    client.has_valid_creds = True
+    batches: list[list[str]] = []
+
+    class _Clob:
+        def cancel_orders(self, order_ids: list[str]) -> dict:
+            batches.append(order_ids)
+            return {"canceled": ["o1"], "not_canceled": {"o2": "order already matched"}}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    out = client.cancel_orders_best_effort([" o1", "o2", "o1", ""])
+
+    assert batches == [["o1", "o2"]]
+    assert out == {"o1": True, "o2": False}
+
+
+def test_cancel_orders_best_effort_falls_back_to_single_cancels() -> None:
+    client = PolymarketClient()
+    client.has_valid_creds = True
+
+    class _Clob:
+        def cancel(self, order_id: str) -> dict:
+            if order_id == "bad":
+                raise PolyApiException(error_msg="not found")
+            return {}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    result = client.cancel_orders_best_effort(["a", "bad", "b"])
+    assert result == {"a": True, "bad": False, "b": True}
+
+
+def test_bulk_clob_fallbacks_do_not_time_out_in_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    import time
+
+    client = PolymarketClient()
+    monkeypatch.setattr(polymarket_client.Config, "DATA_API_FIRST", False, raising=False)
+    monkeypatch.setattr(polymarket_client.Config, "DISABLE_CLOB_TRADE_FETCH", False, raising=False)
+    monkeypatch.setattr(
+        polymarket_client.Config, "CLOB_TRADE_FETCH_TIMEOUT_SECONDS", 0.5, raising=False
+    )
+
+    def _slow_clob(address: str, limit: int = 100) -> list[dict]:
+        time.sleep(0.3)
+        return [{"id": f"{address}-clob"}]
+
+    client.get_user_trades = _slow_clob  # type: ignore[method-assign]
+    client.get_user_trades_data_api = lambda address, limit=100: []  # type: ignore[method-assign]
+
+    wallets = [f"w{i}" for i in range(8)]
+    out = client.get_user_trades_bulk(wallets, limit=10)
+
+    assert out == {w: [{"id": f"{w}-clob"}] for w in wallets}
+    client.close()
+
+
+def test_post_order_backoff_ignores_429_inside_rejection_messages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = PolymarketClient()
+    monkeypatch.setattr(polymarket_client.time, "sleep", lambda _s: None)
+    errors: list[Exception] = []
+    calls: list[int] = []
+
+    class _Clob:
+        def post_order(self, order: Any, orderType: Any = None) -> dict:
+            calls.append(1)
+            if errors:
+                raise errors.pop(0)
+            return {"success": True}
+
+    client.client = _Clob()  # type: ignore[assignment]
+
+    rejection = PolyApiException(error_msg="invalid price 0.429 for order 0xab429")
+    rejection.status_code = 400
+    errors[:] = [rejection]
+    with pytest.raises(PolyApiException):
+        client._post_order_with_backoff(object(), None)
+    assert len(calls) == 1
+
+    errors[:] = [RuntimeError("order rejected: price 0.429")]
+    with pytest.raises(RuntimeError):
+        client._post_order_with_backoff(object(), None)
+    assert len(calls) == 2
+
+    limited = PolyApiException(error_msg="slow down")
+    limited.status_code = 429
+    errors[:] = [limited, RuntimeError("HTTP 429 Too Many Requests")]
+    assert client._post_order_with_backoff(object(), None) == {"success": True}
+    assert len(calls) == 5
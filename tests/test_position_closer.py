@@ -2,10 +2,19 @@
 
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
+import sys
 import time
 
+import pytest
+
 from polymarket_bot.position_closer import PositionCloser, CloseResult
-from polymarket_bot.position_manager import Position, PositionManager
+from polymarket_bot.position_manager import (
+    EXIT_POLICY_CLOSEABLE,
+    EXIT_POLICY_HELD,
+    Position,
+    PositionManager,
+    exit_policy_for,
+)
 from polymarket_bot.resolution_monitor import ResolutionMonitor
 
 
@@ -20,6 +29,8 @@ def _make_settings(**overrides):
         "profit_target_pct": Decimal("10"),
         "stop_loss_pct": Decimal("20"),
         "max_position_age_hours": 48.0,
+        "close_fill_poll_delays": (0.05, 0.15, 0.4),
+        "close_fill_poll_jitter_seconds": 0.0,
         "poly_private_key": "",
     }
     defaults.update(overrides)
@@ -47,8 +58,12 @@ def _make_position(
     p.entry_price = entry_price
     p.quantity = quantity
     p.cost_basis = cost_basis if cost_basis is not None else entry_price * quantity
+    p._entry_price_f = float(entry_price)
+    p._qty_f = float(quantity)
+    p._cost_basis_f = float(p.cost_basis)
     p.strategy = strategy
     p.entry_time = entry_time if entry_time is not None else time.time()
+    p.entry_monotonic = time.monotonic() - (time.time() - p.entry_time)
     p.is_redeemable = is_redeemable
     p.unrealized_pnl = Decimal("0")
 
@@ -56,6 +71,7 @@ def _make_position(
         p.unrealized_pnl = (price - entry_price) * quantity
 
     p.update_unrealized_pnl = _update_pnl
+    p.unrealized_pnl_from = lambda price: (price - p._entry_price_f) * p._qty_f
     return p
 
 
@@ -64,8 +80,26 @@ def _make_closer(**settings_overrides) -> tuple[PositionCloser, MagicMock, Magic
     pm = MagicMock(spec=PositionManager)
     pm.get_open_positions.return_value = []
     pm.get_redeemable_positions.return_value = []
+    pm.open_arb_count = 0
     pm.close_position.return_value = Decimal("0.50")
-    pm.update_unrealized_pnl = MagicMock()
+
+    def _update_all(price_data):
+        for p in pm.get_open_positions.return_value:
+            price = price_data.get(p.token_id)
+            if price is not None:
+                p.update_unrealized_pnl(price)
+
+    pm.update_unrealized_pnl.side_effect = _update_all
+    pm.get_individually_closeable_positions.side_effect = lambda: [
+        p
+        for p in pm.get_open_positions.return_value
+        if exit_policy_for(p.strategy) == EXIT_POLICY_CLOSEABLE
+    ]
+    pm.get_held_to_resolution_positions.side_effect = lambda: [
+        p
+        for p in pm.get_open_positions.return_value
+        if exit_policy_for(p.strategy) == EXIT_POLICY_HELD
+    ]
 
     rm = MagicMock(spec=ResolutionMonitor)
     rm.check_resolutions.return_value = []
@@ -89,6 +123,7 @@ def test_profit_target_triggers_close():
 
     # Current price = 0.60 → +20% return → exceeds 10% target
     price_data = {"tok1": Decimal("0.60")}
+    pos.update_unrealized_pnl(price_data["tok1"])
     assert closer._should_close_position(pos, price_data) is True
     assert closer.profit_target_closes == 1
 
@@ -99,6 +134,7 @@ def test_stop_loss_triggers_close():
 
     # Current price = 0.35 → -30% return → exceeds -20% stop
     price_data = {"tok1": Decimal("0.35")}
+    pos.update_unrealized_pnl(price_data["tok1"])
     assert closer._should_close_position(pos, price_data) is True
     assert closer.stop_loss_closes == 1
 
@@ -112,6 +148,7 @@ def test_no_close_within_bounds():
 
     # +4% return — neither target nor stop
     price_data = {"tok1": Decimal("0.52")}
+    pos.update_unrealized_pnl(price_data["tok1"])
     assert closer._should_close_position(pos, price_data) is False
 
 
@@ -121,6 +158,7 @@ def test_time_based_exit():
     pos = _make_position(entry_time=time.time() - 7200)
 
     price_data = {"tok1": Decimal("0.50")}
+    pos.update_unrealized_pnl(price_data["tok1"])
     assert closer._should_close_position(pos, price_data) is True
     assert closer.time_based_closes == 1
 
@@ -253,6 +291,7 @@ def test_arb_group_age_exit():
     )
     pm.get_open_positions.return_value = [old_arb]
     pm.get_redeemable_positions.return_value = []
+    pm.open_arb_count = 1
 
     price_data = {"tok1": Decimal("0.40")}
     results = closer.check_and_close_positions(price_data)
@@ -298,3 +337,388 @@ def test_live_close_fails_without_client():
 
     assert result.success is False
     assert result.reason == "no_client"
+
+
+# ---------------------------------------------------------------------------
+# Float pre-screen
+# ---------------------------------------------------------------------------
+
+def test_screen_exit_candidates_only_flags_positions_near_a_rule():
+    closer, _, _ = _make_closer(
+        profit_target_pct=Decimal("10"),
+        stop_loss_pct=Decimal("20"),
+        max_position_age_hours=1.0,
+    )
+    hold = _make_position(position_id="hold", token_id="t_hold")
+    target = _make_position(position_id="target", token_id="t_target")
+    stop = _make_position(position_id="stop", token_id="t_stop")
+    old = _make_position(position_id="old", token_id="t_old", entry_time=time.time() - 7200)
+    exact = _make_position(position_id="exact", token_id="t_exact")
+
+    price_data = {
+        "t_hold": Decimal("0.52"),
+        "t_target": Decimal("0.60"),
+        "t_stop": Decimal("0.35"),
+        "t_exact": Decimal("0.55"),  # exactly +10%: Decimal check decides
+    }
+    candidates = closer._screen_exit_candidates(
+        [hold, target, stop, old, exact], price_data, time.monotonic()
+    )
+
+    assert [p.position_id for p in candidates] == ["target", "stop", "old", "exact"]
+
+
+def test_screen_exit_candidates_skips_unpriced_and_zero_cost_positions():
+    closer, _, _ = _make_closer(profit_target_pct=Decimal("10"), stop_loss_pct=Decimal("20"))
+    unpriced = _make_position(position_id="unpriced", token_id="t_none")
+    free = _make_position(position_id="free", token_id="t_free", entry_price=Decimal("0"))
+
+    candidates = closer._screen_exit_candidates(
+        [unpriced, free], {"t_free": Decimal("0.90")}, time.monotonic()
+    )
+
+    assert candidates == []
+
+
+def test_should_close_uses_caller_clock():
+    closer, _, _ = _make_closer(max_position_age_hours=1.0)
+    pos = _make_position()
+    pos.entry_monotonic = 1_000.0
+
+    assert closer._should_close_position(pos, {}, now=1_000.0 + 1800) is False
+    assert closer._should_close_position(pos, {}, now=1_000.0 + 7200) is True
+
+
+def test_should_close_screens_on_float_shadows():
+    """Exit decisions use the float shadows and never recompute Decimal P&L."""
+    closer, pm, _ = _make_closer(profit_target_pct=Decimal("10"))
+    pos = _make_position(entry_price=Decimal("0.50"))
+    pos.update_unrealized_pnl = MagicMock()
+
+    assert closer._should_close_position(pos, {"tok1": Decimal("0.60")}) is True
+    pos.update_unrealized_pnl.assert_not_called()
+
+
+def test_position_float_shadows_match_entry_details():
+    pos = Position(
+        position_id="p",
+        condition_id="c",
+        token_id="t",
+        outcome="YES",
+        strategy="arbitrage",
+        entry_price=Decimal("0.45"),
+        quantity=Decimal("12"),
+        entry_time=0.0,
+    )
+    assert (pos._entry_price_f, pos._qty_f) == (0.45, 12.0)
+    assert pos.cost_basis is pos.cost_basis == Decimal("5.40")
+    assert pos._cost_basis_f == float(pos.cost_basis)
+    assert "_cost_basis" not in repr(pos)
+    assert sys.version_info < (3, 10) or not hasattr(pos, "__dict__")
+    assert abs(pos.unrealized_pnl_from(0.5) - 0.6) < 1e-12
+    assert pos.unrealized_pnl == Decimal("0")
+
+
+def test_arb_group_age_exit_closes_only_stale_groups():
+    closer, pm, _ = _make_closer(max_position_age_hours=1.0)
+    old_leg_a = _make_position(position_id="a", strategy="conditional_arb", condition_id="old",
+                               entry_time=time.time() - 7200)
+    old_leg_b = _make_position(position_id="b", strategy="conditional_arb", condition_id="old")
+    fresh_leg = _make_position(position_id="c", strategy="multi_outcome_arb", condition_id="fresh")
+    single = _make_position(position_id="d")
+    pm.get_open_positions.return_value = [old_leg_a, fresh_leg, single, old_leg_b]
+    pm.open_arb_count = 3
+
+    results = closer.check_and_close_positions({})
+
+    assert [r.position_id for r in results] == ["a", "b"]
+
+
+# ---------------------------------------------------------------------------
+# Fill payload parsing
+# ---------------------------------------------------------------------------
+
+def test_extract_fill_details_walks_nested_payloads():
+    closer, _, _ = _make_closer()
+    payload = {
+        "order": {
+            "status": "MATCHED",
+            "Size_Matched": "not-a-number",
+            "trades": [{"price": "0.41", "fills": [{"filledSize": "7"}]}],
+            "meta": {"FILLED_SIZE": "6"},
+        }
+    }
+
+    size, price, status = closer._extract_fill_details(
+        payload=payload, requested_size=Decimal("10"), requested_price=Decimal("0.40"),
+    )
+
+    # Shallowest decodable match wins; undecodable values are skipped.
+    assert (size, price, status) == (Decimal("6"), Decimal("0.41"), "matched")
+
+
+def test_verify_live_close_fill_coerces_model_payload_once():
+    closer, _, _ = _make_closer()
+    dumps: list[int] = []
+
+    class _Resp:
+        def model_dump(self):
+            dumps.append(1)
+            return {"status": "matched", "size_matched": "10", "price": "0.55"}
+
+    size, price, status = closer._verify_live_close_fill(
+        order_id="o1",
+        post_response=_Resp(),
+        requested_size=Decimal("10"),
+        requested_price=Decimal("0.50"),
+    )
+
+    assert (size, price, status) == (Decimal("10"), Decimal("0.55"), "matched")
+    assert dumps == [1]
+
+
+def test_close_positions_verifies_live_fills_concurrently():
+    import threading
+
+    closer, pm, _ = _make_closer(trading_mode="live", kill_switch=False)
+    pm.close_position.return_value = Decimal("0.10")
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _Clob:
+        def create_order(self, args):
+            return args
+
+        def post_order(self, signed, orderType=None):
+            return {"orderID": f"o-{signed.token_id}", "status": "live"}
+
+        def get_order(self, order_id):
+            # Both polls must be in flight at once for the barrier to release.
+            barrier.wait()
+            return {"status": "matched", "size_matched": "10", "price": "0.60"}
+
+    closer.client = _Clob()  # type: ignore[assignment]
+    positions = [
+        _make_position(position_id="p1", token_id="t1"),
+        _make_position(position_id="p2", token_id="t2"),
+    ]
+
+    results = closer.close_positions(positions, {"t1": Decimal("0.60"), "t2": Decimal("0.60")})
+
+    assert [(r.position_id, r.reason, r.order_id) for r in results] == [
+        ("p1", "live_closed", "o-t1"),
+        ("p2", "live_closed", "o-t2"),
+    ]
+    assert closer.close_count == 2
+
+
+def test_verify_live_close_fill_backs_off_until_terminal(monkeypatch):
+    closer, _, _ = _make_closer(close_fill_poll_delays=(0.01, 0.02, 0.03))
+    sleeps: list[float] = []
+    monkeypatch.setattr("polymarket_bot.position_closer.time.sleep", sleeps.append)
+    statuses = iter(["live", "canceled"])
+
+    class _Clob:
+        def get_order(self, order_id):
+            return {"status": next(statuses)}
+
+    closer.client = _Clob()  # type: ignore[assignment]
+
+    size, _, status = closer._verify_live_close_fill(
+        order_id="o1",
+        post_response={"status": "live"},
+        requested_size=Decimal("10"),
+        requested_price=Decimal("0.50"),
+    )
+
+    assert (size, status) == (Decimal("0"), "canceled")
+    assert sleeps == [0.01, 0.02]
+
+
+def test_extract_fill_details_normalizes_status_and_defaults_size():
+    closer, _, _ = _make_closer()
+
+    size, price, status = closer._extract_fill_details(
+        payload={"state": "  FILLED "}, requested_size=Decimal("4"), requested_price=Decimal("0.3"),
+    )
+    assert (size, price, status) == (Decimal("4"), Decimal("0.3"), "filled")
+
+    size, _, status = closer._extract_fill_details(
+        payload={"order_status": 7}, requested_size=Decimal("4"), requested_price=Decimal("0.3"),
+    )
+    assert (size, status) == (Decimal("0"), "7")
+
+
+def test_paper_close_log_is_formatted_lazily(caplog):
+    import logging
+
+    closer, pm, _ = _make_closer()
+    pm.close_position.return_value = Decimal("1.23456")
+    caplog.set_level(logging.WARNING, logger="polymarket_bot.position_closer")
+
+    closer.close_position(_make_position(), {"tok1": Decimal("0.6")})
+
+    record = next(r for r in caplog.records if "PAPER CLOSE" in r.msg)
+    assert "%" in record.msg and record.args
+    assert record.getMessage().endswith("entry=$0.5000 exit=$0.6000 P&L=$1.2346")
+
+
+def test_age_exit_ignores_wall_clock_jumps(monkeypatch):
+    closer, _, _ = _make_closer(max_position_age_hours=1.0)
+    pos = Position(
+        position_id="p", condition_id="c", token_id="t", outcome="YES", strategy="arbitrage",
+        entry_price=Decimal("0.5"), quantity=Decimal("1"), entry_time=time.time(),
+    )
+    # Wall clock jumps forward a day; the monotonic clock does not.
+    real_time = time.time
+    monkeypatch.setattr("polymarket_bot.position_closer.time.time", lambda: real_time() + 86_400)
+
+    assert closer._should_close_position(pos, {}) is False
+
+
+def test_live_mode_is_cached_until_refresh():
+    closer, pm, _ = _make_closer(trading_mode="paper")
+    pos = _make_position()
+
+    closer.settings.trading_mode = "live"
+    closer.settings.kill_switch = False
+    assert closer.close_position(pos, {"tok1": Decimal("0.6")}).reason == "paper_closed"
+
+    closer.refresh()
+    assert closer.close_position(pos, {"tok1": Decimal("0.6")}).reason == "no_client"
+
+
+def test_extract_order_id_memoizes_per_response_type():
+    closer, _, _ = _make_closer()
+
+    assert closer._extract_order_id({"orderId": "a"}) == "a"
+    assert closer._extract_order_id({"orderId": "b"}) == "b"
+    # Shape change still resolves via the generic path.
+    assert closer._extract_order_id({"orderID": "c"}) == "c"
+
+    class _Resp:
+        orderID = "d"
+
+    assert closer._extract_order_id(_Resp()) == "d"
+    assert closer._extract_order_id({}) is None
+    assert closer._extract_order_id(None) is None
+    assert set(closer._orderid_extractors) == {dict, _Resp, type(None)}
+
+    class _Weird:
+        @property
+        def orderID(self):
+            raise RuntimeError("bug")
+
+    # Only AttributeError is treated as "no id"; real bugs surface.
+    with pytest.raises(RuntimeError):
+        closer._extract_order_id(_Weird())
+
+
+def test_check_exit_rules_uses_passed_thresholds():
+    closer, _, _ = _make_closer(profit_target_pct=Decimal("50"), stop_loss_pct=Decimal("50"))
+    pos = _make_position(entry_price=Decimal("0.50"))
+    now = time.monotonic()
+
+    # +20%: below the configured 50% target, but above a 10% target passed in.
+    assert closer._check_exit_rules(pos, Decimal("0.60"), now, 0.0, 0.5, 0.5) is False
+    assert closer._check_exit_rules(pos, Decimal("0.60"), now, 0.0, 0.5, 0.1) is True
+    assert closer.profit_target_closes == 1
+
+
+def test_close_positions_posts_live_sells_concurrently():
+    import threading
+
+    closer, pm, _ = _make_closer(trading_mode="live", kill_switch=False)
+    pm.close_position.return_value = Decimal("0.10")
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _Clob:
+        def create_order(self, args):
+            return args
+
+        def post_order(self, signed, orderType=None):
+            # Both sells must be in flight at once for the barrier to release.
+            barrier.wait()
+            if signed.token_id == "t2":
+                raise RuntimeError("boom")
+            return {"orderID": "o1", "status": "matched", "size_matched": "10"}
+
+    closer.client = _Clob()  # type: ignore[assignment]
+    positions = [
+        _make_position(position_id="p1", token_id="t1"),
+        _make_position(position_id="p2", token_id="t2"),
+    ]
+
+    results = closer.close_positions(positions, {"t1": Decimal("0.60"), "t2": Decimal("0.60")})
+
+    assert [(r.position_id, r.reason) for r in results] == [("p1", "live_closed"), ("p2", "error")]
+    assert results[1].error == "boom"
+
+
+def test_close_positions_signs_ahead_inside_running_loop():
+    import asyncio
+    import threading
+
+    closer, pm, _ = _make_closer(trading_mode="live", kill_switch=False)
+    pm.close_position.return_value = Decimal("0.10")
+    second_signed = threading.Event()
+    events: list[str] = []
+
+    class _Clob:
+        def create_order(self, args):
+            if args.token_id == "t2":
+                second_signed.set()
+            return args
+
+        def post_order(self, signed, orderType=None):
+            # The next sell is signed while this one is still posting.
+            if signed.token_id == "t1":
+                assert second_signed.wait(timeout=5)
+            events.append(signed.token_id)
+            if signed.token_id == "t3":
+                raise RuntimeError("boom")
+            return {"orderID": f"o-{signed.token_id}", "status": "matched", "size_matched": "10"}
+
+    closer.client = _Clob()  # type: ignore[assignment]
+    positions = [
+        _make_position(position_id="p1", token_id="t1"),
+        _make_position(position_id="p2", token_id="t2"),
+        _make_position(position_id="p3", token_id="t3"),
+    ]
+    prices = {"t1": Decimal("0.60"), "t2": Decimal("0.60"), "t3": Decimal("0.60")}
+
+    async def _inside_loop():
+        return closer.close_positions(positions, prices)
+
+    results = asyncio.run(_inside_loop())
+
+    assert events == ["t1", "t2", "t3"]
+    assert [(r.position_id, r.reason) for r in results] == [
+        ("p1", "live_closed"),
+        ("p2", "live_closed"),
+        ("p3", "error"),
+    ]
+
+
+def test_check_and_close_leaves_unrealized_pnl_to_caller():
+    closer, pm, _ = _make_closer()
+    pos = _make_position(strategy="arbitrage", entry_price=Decimal("0.50"))
+    pm.get_open_positions.return_value = [pos]
+
+    results = closer.check_and_close_positions({"tok1": Decimal("0.60")})
+
+    assert [r.reason for r in results] == ["paper_closed"]
+    pm.update_unrealized_pnl.assert_not_called()
+
+
+def test_iter_check_and_close_positions_is_lazy():
+    closer, pm, _ = _make_closer()
+    redeemable = _make_position(position_id="r1", is_redeemable=True)
+    pm.get_redeemable_positions.return_value = [redeemable]
+    pm.get_open_positions.return_value = [_make_position(position_id="p1", token_id="t1")]
+
+    results = closer.iter_check_and_close_positions({"t1": Decimal("0.60")})
+    assert next(results).reason == "paper_redeemed"
+    pm.get_individually_closeable_positions.assert_not_called()
+
+    assert [r.position_id for r in results] == ["p1"]
+    assert sys.version_info < (3, 10) or not hasattr(CloseResult(True, "x", "y"), "__dict__")
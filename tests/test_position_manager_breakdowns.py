@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from polymarket_bot.position_manager import PositionManager
+from polymarket_bot.position_manager import EXIT_POLICY_CLOSEABLE, EXIT_POLICY_HELD, PositionManager
 
 
 def test_portfolio_stats_includes_breakdowns(tmp_path):
@@ -40,3 +40,489 @@ def test_portfolio_stats_includes_breakdowns(tmp_path):
     assert "cost" in stats["by_strategy"]
     assert stats["by_strategy"]["cost"]["market_making"] > 0
     assert stats["by_strategy"]["cost"]["sniping"] > 0
+
+
+def test_open_arb_count_tracks_open_close_and_reload(tmp_path):
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path))
+
+    legs = [
+        pm.open_position(
+            condition_id="c1",
+            token_id=f"t{i}",
+            outcome="YES",
+            strategy="multi_outcome_arb",
+            entry_price=Decimal("0.3"),
+            quantity=Decimal("10"),
+        )
+        for i in range(3)
+    ]
+    pm.open_position(
+        condition_id="c2",
+        token_id="t9",
+        outcome="NO",
+        strategy="sniping",
+        entry_price=Decimal("0.6"),
+        quantity=Decimal("5"),
+    )
+    assert pm.open_arb_count == 3
+
+    pm.close_position(legs[0].position_id, exit_price=Decimal("0.4"))
+    pm.mark_redeemable(legs[1].position_id)
+    assert pm.open_arb_count == 1
+
+    assert PositionManager(storage_path=str(path)).open_arb_count == 1
+
+
+def test_iter_positions_with_prices_refreshes_pnl_in_one_pass():
+    pm = PositionManager()
+    single = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+    legs = [
+        pm.open_position(
+            condition_id="c2", token_id=f"a{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.3"), quantity=Decimal("10"),
+        )
+        for i in range(3)
+    ]
+    pm.close_position(
+        pm.open_position(
+            condition_id="c3", token_id="t3", outcome="NO", strategy="sniping",
+            entry_price=Decimal("0.5"), quantity=Decimal("1"),
+        ).position_id,
+        exit_price=Decimal("0.6"),
+    )
+
+    pairs = list(pm.iter_positions_with_prices({"t1": Decimal("0.5"), "a0": Decimal("0.9")}))
+
+    assert [(p.position_id, price) for p, price in pairs] == [
+        (single.position_id, Decimal("0.5")),
+        (legs[0].position_id, Decimal("0.9")),
+        (legs[1].position_id, None),
+        (legs[2].position_id, None),
+    ]
+    assert single.unrealized_pnl == Decimal("1.0")
+    # Arb legs share the group P&L: (1.00 - 0.90) * 10 / 3 legs.
+    assert all(leg.unrealized_pnl == Decimal("1.0") / 3 for leg in legs)
+
+
+def test_exit_policy_buckets_follow_position_lifecycle():
+    pm = PositionManager()
+    single = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+    leg = pm.open_position(
+        condition_id="c2", token_id="a0", outcome="YES", strategy="conditional_arb",
+        entry_price=Decimal("0.3"), quantity=Decimal("10"),
+    )
+
+    assert (single.exit_policy, leg.exit_policy) == (EXIT_POLICY_CLOSEABLE, EXIT_POLICY_HELD)
+    assert pm.get_individually_closeable_positions() == [single]
+    assert pm.get_held_to_resolution_positions() == [leg]
+
+    pm.close_position(single.position_id, exit_price=Decimal("0.5"))
+    assert pm.get_individually_closeable_positions() == []
+
+    pm.reset_all_positions()
+    assert pm.get_held_to_resolution_positions() == []
+
+
+def test_update_unrealized_pnl_skips_unchanged_marks():
+    pm = PositionManager()
+    pos = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+
+    pm.update_unrealized_pnl({"t1": Decimal("0.5")})
+    assert pos.unrealized_pnl == Decimal("1.0")
+
+    pos.unrealized_pnl = Decimal("-99")  # sentinel: an unchanged mark must not recompute
+    pm.update_unrealized_pnl({"t1": Decimal("0.5")})
+    assert pos.unrealized_pnl == Decimal("-99")
+
+    pm.update_unrealized_pnl({"t1": Decimal("0.6")})
+    assert pos.unrealized_pnl == Decimal("2.0")
+
+
+def test_arb_group_pnl_is_cached_until_membership_changes():
+    pm = PositionManager()
+    legs = [
+        pm.open_position(
+            condition_id="c1", token_id=f"a{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.3"), quantity=Decimal("10"),
+        )
+        for i in range(2)
+    ]
+    pm.update_unrealized_pnl({})
+    assert all(leg.unrealized_pnl == Decimal("2.0") for leg in legs)  # (1.00 - 0.60) * 10 / 2
+    assert pm._arb_group_pnl == {"c1": Decimal("2.0")}
+
+    third = pm.open_position(
+        condition_id="c1", token_id="a2", outcome="YES", strategy="multi_outcome_arb",
+        entry_price=Decimal("0.3"), quantity=Decimal("10"),
+    )
+    assert "c1" not in pm._arb_group_pnl
+    pm.update_unrealized_pnl({})
+    assert third.unrealized_pnl == Decimal("1.0") / 3
+
+    pm.close_position(third.position_id, exit_price=Decimal("0.3"))
+    pm.update_unrealized_pnl({})
+    assert all(leg.unrealized_pnl == Decimal("2.0") for leg in legs)
+
+
+def test_secondary_indexes_follow_status_changes(tmp_path):
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path))
+    a = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+    b = pm.open_position(
+        condition_id="c1", token_id="t2", outcome="NO", strategy="market_making",
+        entry_price=Decimal("0.5"), quantity=Decimal("10"),
+    )
+    c = pm.open_position(
+        condition_id="c2", token_id="t3", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.6"), quantity=Decimal("10"),
+    )
+    assert pm.get_open_condition_ids() == ["c1", "c2"]
+
+    pm.mark_redeemable(a.position_id)
+    pm.close_position(c.position_id, exit_price=Decimal("0.7"))
+
+    assert pm.get_open_positions() == [b]
+    assert pm.get_redeemable_positions() == [a]
+    assert pm.get_open_condition_ids() == ["c1"]
+    assert pm.get_positions_by_condition("c1") == [a, b]
+    assert pm.get_open_positions_by_condition("c1") == [b]
+    assert pm.get_open_positions_by_condition("c2") == []
+    assert pm.get_positions_by_strategy("sniping") == [a, c]
+
+    pm.close_position(a.position_id, exit_price=Decimal("1.0"))
+    assert pm.get_redeemable_positions() == []
+
+    reloaded = PositionManager(storage_path=str(path))
+    assert [p.position_id for p in reloaded.get_open_positions()] == [b.position_id]
+    assert reloaded.get_open_condition_ids() == ["c1"]
+    assert len(reloaded.get_positions_by_strategy("sniping")) == 2
+
+
+def test_debounced_saves_coalesce_until_flush(tmp_path):
+    import json
+
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path), save_interval_seconds=3600.0)
+    for i in range(3):
+        pm.open_position(
+            condition_id="c1", token_id=f"t{i}", outcome="YES", strategy="sniping",
+            entry_price=Decimal("0.4"), quantity=Decimal("10"),
+        )
+    assert not path.exists()
+    assert pm._dirty_ids == {"pos_1", "pos_2", "pos_3"}
+
+    pm.flush()
+    assert len(path.with_suffix(".log").read_bytes().splitlines()) == 3
+    assert PositionManager(storage_path=str(path))._next_position_id == 4
+    assert not pm._dirty_ids
+
+    pm.close_position("pos_1", exit_price=Decimal("0.5"))
+    pm.close()
+    assert json.loads(path.read_text())["positions"][0]["status"] == "closed"
+    assert not path.with_suffix(".tmp").exists()
+    assert not path.with_suffix(".log").exists()
+
+    # After close(), changes are written through.
+    pm.close_position("pos_2", exit_price=Decimal("0.5"))
+    assert json.loads(path.read_text())["positions"][1]["status"] == "closed"
+
+
+def test_failed_snapshot_keeps_changes_pending(tmp_path, monkeypatch):
+    from polymarket_bot import position_manager
+
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path), save_interval_seconds=3600.0)
+    pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+
+    def _fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(position_manager.os, "replace", _fail)
+    pm._save_positions()
+    assert pm._dirty_ids == {"pos_1"}
+
+    monkeypatch.undo()
+    pm.close()
+    assert not pm._dirty_ids
+    assert PositionManager(storage_path=str(path)).get_position("pos_1") is not None
+
+
+def test_failed_log_append_keeps_changes_pending(tmp_path, monkeypatch):
+    from polymarket_bot.position_manager import Position
+
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path), save_interval_seconds=3600.0)
+    pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+
+    def _broken(self):
+        raise TypeError("unserializable metadata")
+
+    monkeypatch.setattr(Position, "to_dict", _broken)
+    pm.flush()
+    assert pm._dirty_ids == {"pos_1"}
+    assert not path.with_suffix(".log").exists()
+
+    monkeypatch.undo()
+    pm.flush()
+    assert not pm._dirty_ids
+    assert len(path.with_suffix(".log").read_bytes().splitlines()) == 1
+    pm.close()
+
+
+def test_snapshot_waits_for_in_flight_mutation(tmp_path):
+    import threading
+
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path), save_interval_seconds=3600.0)
+    pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+
+    with pm._state_lock:
+        writer = threading.Thread(target=pm._save_positions)
+        writer.start()
+        writer.join(0.1)
+        assert writer.is_alive()
+        assert not path.exists()
+    writer.join(5)
+    assert path.exists()
+    pm.close()
+
+
+def test_position_log_replays_over_snapshot(tmp_path):
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path))
+    pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+
+    pm.save_interval_seconds = 3600.0
+    pm.close_position("pos_1", exit_price=Decimal("0.5"))
+    pm.open_position(
+        condition_id="c2", token_id="t2", outcome="NO", strategy="sniping",
+        entry_price=Decimal("0.6"), quantity=Decimal("5"),
+    )
+    pm.flush()
+    with open(path.with_suffix(".log"), "ab") as f:
+        f.write(b'{"op": "ups')  # torn tail from a crash mid-append
+
+    reloaded = PositionManager(storage_path=str(path))
+    assert reloaded.get_position("pos_1").is_closed
+    assert reloaded.get_position("pos_1").realized_pnl == Decimal("1.0")
+    assert [p.position_id for p in reloaded.get_open_positions()] == ["pos_2"]
+    assert reloaded._next_position_id == 3
+    pm.close()
+
+
+def test_portfolio_stats_running_totals_match_full_scan(tmp_path):
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path))
+    for i, strategy in enumerate(["sniping", "sniping", "market_making", "multi_outcome_arb"]):
+        pm.open_position(
+            condition_id=f"c{i % 2}", token_id=f"t{i}", outcome="YES", strategy=strategy,
+            entry_price=Decimal("0.4"), quantity=Decimal("10"),
+        )
+    pm.close_position("pos_1", exit_price=Decimal("0.55"))
+    pm.close_position("pos_3", exit_price=Decimal("0.30"))
+    pm.close_position("pos_3", exit_price=Decimal("0.35"))  # re-close replaces, not adds
+    pm.mark_redeemable("pos_4")
+    pm.update_unrealized_pnl({"t1": Decimal("0.5")})
+
+    stats = pm.get_portfolio_stats()
+    closed = [p for p in pm.positions.values() if p.is_closed]
+
+    assert stats["closed_positions"] == 2
+    assert stats["total_realized_pnl"] == float(sum(p.realized_pnl for p in closed))
+    assert stats["by_strategy"]["realized"] == {"sniping": 1.5, "market_making": -0.5}
+    assert stats["cost_by_condition"] == {"c1": 8.0}
+    assert stats["unrealized_pnl_by_condition"] == {"c1": 7.0}
+    assert stats["total_cost_basis"] == 8.0
+    assert stats["total_unrealized_pnl"] == 7.0
+    assert stats["realized_roi"] == stats["total_realized_pnl"] / 8.0 * 100
+
+    reloaded = PositionManager(storage_path=str(path)).get_portfolio_stats()
+    assert reloaded["total_realized_pnl"] == stats["total_realized_pnl"]
+    assert reloaded["by_strategy"]["realized"] == stats["by_strategy"]["realized"]
+    assert reloaded["cost_by_condition"] == stats["cost_by_condition"]
+    assert reloaded["by_strategy"]["cost"] == stats["by_strategy"]["cost"]
+
+    pm.close_position("pos_2", exit_price=Decimal("0.5"))
+    pm.close_position("pos_4", exit_price=Decimal("1.0"))
+    drained = pm.get_portfolio_stats()
+    assert drained["cost_by_condition"] == {}
+    assert drained["by_strategy"]["cost"] == {}
+    assert drained["total_cost_basis"] == 0.0
+    assert drained["closed_positions"] == 4
+
+
+def test_open_conditions_flag_neg_risk_groups():
+    pm = PositionManager()
+    pm.open_position(
+        condition_id="0xgroup", token_id="a0", outcome="YES", strategy="multi_outcome_arb",
+        entry_price=Decimal("0.3"), quantity=Decimal("10"),
+    )
+    pm.open_position(
+        condition_id="12345", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+
+    assert pm.get_open_conditions() == [("0xgroup", True), ("12345", False)]
+
+
+def test_closed_position_dict_is_built_once():
+    pm = PositionManager()
+    pos = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+    assert pos.to_dict() is not pos.to_dict()  # open positions still change
+
+    pm.close_position(pos.position_id, exit_price=Decimal("0.5"))
+    first = pos.to_dict()
+    assert pos.to_dict() is first
+    assert first["status"] == "closed" and first["realized_pnl"] == "1.0"
+
+    pm.close_position(pos.position_id, exit_price=Decimal("0.6"))
+    assert pos.to_dict()["realized_pnl"] == "2.0"
+
+
+def test_next_position_id_is_derived_from_ids_on_load(tmp_path):
+    import json
+
+    path = tmp_path / "positions.json"
+    pm = PositionManager(storage_path=str(path), save_interval_seconds=3600.0)
+    for i in range(3):
+        pm.open_position(
+            condition_id="c1", token_id=f"t{i}", outcome="YES", strategy="sniping",
+            entry_price=Decimal("0.4"), quantity=Decimal("10"),
+        )
+    pm.flush()
+    assert b"next_position_id" not in path.with_suffix(".log").read_bytes()
+    assert PositionManager(storage_path=str(path))._next_position_id == 4
+    pm.close()
+
+    # Snapshots written without the counter (or with a stale one) still resume past the max id.
+    data = json.loads(path.read_text())
+    data["next_position_id"] = 2
+    data["positions"].append({**data["positions"][0], "position_id": "legacy-id"})
+    path.write_text(json.dumps(data))
+    assert PositionManager(storage_path=str(path))._next_position_id == 4
+
+
+def test_bracket_map_tracks_open_arb_legs(tmp_path):
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    legs = [
+        pm.open_position(
+            condition_id="0xgroup", token_id=f"t{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.3"), quantity=Decimal("10"),
+            metadata={"bracket_condition_id": bcid},
+        )
+        for i, bcid in enumerate(["0xb1", "0xb1", "0xb2"])
+    ]
+    pm.open_position(
+        condition_id="0xgroup", token_id="t9", outcome="YES", strategy="multi_outcome_arb",
+        entry_price=Decimal("0.3"), quantity=Decimal("10"),
+    )
+
+    assert {k: [p.position_id for p in v] for k, v in pm.get_bracket_map("0xgroup").items()} == {
+        "0xb1": [legs[0].position_id, legs[1].position_id],
+        "0xb2": [legs[2].position_id],
+    }
+
+    pm.mark_redeemable(legs[2].position_id)
+    pm.close_position(legs[0].position_id, exit_price=Decimal("0"))
+    assert list(pm.get_bracket_map("0xgroup")) == ["0xb1"]
+
+    reloaded = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    bracket_legs = reloaded.get_bracket_map("0xgroup")["0xb1"]
+    assert [p.position_id for p in bracket_legs] == [legs[1].position_id]
+
+    pm.close_position(legs[1].position_id, exit_price=Decimal("0"))
+    assert pm.get_bracket_map("0xgroup") == {}
+    assert pm.get_bracket_map("0xmissing") == {}
+
+
+def test_redeemable_total_tracks_mutations(tmp_path):
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    a = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+    b = pm.open_position(
+        condition_id="c2", token_id="t2", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("2.5"),
+    )
+    assert pm.get_redeemable_total() == 0
+
+    pm.mark_redeemable(a.position_id)
+    pm.mark_redeemable(a.position_id)
+    pm.mark_redeemable(b.position_id)
+    assert pm.get_redeemable_total() == Decimal("12.5")
+    assert pm.get_redeemable_count() == 2
+
+    reloaded = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    assert reloaded.get_redeemable_total() == Decimal("12.5")
+
+    pm.close_position(a.position_id, exit_price=Decimal("1"))
+    assert pm.get_redeemable_total() == Decimal("2.5")
+    assert pm.get_redeemable_count() == 1
+
+
+def test_batch_settlement_persists_once(tmp_path, monkeypatch):
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    ids = [
+        pm.open_position(
+            condition_id="c1", token_id=f"t{i}", outcome="YES", strategy="sniping",
+            entry_price=Decimal("0.4"), quantity=Decimal("10"),
+        ).position_id
+        for i in range(4)
+    ]
+    saves = []
+    original_save = pm._save_positions
+    monkeypatch.setattr(pm, "_save_positions", lambda: (saves.append(1), original_save()))
+
+    pm.mark_redeemable_many(ids[:2])
+    pnl = pm.close_positions_many(ids[2:], exit_price=Decimal("0"))
+
+    assert len(saves) == 2
+    assert pnl == {ids[2]: Decimal("-4.0"), ids[3]: Decimal("-4.0")}
+    reloaded = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    assert [p.position_id for p in reloaded.get_redeemable_positions()] == ids[:2]
+    assert all(reloaded.get_position(pid).is_closed for pid in ids[2:])
+
+
+def test_closed_then_redeemable_position_persists_redeemable(tmp_path):
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    pos = pm.open_position(
+        condition_id="c1", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.4"), quantity=Decimal("10"),
+    )
+    pm.close_position(pos.position_id, exit_price=Decimal("0"))
+    pos.to_dict()  # populate the closed-dict cache
+    pm.mark_redeemable(pos.position_id)
+
+    assert pos.to_dict()["status"] == "redeemable"
+    reloaded = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    assert reloaded.get_position(pos.position_id).is_redeemable
+    assert [p.position_id for p in reloaded.get_redeemable_positions()] == [pos.position_id]
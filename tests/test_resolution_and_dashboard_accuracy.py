@@ -4,7 +4,7 @@ from decimal import Decimal
 
 from polymarket_bot.dashboard import _render_html
 from polymarket_bot.position_manager import PositionManager
-from polymarket_bot.resolution_monitor import ResolutionMonitor
+from polymarket_bot.resolution_monitor import ResolutionEvent, ResolutionMonitor
 from polymarket_bot.scanner import MarketInfo, MarketScanner, TokenInfo
 
 
@@ -275,3 +275,675 @@ def test_dashboard_uses_daily_pnl_and_expected_labels() -> None:
     assert "Expected ROI (Signals)" in html
     assert "Daily P&amp;L" in html or "Daily P&L" in html
     assert "$-1.23" in html
+
+
+def test_scanner_get_markets_bulk_fetches_with_per_id_fallback() -> None:
+    scanner = MarketScanner()
+    calls: list[tuple[str, object]] = []
+
+    def _payload(mid: str, resolved: bool) -> dict:
+        return {
+            "id": mid,
+            "conditionId": f"0x{mid}",
+            "question": f"Market {mid}",
+            "outcomes": '["Yes","No"]',
+            "outcomePrices": '["1","0"]',
+            "clobTokenIds": f'["{mid}_y","{mid}_n"]',
+            "resolved": resolved,
+            "winning_outcome": "YES" if resolved else None,
+        }
+
+    def fake_get(endpoint: str, params=None):
+        calls.append((endpoint, params))
+        if endpoint == "/markets":
+            return [_payload("101", True), _payload("999", False)]
+        if endpoint == "/markets/102":
+            return _payload("102", False)
+        raise RuntimeError(f"unexpected endpoint: {endpoint}")
+
+    scanner._get = fake_get  # type: ignore[method-assign]
+
+    markets = scanner.get_markets(["101", "102"])
+
+    assert calls[0] == ("/markets", {"id": ["101", "102"], "limit": 2})
+    assert [endpoint for endpoint, _ in calls[1:]] == ["/markets/102"]
+    assert sorted(markets) == ["101", "102"]
+    assert markets["101"].resolved is True
+
+
+def test_resolution_monitor_fetches_markets_in_one_call(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    win = pm.open_position(
+        condition_id="101", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+    pm.open_position(
+        condition_id="102", token_id="t2", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+
+    class _BulkScanner:
+        def __init__(self) -> None:
+            self.requests: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.requests.append(list(market_ids))
+            resolved = MarketInfo(
+                condition_id="101", question="Resolved", end_date=None, tokens=[],
+                volume=Decimal("0"), liquidity=Decimal("0"), active=False, closed=True,
+                resolved=True, winning_outcome="YES",
+            )
+            return {"101": resolved}
+
+        def get_market(self, condition_id):  # pragma: no cover - must not be used
+            raise AssertionError("per-market lookup")
+
+    scanner = _BulkScanner()
+    monitor = ResolutionMonitor(position_manager=pm, scanner=scanner, check_interval=0.0)  # type: ignore[arg-type]
+
+    events = monitor.check_resolutions()
+
+    assert scanner.requests == [["101", "102"]]
+    assert [e.condition_id for e in events] == ["101"]
+    assert win.is_redeemable
+
+
+def test_process_resolution_matches_outcomes_case_insensitively(tmp_path, caplog) -> None:
+    import logging
+
+    caplog.set_level(logging.INFO, logger="polymarket_bot.resolution_monitor")
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    yes = pm.open_position(
+        condition_id="101", token_id="t_yes", outcome="Yes", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+    no = pm.open_position(
+        condition_id="101", token_id="t_no", outcome="No", strategy="sniping",
+        entry_price=Decimal("0.50"), quantity=Decimal("10"),
+    )
+    assert yes.outcome_upper == "YES"
+
+    monitor = ResolutionMonitor(position_manager=pm, scanner=MarketScanner(), check_interval=0.0)
+    event = ResolutionEvent(
+        condition_id="101", question="q", winning_outcome="yes", resolved_time=0.0,
+        affected_positions=[yes.position_id, no.position_id],
+    )
+    monitor._process_resolution(event, market=None)
+
+    assert yes.is_redeemable
+    assert no.is_closed and no.realized_pnl == Decimal("-5.00")
+
+    lost = next(r for r in caplog.records if "lost" in r.msg)
+    assert "%" in lost.msg and lost.args
+    assert lost.getMessage().endswith("P&L: $-5.0000")
+
+
+def test_scanner_get_markets_batches_condition_ids_in_chunks(monkeypatch) -> None:
+    import polymarket_bot.scanner as scanner_mod
+
+    monkeypatch.setattr(scanner_mod, "GAMMA_BATCH_SIZE", 2)
+    scanner = MarketScanner()
+    calls: list[dict] = []
+
+    def fake_get(endpoint: str, params=None):
+        assert endpoint == "/markets"
+        calls.append(params)
+        return [
+            {"id": str(i), "conditionId": cid.upper().replace("0X", "0x"), "question": cid}
+            for i, cid in enumerate(params["condition_ids"])
+        ]
+
+    scanner._get = fake_get  # type: ignore[method-assign]
+
+    markets = scanner.get_markets(["0xa1", "0xb2", "0xc3", "0xa1"])
+
+    assert [p["condition_ids"] for p in calls] == [["0xa1", "0xb2"], ["0xc3"]]
+    assert {cid: m.question for cid, m in markets.items()} == {
+        "0xa1": "0xa1", "0xb2": "0xb2", "0xc3": "0xc3",
+    }
+
+
+def test_arb_bracket_check_uses_one_bulk_lookup(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    for i, bcid in enumerate(["0xb1", "0xb2", "0xb3"]):
+        pm.open_position(
+            condition_id="0xgroup", token_id=f"tok{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.30"), quantity=Decimal("10"),
+            metadata={"bracket_condition_id": bcid},
+        )
+
+    class _BulkScanner(_StubScanner):
+        def __init__(self) -> None:
+            super().__init__("0xb2")
+            self.batches: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            return {cid: m for cid in market_ids if (m := _StubScanner.get_market(self, cid))}
+
+        def get_market(self, condition_id):  # pragma: no cover - must not be used
+            raise AssertionError("per-bracket lookup")
+
+    scanner = _BulkScanner()
+    monitor = ResolutionMonitor(position_manager=pm, scanner=scanner, check_interval=0.0)  # type: ignore[arg-type]
+
+    events = monitor.check_resolutions()
+
+    assert scanner.batches == [["0xb1", "0xb2", "0xb3"]]
+    assert [e.condition_id for e in events] == ["0xgroup"]
+    assert len(pm.get_redeemable_positions()) == 1
+
+
+def test_check_resolutions_batches_plain_and_bracket_ids_together(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    pm.open_position(
+        condition_id="101", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+    for i, bcid in enumerate(["0xb1", "0xb2"]):
+        pm.open_position(
+            condition_id="0xgroup", token_id=f"tok{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.30"), quantity=Decimal("10"),
+            metadata={"bracket_condition_id": bcid},
+        )
+
+    class _BulkScanner(_StubScanner):
+        def __init__(self) -> None:
+            super().__init__("0xb1")
+            self.batches: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            return {cid: m for cid in market_ids if (m := _StubScanner.get_market(self, cid))}
+
+    scanner = _BulkScanner()
+    monitor = ResolutionMonitor(position_manager=pm, scanner=scanner, check_interval=0.0)  # type: ignore[arg-type]
+
+    events = monitor.check_resolutions()
+
+    assert scanner.batches == [["101", "0xb1", "0xb2"]]
+    assert [e.condition_id for e in events] == ["0xgroup"]
+
+
+def test_market_resolved_event_triggers_targeted_check(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    pm.open_position(
+        condition_id="101", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+    pm.open_position(
+        condition_id="202", token_id="t2", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+
+    class _Scanner:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            return {}
+
+    scanner = _Scanner()
+    monitor = ResolutionMonitor(position_manager=pm, scanner=scanner, check_interval=3600.0)  # type: ignore[arg-type]
+    monitor.check_resolutions()
+    assert scanner.batches == [["101", "202"]]
+
+    # Within the interval nothing is fetched until a resolution event arrives.
+    monitor.check_resolutions()
+    monitor.notify_market_event([{"event_type": "price_change", "asset_id": "t1"}])
+    assert not monitor.has_pending_hints
+    monitor.notify_market_event(
+        {"event_type": "market_resolved", "market": "0xabc", "assets_ids": ["t2", "tx"]}
+    )
+    assert monitor.has_pending_hints
+    monitor.check_resolutions()
+
+    assert scanner.batches == [["101", "202"], ["202"]]
+    assert not monitor.has_pending_hints
+
+
+def test_unchanged_markets_are_not_rescanned_within_ttl(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    pm.open_position(
+        condition_id="101", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+
+    class _Scanner:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            return {
+                cid: MarketInfo(
+                    condition_id=cid, question=cid, end_date=None, tokens=[],
+                    volume=Decimal("0"), liquidity=Decimal("0"),
+                    active=True, closed=False, resolved=False,
+                )
+                for cid in market_ids
+            }
+
+    scanner = _Scanner()
+    monitor = ResolutionMonitor(  # type: ignore[arg-type]
+        position_manager=pm, scanner=scanner, check_interval=0.0, unresolved_ttl=0.0,
+    )
+
+    monitor.check_resolutions()
+    monitor.check_resolutions()
+    assert scanner.batches == [["101"]]
+
+    # Any position change invalidates the cached scans.
+    pm.open_position(
+        condition_id="202", token_id="t2", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+    monitor.check_resolutions()
+    assert scanner.batches == [["101"], ["101", "202"]]
+
+    monitor.rescan_ttl = 0.0
+    monitor.check_resolutions()
+    assert scanner.batches[-1] == ["101", "202"]
+
+
+def test_unresolved_answers_are_cached_per_market_and_bracket(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    pm.open_position(
+        condition_id="101", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+    for i, bcid in enumerate(["0xb1", "0xb2"]):
+        pm.open_position(
+            condition_id="0xgroup", token_id=f"tok{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.30"), quantity=Decimal("10"),
+            metadata={"bracket_condition_id": bcid},
+        )
+
+    def _open_market(cid: str) -> MarketInfo:
+        return MarketInfo(
+            condition_id=cid, question=cid, end_date=None, tokens=[],
+            volume=Decimal("0"), liquidity=Decimal("0"), active=True, closed=False, resolved=False,
+        )
+
+    class _Scanner:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            # 0xb2 is missing from Gamma, so it is never negatively cached.
+            return {cid: _open_market(cid) for cid in market_ids if cid != "0xb2"}
+
+    scanner = _Scanner()
+    monitor = ResolutionMonitor(  # type: ignore[arg-type]
+        position_manager=pm, scanner=scanner, check_interval=0.0, rescan_ttl=0.0,
+    )
+
+    monitor.check_resolutions()
+    monitor.check_resolutions()
+    assert scanner.batches == [["101", "0xb1", "0xb2"], ["0xb2"]]
+
+    monitor.unresolved_ttl = 0.0
+    monitor._unresolved_until = {k: 0.0 for k in monitor._unresolved_until}
+    monitor.check_resolutions()
+    assert scanner.batches[-1] == ["101", "0xb1", "0xb2"]
+
+
+def test_already_resolved_conditions_are_not_refetched(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    for cid in ("101", "202"):
+        pm.open_position(
+            condition_id=cid, token_id=f"t{cid}", outcome="YES", strategy="sniping",
+            entry_price=Decimal("0.40"), quantity=Decimal("10"),
+        )
+
+    class _Scanner:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            return {}
+
+    scanner = _Scanner()
+    monitor = ResolutionMonitor(position_manager=pm, scanner=scanner, check_interval=0.0)  # type: ignore[arg-type]
+    monitor._resolved_markets["101"] = ResolutionEvent("101", "q", "YES", 0.0, [])
+
+    monitor.check_resolutions()
+
+    assert scanner.batches == [["202"]]
+
+
+def test_failed_lookups_are_reported_and_retried(tmp_path, caplog) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    pm.open_position(
+        condition_id="101", token_id="t1", outcome="YES", strategy="sniping",
+        entry_price=Decimal("0.40"), quantity=Decimal("10"),
+    )
+
+    class _Scanner:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+            self.available = False
+
+        def get_markets(self, market_ids):
+            self.batches.append(list(market_ids))
+            if not self.available:
+                return {}
+            return {
+                cid: MarketInfo(
+                    condition_id=cid, question=cid, end_date=None, tokens=[],
+                    volume=Decimal("0"), liquidity=Decimal("0"),
+                    active=True, closed=False, resolved=False,
+                )
+                for cid in market_ids
+            }
+
+    scanner = _Scanner()
+    monitor = ResolutionMonitor(  # type: ignore[arg-type]
+        position_manager=pm, scanner=scanner, check_interval=0.0, unresolved_ttl=0.0,
+    )
+
+    with caplog.at_level("WARNING", logger="polymarket_bot.resolution_monitor"):
+        monitor.check_resolutions()
+        monitor.check_resolutions()
+    assert [r.getMessage() for r in caplog.records] == [
+        "No market data for 1 id(s) (101); retrying next check",
+    ]
+    assert monitor.get_stats()["failed_lookups"] == 1
+
+    scanner.available = True
+    monitor.check_resolutions()
+    monitor.check_resolutions()
+    assert scanner.batches == [["101"]] * 3
+    assert monitor.get_stats()["failed_lookups"] == 0
+
+
+def test_arb_brackets_checked_earliest_end_date_first(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    legs = {
+        bcid: pm.open_position(
+            condition_id="0xgroup", token_id=f"tok_{bcid}", outcome="YES",
+            strategy="multi_outcome_arb",
+            entry_price=Decimal("0.30"), quantity=Decimal("10"),
+            metadata={"bracket_condition_id": bcid},
+        )
+        for bcid in ("0xmissing", "0xlate", "0xearly")
+    }
+
+    def _resolved(cid: str, end_date: str) -> MarketInfo:
+        return MarketInfo(
+            condition_id=cid, question=cid, end_date=end_date, tokens=[],
+            volume=Decimal("0"), liquidity=Decimal("0"), active=False, closed=True, resolved=True,
+            winning_outcome="YES",
+        )
+
+    class _Scanner:
+        def get_markets(self, market_ids):
+            return {
+                "0xlate": _resolved("0xlate", "2024-06-01T00:00:00Z"),
+                "0xearly": _resolved("0xearly", "2024-01-01T00:00:00Z"),
+            }
+
+        def get_market_by_token(self, token_id):  # pragma: no cover - must not be used
+            raise AssertionError("token lookup before fetched brackets")
+
+    monitor = ResolutionMonitor(position_manager=pm, scanner=_Scanner(), check_interval=0.0)  # type: ignore[arg-type]
+
+    monitor.check_resolutions()
+
+    assert pm.get_position(legs["0xearly"].position_id).is_redeemable
+    assert pm.get_position(legs["0xlate"].position_id).is_closed
+    assert pm.get_position(legs["0xmissing"].position_id).is_closed
+
+
+def test_staggered_checks_spread_markets_across_interval(tmp_path, monkeypatch) -> None:
+    import zlib
+
+    import polymarket_bot.resolution_monitor as monitor_mod
+
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    cids = ["101", "202", "303"]
+    for cid in cids:
+        pm.open_position(
+            condition_id=cid, token_id=f"t{cid}", outcome="YES", strategy="sniping",
+            entry_price=Decimal("0.40"), quantity=Decimal("10"),
+        )
+    offsets = {cid: zlib.crc32(cid.encode()) % 60 for cid in cids}
+
+    class _Scanner:
+        def __init__(self) -> None:
+            self.seen: dict[str, list[int]] = {cid: [] for cid in cids}
+            self.now = 0
+
+        def get_markets(self, market_ids):
+            for cid in market_ids:
+                self.seen[cid].append(self.now)
+            return {}
+
+    scanner = _Scanner()
+    monkeypatch.setattr(monitor_mod.time, "time", lambda: float(scanner.now))
+    monitor = ResolutionMonitor(  # type: ignore[arg-type]
+        position_manager=pm, scanner=scanner, check_interval=60.0, rescan_ttl=0.0, stagger=True,
+    )
+
+    for second in range(0, 180):
+        scanner.now = second
+        monitor.check_resolutions()
+
+    for cid in cids:
+        assert scanner.seen[cid] == [offsets[cid], offsets[cid] + 60, offsets[cid] + 120]
+
+
+def test_scanner_get_reuses_session_and_decodes_with_orjson() -> None:
+    scanner = MarketScanner(api_base="https://gamma.example")
+    calls: list[tuple[str, object]] = []
+
+    class _Response:
+        content = b'[{"id": "101"}]'
+
+        def raise_for_status(self) -> None:
+            pass
+
+    class _Session:
+        def get(self, url, params=None, timeout=None):
+            calls.append((url, params))
+            return _Response()
+
+        def close(self) -> None:
+            calls.append(("closed", None))
+
+    scanner._session = _Session()  # type: ignore[assignment]
+
+    assert scanner._get("/markets", params={"id": ["101"]}) == [{"id": "101"}]
+    assert scanner._get("/markets/101") == [{"id": "101"}]
+    scanner.close()
+
+    assert calls == [
+        ("https://gamma.example/markets", {"id": ["101"]}),
+        ("https://gamma.example/markets/101", None),
+        ("closed", None),
+    ]
+
+
+def test_scanner_get_markets_async_fans_out_lookups() -> None:
+    import asyncio
+
+    import httpx
+
+    requests_seen: list[str] = []
+
+    def _payload(mid: str) -> dict:
+        return {"id": mid, "conditionId": f"0x{mid}", "question": f"Market {mid}", "resolved": True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(str(request.url))
+        if request.url.path == "/markets" and request.url.params.get_list("id"):
+            return httpx.Response(200, json=[_payload("101")])
+        if request.url.path == "/markets":
+            return httpx.Response(200, json=[_payload("abc")])
+        if request.url.path == "/markets/102":
+            return httpx.Response(200, json=_payload("102"))
+        return httpx.Response(404)
+
+    scanner = MarketScanner(api_base="https://gamma.example")
+
+    async def run() -> dict:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await scanner.get_markets_async(["101", "102", "0xABC"], http=http)
+
+    markets = asyncio.run(run())
+
+    assert list(markets) == ["101", "102", "0xABC"]
+    assert markets["0xABC"].question == "Market abc"
+    assert sorted(requests_seen) == [
+        "https://gamma.example/markets/102",
+        "https://gamma.example/markets?condition_ids=0xabc&limit=1",
+        "https://gamma.example/markets?id=101&id=102&limit=2",
+    ]
+
+
+def test_scanner_circuit_opens_after_consecutive_outage_errors(monkeypatch) -> None:
+    import pytest
+    import requests
+
+    import polymarket_bot.scanner as scanner_mod
+
+    scanner = MarketScanner()
+    calls: list[str] = []
+    errors: list[Exception] = []
+
+    def fake_get_with_retry(endpoint: str, params=None):
+        calls.append(endpoint)
+        if errors:
+            raise errors.pop(0)
+        return []
+
+    scanner._get_with_retry = fake_get_with_retry  # type: ignore[method-assign]
+
+    # Client errors mean Gamma is up and reset the failure count.
+    not_found = requests.exceptions.HTTPError(response=type("R", (), {"status_code": 404})())
+    errors[:] = [requests.exceptions.ConnectionError()] * 4 + [not_found]
+    for _ in range(5):
+        with pytest.raises(requests.exceptions.RequestException):
+            scanner._get("/markets")
+
+    errors[:] = [requests.exceptions.ConnectionError()] * (scanner_mod.GAMMA_FAILURE_THRESHOLD - 1)
+    for _ in range(scanner_mod.GAMMA_FAILURE_THRESHOLD - 1):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            scanner._get("/markets")
+    assert scanner._get("/markets") == []  # success resets the count
+
+    errors[:] = [requests.exceptions.ConnectionError()] * scanner_mod.GAMMA_FAILURE_THRESHOLD
+    for _ in range(scanner_mod.GAMMA_FAILURE_THRESHOLD):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            scanner._get("/markets")
+    made = len(calls)
+    with pytest.raises(scanner_mod.CircuitOpenError):
+        scanner._get("/markets")
+    assert len(calls) == made
+    assert scanner.get_markets(["101"]) == {}
+    assert len(calls) == made
+
+    scanner._circuit_open_until = 0.0
+    assert scanner._get("/markets") == []
+
+
+def test_scanner_parse_markets_batch_matches_per_row_parse() -> None:
+    scanner = MarketScanner()
+    rows = [
+        {
+            "id": "1", "conditionId": "0x1", "question": "Q1",
+            "outcomes": '["Yes","No"]', "outcomePrices": '["0.55", 0.45]',
+            "clobTokenIds": '["a","b"]', "volume": 1000, "liquidity": 12.5,
+            "bestBid": "0.54", "spread": 0.01,
+        },
+        {"id": "2", "conditionId": "0x2", "outcomes": '["Yes"]', "volume": "oops"},
+        {"id": "3", "conditionId": "0x3", "question": "Q3", "volume": 0.1},
+    ]
+
+    markets, errors = scanner._parse_markets_batch(rows)
+
+    assert errors == 1
+    assert markets == [scanner._parse_market(rows[0]), scanner._parse_market(rows[2])]
+    first = markets[0]
+    assert [t.price for t in first.tokens] == [Decimal("0.55"), Decimal("0.45")]
+    assert first.volume == Decimal("1000") and first.liquidity == Decimal("12.5")
+    assert first.best_bid == Decimal("0.54") and first.spread == Decimal("0.01")
+    assert markets[1].volume == Decimal("0.1")
+
+
+def test_token_fallback_hits_are_not_reported_as_failed_lookups(tmp_path, caplog) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    for i, bcid in enumerate(["0xb1", "0xb2"]):
+        pm.open_position(
+            condition_id="0xgroup", token_id=f"tok{i}", outcome="YES", strategy="multi_outcome_arb",
+            entry_price=Decimal("0.30"), quantity=Decimal("10"),
+            metadata={"bracket_condition_id": bcid},
+        )
+
+    class _Scanner:
+        def get_markets(self, market_ids):
+            return {}
+
+        def get_market_by_token(self, token_id):
+            return MarketInfo(
+                condition_id=token_id, question=token_id, end_date=None, tokens=[],
+                volume=Decimal("0"), liquidity=Decimal("0"),
+                active=True, closed=False, resolved=False,
+            )
+
+    monitor = ResolutionMonitor(position_manager=pm, scanner=_Scanner(), check_interval=0.0)  # type: ignore[arg-type]
+
+    with caplog.at_level("WARNING", logger="polymarket_bot.resolution_monitor"):
+        monitor.check_resolutions()
+
+    assert not [r for r in caplog.records if "No market data" in r.getMessage()]
+    assert monitor.get_stats()["failed_lookups"] == 0
+
+    # The token-id fallback of the existing stub resolves the group: no warning either.
+    caplog.clear()
+    pm2 = PositionManager(storage_path=str(tmp_path / "positions2.json"))
+    pm2.open_position(
+        condition_id="0xgroup", token_id="tok_win", outcome="UNKNOWN", strategy="conditional_arb",
+        entry_price=Decimal("0.25"), quantity=Decimal("8"),
+        metadata={"bracket_condition_id": "0xnot_lookupable"},
+    )
+    monitor2 = ResolutionMonitor(
+        position_manager=pm2,
+        scanner=_StubScannerTokenFallback(),  # type: ignore[arg-type]
+        check_interval=0.0,
+    )
+    with caplog.at_level("WARNING", logger="polymarket_bot.resolution_monitor"):
+        assert len(monitor2.check_resolutions()) == 1
+    assert not [r for r in caplog.records if "No market data" in r.getMessage()]
+
+
+def test_staggered_schedule_forgets_markets_without_open_positions(tmp_path) -> None:
+    pm = PositionManager(storage_path=str(tmp_path / "positions.json"))
+    positions = [
+        pm.open_position(
+            condition_id=cid, token_id=f"t{cid}", outcome="YES", strategy="sniping",
+            entry_price=Decimal("0.40"), quantity=Decimal("10"),
+        )
+        for cid in ("101", "202")
+    ]
+
+    class _Scanner:
+        def get_markets(self, market_ids):
+            return {}
+
+    monitor = ResolutionMonitor(  # type: ignore[arg-type]
+        position_manager=pm, scanner=_Scanner(), check_interval=60.0, stagger=True,
+    )
+    monitor.check_resolutions()
+    assert set(monitor._due_at) == {"101", "202"}
+
+    pm.close_position(positions[0].position_id, exit_price=Decimal("0.5"))
+    monitor.check_resolutions()
+    assert set(monitor._due_at) == {"202"}
+
+    pm.mark_redeemable(positions[1].position_id)
+    monitor.check_resolutions()
+    assert monitor._due_at == {}